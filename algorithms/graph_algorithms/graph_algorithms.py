@@ -6,7 +6,7 @@ Bu modül, temel graf algoritmalarının implementasyonlarını içerir.
 Zaman Karmaşıklıkları:
 - BFS: O(V + E)
 - DFS: O(V + E)
-- Dijkstra: O((V + E) log V) with binary heap
+- Dijkstra: O((V + E) log V) with binary heap (d-ary: O(E log_d V + V d log_d V))
 - Bellman-Ford: O(VE)
 - Floyd-Warshall: O(V³)
 - Topological Sort: O(V + E)
@@ -17,9 +17,16 @@ Zaman Karmaşıklıkları:
 
 from typing import List, Dict, Set, Tuple, Optional, Union
 from collections import defaultdict, deque
-import heapq
+import os
 import sys
 
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.graph_algorithms.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from data_structures.heaps.heap import heap_push, heap_pop
+
 
 class Graph:
     """Graf veri yapısı"""
@@ -55,14 +62,19 @@ class Graph:
         return self.adjacency_list[vertex]
 
 
-def breadth_first_search(graph: Graph, start: int) -> Dict[int, int]:
+def breadth_first_search(graph: Graph, start: int, visited=None) -> Dict[int, int]:
     """
     Breadth First Search (Genişlik Öncelikli Arama)
     
     Zaman Karmaşıklığı: O(V + E)
     Uzay Karmaşıklığı: O(V)
+    
+    visited: add ve `in` destekleyen ziyaret yapısı (varsayılan: set).
+    Düğümleri 0..V-1 olan büyük graflarda BitArray(V) düğüm başına tek bit
+    harcar.
     """
-    visited = set()
+    if visited is None:
+        visited = set()
     distances = {vertex: -1 for vertex in graph.get_vertices()}
     queue = deque([start])
     
@@ -81,14 +93,17 @@ def breadth_first_search(graph: Graph, start: int) -> Dict[int, int]:
     return distances
 
 
-def depth_first_search(graph: Graph, start: int) -> List[int]:
+def depth_first_search(graph: Graph, start: int, visited=None) -> List[int]:
     """
     Depth First Search (Derinlik Öncelikli Arama)
     
     Zaman Karmaşıklığı: O(V + E)
     Uzay Karmaşıklığı: O(V)
+    
+    visited: add ve `in` destekleyen ziyaret yapısı (varsayılan: set, ör. BitArray)
     """
-    visited = set()
+    if visited is None:
+        visited = set()
     result = []
     
     def dfs_recursive(vertex: int):
@@ -103,14 +118,17 @@ def depth_first_search(graph: Graph, start: int) -> List[int]:
     return result
 
 
-def depth_first_search_iterative(graph: Graph, start: int) -> List[int]:
+def depth_first_search_iterative(graph: Graph, start: int, visited=None) -> List[int]:
     """
     Iterative Depth First Search
     
     Zaman Karmaşıklığı: O(V + E)
     Uzay Karmaşıklığı: O(V)
+    
+    visited: add ve `in` destekleyen ziyaret yapısı (varsayılan: set, ör. BitArray)
     """
-    visited = set()
+    if visited is None:
+        visited = set()
     result = []
     stack = [start]
     
@@ -129,10 +147,13 @@ def depth_first_search_iterative(graph: Graph, start: int) -> List[int]:
     return result
 
 
-def dijkstra_shortest_path(graph: Graph, start: int) -> Dict[int, float]:
+def dijkstra_shortest_path(graph: Graph, start: int, arity: int = 2) -> Dict[int, float]:
     """
     Dijkstra En Kısa Yol Algoritması
     
+    Öncelik kuyruğu data_structures.heaps.heap çekirdekleridir; arity
+    heap'in her düğümündeki çocuk sayısıdır (2: heapq'nun C implementasyonu).
+    
     Zaman Karmaşıklığı: O((V + E) log V) with binary heap
     Uzay Karmaşıklığı: O(V)
     
@@ -146,7 +167,7 @@ def dijkstra_shortest_path(graph: Graph, start: int) -> Dict[int, float]:
     visited = set()
     
     while pq:
-        current_distance, current_vertex = heapq.heappop(pq)
+        current_distance, current_vertex = heap_pop(pq, arity)
         
         if current_vertex in visited:
             continue
@@ -158,7 +179,7 @@ def dijkstra_shortest_path(graph: Graph, start: int) -> Dict[int, float]:
             
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
-                heapq.heappush(pq, (distance, neighbor))
+                heap_push(pq, (distance, neighbor), arity)
     
     return distances
 
@@ -332,10 +353,12 @@ def kruskal_mst(graph: Graph) -> List[Tuple[int, int, float]]:
     return mst
 
 
-def prim_mst(graph: Graph, start: int) -> List[Tuple[int, int, float]]:
+def prim_mst(graph: Graph, start: int, arity: int = 2) -> List[Tuple[int, int, float]]:
     """
     Prim Minimum Spanning Tree Algoritması
     
+    Öncelik kuyruğu dijkstra_shortest_path'teki gibi d-ary heap'tir.
+    
     Zaman Karmaşıklığı: O(E log V)
     Uzay Karmaşıklığı: O(V)
     """
@@ -344,7 +367,7 @@ def prim_mst(graph: Graph, start: int) -> List[Tuple[int, int, float]]:
     pq = [(0, start, start)]  # (weight, current, parent)
     
     while pq and len(visited) < len(graph.get_vertices()):
-        weight, current, parent = heapq.heappop(pq)
+        weight, current, parent = heap_pop(pq, arity)
         
         if current in visited:
             continue
@@ -355,7 +378,7 @@ def prim_mst(graph: Graph, start: int) -> List[Tuple[int, int, float]]:
         
         for neighbor, edge_weight in graph.get_neighbors(current):
             if neighbor not in visited:
-                heapq.heappush(pq, (edge_weight, neighbor, current))
+                heap_push(pq, (edge_weight, neighbor, current), arity)
     
     return mst
 
@@ -391,6 +414,12 @@ def test_graph_algorithms():
     dfs_result = depth_first_search(graph, 0)
     print(f"DFS sırası (başlangıç: 0): {dfs_result}")
     
+    # Bit array ile ziyaret takibi (düğüm başına 1 bit)
+    from data_structures.arrays.bit_array import BitArray
+    visited = BitArray(max(graph.get_vertices()) + 1)
+    dfs_result = depth_first_search_iterative(graph, 0, visited=visited)
+    print(f"DFS sırası (BitArray visited): {dfs_result}, ziyaret edilen: {visited.count()}")
+    
     # Dijkstra testi
     print("\n=== Dijkstra Testi ===")
     dijkstra_distances = dijkstra_shortest_path(graph, 0)
@@ -0,0 +1,356 @@
+"""
+Sıralama Benchmark'ı
+
+Bu modül, sıralama algoritmalarını farklı boyut ve girdi dağılımlarında
+ölçen, sonuçları JSON'a yazan ve kayıtlı bir temel (baseline) ile
+karşılaştırarak yavaşlamaları yakalayan bir ölçüm aracı içerir.
+
+Ölçüm:
+- Her (algoritma, dağılım, n) için önce warmup çalıştırmaları yapılır
+- Sonra repeat kez perf_counter_ns ile ölçülür; çöp toplayıcı ölçüm
+  sırasında kapatılır (timeit gibi)
+- Medyan, p95 ve en iyi süre raporlanır
+- Bellek tepe değeri tracemalloc ile ayrı bir çalıştırmada ölçülür
+  (tracemalloc süreleri bozmasın diye)
+- --count-ops ile karşılaştırma, hareket, derinlik ve tahsis sayıları
+  (instrumentation.count_operations) yine ayrı bir çalıştırmada eklenir
+
+Kullanım:
+    python benchmark.py --max-power 5 --output results.json
+    python benchmark.py --sorts quick_sort merge_sort --baseline results.json
+    python benchmark.py --count-ops --baseline results.json --metric comparisons
+
+Çıkış kodu: 0 yavaşlama yok, 1 yavaşlama var, 2 hatalı kullanım (ör.
+--count-ops olmadan sayı metriği) veya karşılaştırılabilen ölçüm yok.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.sorting.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from algorithms.sorting.sorting_algorithms import (
+    bubble_sort, selection_sort, insertion_sort, merge_sort, tim_sort, quick_sort,
+    heap_sort, counting_sort, radix_sort
+)
+from algorithms.sorting.smart_sort import smart_sort
+from algorithms.sorting.instrumentation import OperationCounts, count_operations
+
+
+SORTS = {
+    'bubble_sort': bubble_sort,
+    'selection_sort': selection_sort,
+    'insertion_sort': insertion_sort,
+    'merge_sort': merge_sort,
+    'tim_sort': tim_sort,
+    'quick_sort': quick_sort,
+    'heap_sort': heap_sort,
+    'counting_sort': counting_sort,
+    'radix_sort': radix_sort,
+    'smart_sort': smart_sort,
+}
+
+# O(n²) algoritmalar bu boyutun üzerinde ölçülmez
+QUADRATIC_SORTS = {'bubble_sort', 'selection_sort', 'insertion_sort'}
+QUADRATIC_MAX_SIZE = 10 ** 4
+
+# Karşılaştırmada bu orandan fazla yavaşlama regresyon sayılır
+DEFAULT_THRESHOLD = 0.10
+
+# İşlem sayımı (opcode izleme) bu boyutun üzerinde yapılmaz
+COUNT_OPS_MAX_SIZE = 10 ** 3
+# count_operations'ın sonuç satırlarına eklediği alanlar
+COUNT_METRICS = list(OperationCounts().to_dict())
+
+
+def _random(n, rng):
+    return [rng.randint(0, n) for _ in range(n)]
+
+
+def _sorted(n, rng):
+    return list(range(n))
+
+
+def _reversed(n, rng):
+    return list(range(n, 0, -1))
+
+
+def _sawtooth(n, rng):
+    # 16 artan run (birleştirilmiş sıralı parçalar, loglar)
+    period = max(n // 16, 1)
+    return [i % period for i in range(n)]
+
+
+def _few_unique(n, rng):
+    return [rng.randint(0, 9) for _ in range(n)]
+
+
+def _organ_pipe(n, rng):
+    half = n // 2
+    return list(range(half)) + list(range(n - half, 0, -1))
+
+
+def _wide_range(n, rng):
+    return [rng.randint(-2 ** 62, 2 ** 62) for _ in range(n)]
+
+
+DISTRIBUTIONS = {
+    'random': _random,
+    'sorted': _sorted,
+    'reversed': _reversed,
+    'sawtooth': _sawtooth,
+    'few_unique': _few_unique,
+    'organ_pipe': _organ_pipe,
+    'wide_range': _wide_range,
+}
+
+
+def percentile(values, percent):
+    """Nearest-rank yüzdelik (values boş olmamalı)"""
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def measure(sort_func, data, repeat=5, warmup=1, memory=True):
+    """
+    sort_func(data kopyası) süresini ve bellek tepe değerini ölçer
+    
+    Returns:
+        dict: median_ns, p95_ns, min_ns, runs ve (memory=True ise) peak_bytes
+    """
+    for _ in range(warmup):
+        sort_func(list(data))
+    
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            arr = list(data)
+            start = time.perf_counter_ns()
+            sort_func(arr)
+            times.append(time.perf_counter_ns() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    
+    result = {
+        'median_ns': int(statistics.median(times)),
+        'p95_ns': percentile(times, 95),
+        'min_ns': min(times),
+        'runs': repeat,
+    }
+    
+    if memory:
+        arr = list(data)
+        tracemalloc.start()
+        try:
+            sort_func(arr)
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmarks(sorts=None, sizes=(10 ** 2, 10 ** 3, 10 ** 4),
+                   distributions=None, repeat=5, warmup=1, memory=True,
+                   seed=0, progress=None, count_ops=False,
+                   count_max_size=COUNT_OPS_MAX_SIZE):
+    """
+    Verilen algoritma x dağılım x boyut kombinasyonlarını ölçer
+    
+    Args:
+        sorts: Algoritma adları (None: SORTS'taki hepsi)
+        sizes: Girdi boyutları
+        distributions: Dağılım adları (None: DISTRIBUTIONS'taki hepsi)
+        repeat (int): Ölçülen çalıştırma sayısı
+        warmup (int): Ölçülmeyen ısınma çalıştırması sayısı
+        memory (bool): tracemalloc ile bellek tepe değerini ölç
+        seed (int): Girdi üretimi için tohum (aynı seed aynı girdiler)
+        progress: Her sonuçtan sonra çağrılacak fonksiyon (ör. print)
+        count_ops (bool): n <= count_max_size ölçümlere işlem sayılarını
+            (COUNT_METRICS) ekle
+        count_max_size (int): İşlem sayımı yapılan en büyük boyut
+    
+    Returns:
+        list: Her ölçüm için bir sözlük (sort, distribution, n, median_ns, ...)
+    """
+    sorts = list(SORTS) if sorts is None else list(sorts)
+    distributions = list(DISTRIBUTIONS) if distributions is None else list(distributions)
+    for name in sorts:
+        if name not in SORTS:
+            raise ValueError(f"Unknown sort: {name}")
+    for name in distributions:
+        if name not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {name}")
+    
+    results = []
+    for n in sizes:
+        for distribution in distributions:
+            data = DISTRIBUTIONS[distribution](n, random.Random(f"{seed}-{distribution}-{n}"))
+            for name in sorts:
+                if name in QUADRATIC_SORTS and n > QUADRATIC_MAX_SIZE:
+                    continue
+                row = {'sort': name, 'distribution': distribution, 'n': n}
+                row.update(measure(SORTS[name], data, repeat, warmup, memory))
+                if count_ops and n <= count_max_size:
+                    row.update(count_operations(SORTS[name], list(data))[1].to_dict())
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+    return results
+
+
+def make_report(results, repeat, warmup):
+    """Sonuçları ortam bilgisiyle birlikte JSON'a yazılacak sözlüğe çevirir"""
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat,
+            'warmup': warmup,
+        },
+        'results': results,
+    }
+
+
+def save_report(report, path):
+    with open(path, 'w', encoding='utf-8') as output:
+        json.dump(report, output, indent=2)
+
+
+def load_report(path):
+    with open(path, encoding='utf-8') as source:
+        return json.load(source)
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD, metric='median_ns'):
+    """
+    İki raporu (veya sonuç listesini) (sort, distribution, n) üzerinden eşler
+    
+    Returns:
+        list: Her eşleşen ölçüm için baseline, current, ratio (current /
+        baseline) ve ratio > 1 + threshold ise regression=True
+    """
+    if isinstance(baseline, dict):
+        baseline = baseline['results']
+    if isinstance(current, dict):
+        current = current['results']
+    
+    previous = {(row['sort'], row['distribution'], row['n']): row for row in baseline}
+    comparison = []
+    for row in current:
+        old = previous.get((row['sort'], row['distribution'], row['n']))
+        if old is None or not old.get(metric) or row.get(metric) is None:
+            continue
+        ratio = row[metric] / old[metric]
+        comparison.append({
+            'sort': row['sort'],
+            'distribution': row['distribution'],
+            'n': row['n'],
+            'baseline': old[metric],
+            'current': row[metric],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return comparison
+
+
+def format_row(row):
+    """Bir ölçüm satırını tablo satırına çevirir"""
+    memory = f"{row['peak_bytes'] / 1024:>10.1f}" if 'peak_bytes' in row else f"{'-':>10}"
+    line = (f"{row['sort']:<15} {row['distribution']:<11} {row['n']:>9} "
+            f"{row['median_ns'] / 1e6:>11.3f} {row['p95_ns'] / 1e6:>11.3f} {memory}")
+    if 'moves' in row:
+        comparisons = '-' if row['comparisons'] is None else row['comparisons']
+        line += (f" {comparisons:>13} {row['moves']:>9} {row['max_depth']:>8} "
+                 f"{row['allocations']:>6}")
+    return line
+
+
+TABLE_HEADER = (f"{'algoritma':<15} {'dağılım':<11} {'n':>9} "
+                f"{'medyan (ms)':>11} {'p95 (ms)':>11} {'tepe (KB)':>10}")
+COUNTS_HEADER = f" {'karşılaştırma':>13} {'hareket':>9} {'derinlik':>8} {'tahsis':>6}"
+
+
+def main(argv=None):
+    """Komut satırı: ölç, JSON'a yaz, baseline ile karşılaştır"""
+    parser = argparse.ArgumentParser(description="Sıralama algoritmaları benchmark'ı")
+    parser.add_argument('--sorts', nargs='+', choices=list(SORTS), default=None)
+    parser.add_argument('--distributions', nargs='+', choices=list(DISTRIBUTIONS),
+                        default=None)
+    parser.add_argument('--min-power', type=int, default=2, help="En küçük boyut: 10^min")
+    parser.add_argument('--max-power', type=int, default=4, help="En büyük boyut: 10^max")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc ölçümünü atla")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--count-ops', action='store_true',
+                        help="Karşılaştırma / hareket / tahsis sayılarını ekle")
+    parser.add_argument('--count-max-size', type=int, default=COUNT_OPS_MAX_SIZE,
+                        help="İşlem sayımı yapılan en büyük boyut")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--baseline', help="Karşılaştırılacak önceki JSON sonuçları")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Regresyon eşiği (0.10 = %%10 yavaşlama)")
+    parser.add_argument('--metric', choices=['median_ns', 'p95_ns', 'min_ns'] + COUNT_METRICS,
+                        default='median_ns', help="Karşılaştırılacak süre veya işlem sayısı")
+    args = parser.parse_args(argv)
+    if args.metric in COUNT_METRICS and not args.count_ops:
+        parser.error(f"--metric {args.metric} bir işlem sayısıdır; --count-ops gerekir")
+    
+    sizes = [10 ** power for power in range(args.min_power, args.max_power + 1)]
+    print(TABLE_HEADER + (COUNTS_HEADER if args.count_ops else ""))
+    results = run_benchmarks(args.sorts, sizes, args.distributions, args.repeat,
+                             args.warmup, not args.no_memory, args.seed,
+                             progress=lambda row: print(format_row(row), flush=True),
+                             count_ops=args.count_ops, count_max_size=args.count_max_size)
+    report = make_report(results, args.repeat, args.warmup)
+    
+    if args.output:
+        save_report(report, args.output)
+        print(f"\nSonuçlar yazıldı: {args.output}")
+    
+    if args.baseline:
+        comparison = compare_results(load_report(args.baseline), report, args.threshold,
+                                     args.metric)
+        if not comparison:
+            print(f"\nBaseline ile karşılaştırılabilen ölçüm yok ({args.metric} iki "
+                  f"raporda da aynı sort / distribution / n için bulunmalı)",
+                  file=sys.stderr)
+            return 2
+        regressions = [row for row in comparison if row['regression']]
+        print(f"\n=== Baseline karşılaştırması ({len(comparison)} ölçüm, "
+              f"eşik %{args.threshold * 100:.0f}) ===")
+        for row in regressions:
+            if args.metric.endswith('_ns'):
+                change = f"{row['baseline'] / 1e6:.3f} ms -> {row['current'] / 1e6:.3f} ms"
+            else:
+                change = f"{row['baseline']} -> {row['current']} {args.metric}"
+            print(f"YAVAŞLAMA {row['sort']:<15} {row['distribution']:<11} {row['n']:>9} "
+                  f"{change} (x{row['ratio']:.2f})")
+        if regressions:
+            return 1
+        print("Yavaşlama yok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Harici (External) Merge Sort
+
+Bu modül, belleğe sığmayan satır tabanlı kayıt dosyalarını sıralar.
+
+Aşamalar:
+1. Girdi dosyası memory_limit'e sığan parçalar halinde okunur; her parça
+   bellekte sıralanıp geçici bir dosyaya (run) yazılır
+2. Run'lar buffer'lı okuyucularla açılır ve heap tabanlı k-yollu
+   birleştirme ile tek bir sıralı çıktıya dönüştürülür
+3. Run sayısı fan_in'den fazlaysa önce fan_in'lik gruplar birleştirilir
+   (çok geçişli birleştirme); her geçiş run sayısını fan_in kat azaltır
+
+Zaman Karmaşıklıkları:
+- Run oluşturma: O(n log m) (m: bir parçadaki kayıt sayısı)
+- Birleştirme: geçiş başına O(n log k), geçiş sayısı ⌈log_k(n / m)⌉
+- Disk: her geçişte veri bir kez okunup bir kez yazılır
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.sorting.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from algorithms.sorting.sorting_algorithms import tim_sort
+
+
+# Kayıt başına tahmini ek bellek: liste slotu, süsleme üçlüsü ve sıra no
+RECORD_OVERHEAD = 120
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+DEFAULT_FAN_IN = 64
+
+
+def external_sort(input_path, output_path, key=None, reverse=False,
+                  memory_limit=DEFAULT_MEMORY_LIMIT, fan_in=DEFAULT_FAN_IN,
+                  sort_func=tim_sort, temp_dir=None, encoding='utf-8'):
+    """
+    Satır tabanlı bir dosyayı sınırlı bellekle sıralar
+    
+    Args:
+        input_path (str): Girdi dosyası (her satır bir kayıt; kayıtlar
+            sadece '\\n' ile biter, '\\r' kaydın parçası olarak korunur)
+        output_path (str): Çıktı dosyası
+        key: Her satırdan sıralama anahtarı üreten fonksiyon (satır sonu dahil)
+        reverse (bool): Büyükten küçüğe sırala
+        memory_limit (int): Bir parça için kullanılacak yaklaşık bellek (byte)
+        fan_in (int): Bir birleştirme geçişinde açılacak en fazla run sayısı
+        sort_func: Parçaları sıralayan bellek içi sıralama (key/reverse destekli)
+        temp_dir (str): Geçici run dosyalarının dizini (None: sistem varsayılanı)
+        encoding (str): Dosya kodlaması
+    
+    Returns:
+        int: Sıralanan kayıt sayısı
+    
+    Sıralama kararlıdır: eşit anahtarlı kayıtlar girdideki sıralarını korur.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        runs, count = _create_runs(input_path, work_dir, key, reverse,
+                                   memory_limit, sort_func, encoding)
+        
+        # Her açık run için buffer boyutu: bellek bütçesi fan_in'e bölünür
+        buffer_size = max(memory_limit // (fan_in + 1), 1 << 16)
+        
+        # Çok geçişli birleştirme: run'lar fan_in'lik gruplar halinde birleşir
+        generation = 0
+        while len(runs) > fan_in:
+            merged_runs = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                if len(group) == 1:
+                    merged_runs.append(group[0])
+                    continue
+                path = os.path.join(work_dir, f"merge-{generation}-{start}.txt")
+                _merge_files(group, path, key, reverse, buffer_size, encoding)
+                for run in group:
+                    os.remove(run)
+                merged_runs.append(path)
+            runs = merged_runs
+            generation += 1
+        
+        _merge_files(runs, output_path, key, reverse, buffer_size, encoding)
+    
+    return count
+
+
+def _create_runs(input_path, work_dir, key, reverse, memory_limit, sort_func, encoding):
+    """Girdiyi bellek limitine sığan sıralı run dosyalarına böler"""
+    runs = []
+    count = 0
+    chunk = []
+    chunk_bytes = 0
+    
+    with open(input_path, 'r', encoding=encoding, newline='\n') as source:
+        for line in source:
+            if not line.endswith('\n'):
+                line += '\n'
+            chunk.append(line)
+            chunk_bytes += sys.getsizeof(line) + RECORD_OVERHEAD
+            if chunk_bytes >= memory_limit:
+                runs.append(_write_run(chunk, work_dir, len(runs), key, reverse,
+                                       sort_func, encoding))
+                count += len(chunk)
+                chunk = []
+                chunk_bytes = 0
+    
+    if chunk or not runs:
+        runs.append(_write_run(chunk, work_dir, len(runs), key, reverse,
+                               sort_func, encoding))
+        count += len(chunk)
+    
+    return runs, count
+
+
+def _write_run(chunk, work_dir, number, key, reverse, sort_func, encoding):
+    """Bir parçayı sıralayıp run dosyasına yazar"""
+    path = os.path.join(work_dir, f"run-{number}.txt")
+    with open(path, 'w', encoding=encoding, newline='\n') as run:
+        run.writelines(sort_func(chunk, key=key, reverse=reverse))
+    return path
+
+
+def _merge_files(paths, output_path, key, reverse, buffer_size, encoding):
+    """
+    Sıralı run dosyalarını heap ile k-yollu birleştirir
+    
+    heapq.merge eşit anahtarlarda önceki run'ı öne alır; run'lar girdi
+    sırasıyla oluşturulduğu için birleştirme kararlıdır.
+    """
+    files = [open(path, 'r', encoding=encoding, newline='\n', buffering=buffer_size)
+             for path in paths]
+    try:
+        with open(output_path, 'w', encoding=encoding, newline='\n',
+                  buffering=buffer_size) as output:
+            output.writelines(heapq.merge(*files, key=key, reverse=reverse))
+    finally:
+        for run in files:
+            run.close()
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import random
+    import time
+    
+    print("=== Harici Merge Sort Örnekleri ===")
+    
+    work_dir = tempfile.mkdtemp()
+    input_path = os.path.join(work_dir, "records.txt")
+    output_path = os.path.join(work_dir, "sorted.txt")
+    
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with open(input_path, 'w', encoding='utf-8') as records:
+        for record_id in range(n):
+            records.write(f"{random.randint(0, 10 ** 9)},kayıt-{record_id}\n")
+    print(f"{n} kayıt yazıldı: {os.path.getsize(input_path)} byte")
+    
+    def numeric_key(line):
+        return int(line.split(',', 1)[0])
+    
+    start_time = time.time()
+    count = external_sort(input_path, output_path, key=numeric_key,
+                          memory_limit=2 * 1024 * 1024, fan_in=8)
+    end_time = time.time()
+    print(f"{count} kayıt 2 MB bellek ve fan_in=8 ile "
+          f"{end_time - start_time:.2f} saniyede sıralandı")
+    
+    with open(output_path, encoding='utf-8') as result:
+        keys = [numeric_key(line) for line in result]
+    print(f"Doğru mu: {keys == sorted(keys)}")
@@ -0,0 +1,327 @@
+"""
+Sıralama İşlem Sayacı
+
+Bu modül, bir sıralama çağrısının neden yavaş olduğunu görmek için süre
+yerine yapılan işleri sayan, isteğe bağlı bir ölçüm katmanı içerir.
+
+Sayılanlar (OperationCounts):
+- comparisons: Eleman / anahtar karşılaştırmaları (<, <=, >, >=). Elemanlar
+  karşılaştırmaları sayan bir sarmalayıcıya (_Counted) konur; key / reverse
+  verildiğinde sort_decorated'daki (key, sıra no, eleman) üçlüsü sarılır,
+  böylece algoritmanın her karşılaştırması tam olarak bir kez sayılır.
+  counting / radix / string sort ve smart_sort için None'dır (ölçülmez)
+- moves: Liste / array slotlarına yazmalar (a[i] = x, takaslar iki yazma)
+- calls / max_depth: Sıralama fonksiyonu çağrıları ve en derin iç içe
+  çağrı (quick_sort'un açık yığını çağrı derinliğine yansımaz)
+- allocations / allocated_bytes: Çağrı sırasında oluşturulup bir yerel
+  değişkene atanan veya döndürülen list / bytearray / array.array
+  tamponları ve sys.getsizeof boyutları
+- bytes_copied: Tampon slotlarına yazılan byte'lar: her hareket bir
+  referans (struct.calcsize('P')), yeni tamponlar da ilk görüldükleri
+  andaki uzunlukları kadar
+
+Hareket, çağrı ve tampon sayıları sys.settrace ile opcode seviyesinde
+toplanır; sadece bu paketteki ve data_structures/heaps'teki kod izlenir.
+Bytecode ham co_code baytlarından değil, kod nesnesi başına bir kez
+dis.get_instructions ile çözülür: EXTENDED_ARG önekleri ve 3.13'ün
+birleşik komutları (STORE_FAST_STORE_FAST gibi) sürümden bağımsız sayılır.
+Dilim atamaları tek hareket sayılır, list.append / extend gibi C
+metodlarının yazmaları sayılmaz; bu sayılar yaklaşıktır.
+
+Sıralama fonksiyonlarına hiçbir kod eklenmez: count_operations dışında
+çağrılan sıralamalar ek maliyet ödemez. Sayaç açıkken çalışma onlarca kat
+yavaşlar; süre ölçümleri ayrı yapılmalıdır (bkz. benchmark.py --count-ops).
+"""
+
+import dis
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+
+# Karşılaştırması sayılmayan (anahtar tabanlı veya algoritma seçen) sıralamalar
+NON_COMPARISON_SORTS = {'counting_sort', 'counting_sort_by_key', 'radix_sort',
+                        'string_sort', 'smart_sort'}
+
+# Kodu izlenen klasörler
+TRACED_PATHS = (
+    os.path.realpath(os.path.dirname(__file__)),
+    os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..',
+                                  'data_structures', 'heaps')),
+)
+
+REFERENCE_SIZE = struct.calcsize('P')
+BUFFER_TYPES = (list, bytearray, array)
+
+# Slot yazmaları (hareket) ve yerel değişkene atamalar (tahsis kontrolü)
+_MOVE_OPS = frozenset({'STORE_SUBSCR', 'STORE_SLICE'})
+_STORE_LOCAL_OPS = frozenset({'STORE_FAST', 'STORE_FAST_MAYBE_NULL',
+                              'STORE_FAST_STORE_FAST', 'STORE_FAST_LOAD_FAST'})
+
+
+class OperationCounts:
+    """Bir sıralama çağrısının işlem sayıları"""
+    
+    def __init__(self, comparisons=0, moves=0, calls=0, max_depth=0,
+                 allocations=0, allocated_bytes=0, bytes_copied=0):
+        self.comparisons = comparisons
+        self.moves = moves
+        self.calls = calls
+        self.max_depth = max_depth
+        self.allocations = allocations
+        self.allocated_bytes = allocated_bytes
+        self.bytes_copied = bytes_copied
+    
+    def to_dict(self):
+        """JSON'a / benchmark satırlarına yazılabilir sözlük"""
+        return dict(vars(self))
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"OperationCounts({fields})"
+
+
+def count_operations(sort_func: Callable, arr: List, key: Optional[Callable] = None,
+                     reverse: bool = False, count_comparisons: Optional[bool] = None,
+                     **kwargs) -> Tuple[List, OperationCounts]:
+    """
+    sort_func(arr, key=key, reverse=reverse, **kwargs) çağrısını sayarak çalıştırır
+    
+    Args:
+        sort_func: sorting_algorithms (veya bu paketteki) bir sıralama fonksiyonu
+        arr: Sıralanacak liste (değiştirilmez)
+        key: Sıralama anahtarı
+        reverse (bool): Büyükten küçüğe sırala
+        count_comparisons (bool): Karşılaştırmaları say (None: sıralama
+            NON_COMPARISON_SORTS içinde değilse)
+        **kwargs: sort_func'a aynen geçirilir (ör. arity, casefold)
+    
+    Returns:
+        tuple: (sıralı liste, OperationCounts)
+    """
+    if count_comparisons is None:
+        count_comparisons = _sort_name(sort_func) not in NON_COMPARISON_SORTS
+    
+    counts = OperationCounts(comparisons=0 if count_comparisons else None)
+    if not count_comparisons:
+        tracer = _Tracer(counts, known=(arr,))
+        with tracer:
+            result = sort_func(arr, key=key, reverse=reverse, **kwargs)
+        return result, counts
+    
+    # sort_decorated ile aynı süsleme; sarmalayıcı tüm üçlüyü karşılaştırır
+    if key is None and not reverse:
+        wrapped = [_Counted(item, counts) for item in arr]
+    else:
+        sign = -1 if reverse else 1
+        wrapped = [_Counted((item if key is None else key(item), sign * i, item), counts)
+                   for i, item in enumerate(arr)]
+    
+    tracer = _Tracer(counts, known=(arr, wrapped))
+    with tracer:
+        result = sort_func(wrapped, **kwargs)
+    
+    if key is None and not reverse:
+        return [entry.value for entry in result], counts
+    result = [entry.value[2] for entry in result]
+    if reverse:
+        result.reverse()
+    return result, counts
+
+
+def _decode_actions(code) -> dict:
+    """
+    Kodun izlenen komutları: offset -> (komut offset'i, 'move' / 'store', isimler)
+    
+    EXTENDED_ARG önekleri de önekledikleri komuta eşlenir (3.11'de opcode
+    olayı önekin offset'inde gelir).
+    """
+    actions = {}
+    prefixes = []
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == 'EXTENDED_ARG':
+            prefixes.append(instruction.offset)
+            continue
+        action = None
+        if instruction.opname in _MOVE_OPS:
+            action = (instruction.offset, 'move', ())
+        elif instruction.opname in _STORE_LOCAL_OPS:
+            names = instruction.argval
+            if not isinstance(names, tuple):
+                names = (names,)
+            elif instruction.opname == 'STORE_FAST_LOAD_FAST':
+                names = names[:1]
+            action = (instruction.offset, 'store', names)
+        if action is not None:
+            for offset in prefixes + [instruction.offset]:
+                actions[offset] = action
+        prefixes = []
+    return actions
+
+
+def _sort_name(sort_func: Callable) -> str:
+    """Fonksiyon (veya functools.partial) adı"""
+    return getattr(sort_func, '__name__', None) or getattr(sort_func.func, '__name__', '')
+
+
+class _Counted:
+    """Sıralama karşılaştırmalarını sayan eleman sarmalayıcısı"""
+    
+    __slots__ = ('value', 'counts')
+    
+    def __init__(self, value, counts):
+        self.value = value
+        self.counts = counts
+    
+    def __lt__(self, other):
+        self.counts.comparisons += 1
+        return self.value < other.value
+    
+    def __le__(self, other):
+        self.counts.comparisons += 1
+        return self.value <= other.value
+    
+    def __gt__(self, other):
+        self.counts.comparisons += 1
+        return self.value > other.value
+    
+    def __ge__(self, other):
+        self.counts.comparisons += 1
+        return self.value >= other.value
+    
+    def __eq__(self, other):
+        return isinstance(other, _Counted) and self.value == other.value
+    
+    def __hash__(self):
+        return hash(self.value)
+    
+    def __repr__(self):
+        return f"_Counted({self.value!r})"
+
+
+class _Tracer:
+    """
+    Sıralama kodunu opcode seviyesinde izleyen sys.settrace fonksiyonu
+    
+    STORE_SUBSCR / STORE_SLICE hareket olarak sayılır. STORE_FAST'ten
+    sonraki komutta atanan değer, 'return' olayında da dönen değer
+    incelenir; daha önce görülmemiş bir tampon ise tahsis olarak sayılır.
+    Görülen tamponlar izleme boyunca tutulur (id'leri yeniden
+    kullanılmasın diye). Aynı komut için art arda gelen olaylar (önek +
+    komut) bir kez sayılır.
+    """
+    
+    def __init__(self, counts: OperationCounts, known=()):
+        self.counts = counts
+        self.depth = 0
+        self.pending = None
+        self.last = None
+        self.seen = {id(obj): obj for obj in known}
+        self.codes = {}
+    
+    def __enter__(self):
+        self.previous = sys.gettrace()
+        sys.settrace(self.global_trace)
+        return self
+    
+    def __exit__(self, *exc_info):
+        sys.settrace(self.previous)
+        self.seen.clear()
+    
+    def _code_info(self, code):
+        """(izleniyor mu, çağrı sayılıyor mu, komutlar); kod nesnesi başına bir kez"""
+        info = self.codes.get(code)
+        if info is None:
+            path = os.path.realpath(code.co_filename)
+            traced = (path != os.path.realpath(__file__) and
+                      any(path.startswith(folder + os.sep) for folder in TRACED_PATHS))
+            # Comprehension / lambda çerçeveleri derinliğe katılmaz
+            actions = _decode_actions(code) if traced else {}
+            info = (traced, not code.co_name.startswith('<'), actions)
+            self.codes[code] = info
+        return info
+    
+    def global_trace(self, frame, event, arg):
+        traced, counted, _ = self._code_info(frame.f_code)
+        if not traced:
+            return None
+        if counted:
+            counts = self.counts
+            counts.calls += 1
+            self.depth += 1
+            if self.depth > counts.max_depth:
+                counts.max_depth = self.depth
+        frame.f_trace_lines = False
+        frame.f_trace_opcodes = True
+        return self.local_trace
+    
+    def local_trace(self, frame, event, arg):
+        action = None
+        if event == 'opcode':
+            action = self.codes[frame.f_code][2].get(frame.f_lasti)
+            marker = None if action is None else (frame, action[0])
+            if marker is not None and marker == self.last:
+                return self.local_trace  # Aynı komutun tekrar olayı
+            self.last = marker
+        
+        # Atama tamamlandı: sonraki komutta (veya dönüşte) değer okunur
+        pending = self.pending
+        if pending is not None and pending[0] is frame:
+            self.pending = None
+            local_values = frame.f_locals
+            for name in pending[1]:
+                self._observe(local_values.get(name))
+        
+        if action is not None:
+            if action[1] == 'move':
+                self.counts.moves += 1
+                self.counts.bytes_copied += REFERENCE_SIZE
+            else:
+                self.pending = (frame, action[2])
+        elif event == 'return':
+            if self.codes[frame.f_code][1]:
+                self.depth -= 1
+            self._observe(arg)
+        return self.local_trace
+    
+    def _observe(self, value):
+        """value yeni bir tamponsa tahsis olarak sayar"""
+        if isinstance(value, BUFFER_TYPES) and id(value) not in self.seen:
+            self.seen[id(value)] = value
+            counts = self.counts
+            counts.allocations += 1
+            counts.allocated_bytes += sys.getsizeof(value)
+            itemsize = 1 if isinstance(value, bytearray) else getattr(value, 'itemsize',
+                                                                       REFERENCE_SIZE)
+            counts.bytes_copied += len(value) * itemsize
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import random
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from algorithms.sorting.sorting_algorithms import (
+        insertion_sort, merge_sort, tim_sort, quick_sort, heap_sort, radix_sort
+    )
+    
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    inputs = {
+        "rastgele": [random.randint(0, n) for _ in range(n)],
+        "sıralı": list(range(n)),
+        "ters sıralı": list(range(n, 0, -1)),
+    }
+    print(f"=== İşlem Sayıları (n = {n}) ===")
+    print(f"{'algoritma':<15} {'girdi':<12} {'karşılaştırma':>13} {'hareket':>9} "
+          f"{'derinlik':>8} {'tahsis':>6} {'kopya (KB)':>10}")
+    for name, data in inputs.items():
+        for sort_func in (insertion_sort, merge_sort, tim_sort, quick_sort, heap_sort,
+                          radix_sort):
+            if sort_func is insertion_sort and name == "rastgele" and n > 5000:
+                continue
+            _, counts = count_operations(sort_func, data)
+            comparisons = '-' if counts.comparisons is None else counts.comparisons
+            print(f"{sort_func.__name__:<15} {name:<12} {comparisons:>13} "
+                  f"{counts.moves:>9} {counts.max_depth:>8} {counts.allocations:>6} "
+                  f"{counts.bytes_copied / 1024:>10.1f}")
@@ -0,0 +1,301 @@
+"""
+Paralel Sıralama (Sample Sort)
+
+Bu modül, sıralamayı birden fazla işlemci çekirdeğine dağıtan iki aşamalı
+bir sample sort içerir.
+
+Aşamalar:
+1. Girdiden rastgele örnek alınır; örnek sıralanıp workers - 1 ayırıcı
+   (splitter) seçilir
+2. Girdi workers parçaya bölünür; her süreç kendi parçasını sıralar ve
+   ayırıcıların parça içindeki pozisyonlarını ikili arama ile bulur
+3. j. süreç her parçanın j. kovasını (bucket) toplar ve birleştirir;
+   kovalar ayırıcılarla sınırlandığı için sonuçlar uç uca eklenir, son
+   bir birleştirme gerekmez
+
+Sayısal girdiler (array.array, int veya float listesi) süreçler arasında
+pickle ile kopyalanmaz; multiprocessing.shared_memory üzerindeki ortak bir
+buffer'dan okunur ve ortak bir çıktı buffer'ına yazılır. shared_memory
+Python 3.8 ile geldi; 3.7'de sayısal girdiler tek süreçte sıralanır.
+
+Zaman Karmaşıklıkları:
+- Toplam iş: O(n log n)
+- p süreçle duvar saati süresi: O((n / p) log n + p log n) (kovalar dengeliyse)
+- Tekrarlı anahtarlar aynı kovaya düştüğü için çok tekrarlı verilerde
+  kovalar dengesizleşebilir
+"""
+
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.sorting.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from algorithms.sorting.sorting_algorithms import tim_sort
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7
+    shared_memory = None
+
+
+# Bu boyutun altındaki girdiler tek süreçte sıralanır
+MIN_PARALLEL_SIZE = 10_000
+# Süreç başına alınan örnek sayısı (fazla örnek = daha dengeli kovalar)
+OVERSAMPLING = 64
+
+
+def parallel_sort(arr, workers=None, key=None, reverse=False, sort_func=tim_sort):
+    """
+    Girdiyi birden fazla süreçte sample sort ile sıralar
+    
+    Args:
+        arr: Sıralanacak liste veya array.array
+        workers (int): Süreç sayısı (None: işlemci sayısı)
+        key: Sıralama anahtarı (süreçlere gönderilebilmesi için modül
+            seviyesinde tanımlı bir fonksiyon olmalı)
+        reverse (bool): Büyükten küçüğe sırala
+        sort_func: Parçaları sıralayan fonksiyon (key/reverse destekli, kararlı)
+    
+    Returns:
+        Sıralı yeni liste (array.array girdilerde array.array)
+    
+    sort_func kararlıysa sonuç da kararlıdır: eşit anahtarlar aynı kovaya
+    düşer ve kova içinde parça sırasıyla birleştirilir.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers == 1 or n < MIN_PARALLEL_SIZE:
+        result = sort_func(list(arr), key=key, reverse=reverse)
+        return array(arr.typecode, result) if isinstance(arr, array) else result
+    
+    if key is None and not reverse:
+        typecode = _numeric_typecode(arr)
+        if typecode is not None:
+            if shared_memory is None:
+                # Paylaşımlı bellek yok: sıralı yol
+                result = sort_func(list(arr))
+                return array(arr.typecode, result) if isinstance(arr, array) else result
+            return _parallel_sort_shared(arr, typecode, workers, sort_func)
+    
+    return _parallel_sort_pickled(list(arr), workers, key, reverse, sort_func)
+
+
+def _numeric_typecode(arr):
+    """Girdi paylaşımlı belleğe konabiliyorsa tip kodunu döndürür"""
+    if isinstance(arr, array):
+        return arr.typecode
+    if all(type(value) is int for value in arr):
+        if -(1 << 63) <= min(arr) and max(arr) < (1 << 63):
+            return 'q'
+        return None
+    if all(type(value) is float for value in arr):
+        return 'd'
+    return None
+
+
+def _choose_splitters(arr, workers, key, reverse):
+    """Rastgele örnekten workers - 1 ayırıcı anahtar seçer"""
+    sample = random.sample(range(len(arr)), min(len(arr), workers * OVERSAMPLING))
+    keys = sorted((arr[i] if key is None else key(arr[i]) for i in sample),
+                  reverse=reverse)
+    step = len(keys) / workers
+    return [keys[int(step * j)] for j in range(1, workers)]
+
+
+def _chunk_bounds(n, workers):
+    """[0, n) aralığını workers adet yakın boyutlu parçaya böler"""
+    return [(n * i // workers, n * (i + 1) // workers) for i in range(workers)]
+
+
+def _split_points(keys, splitters, reverse):
+    """
+    Sıralı keys içinde her kovanın sınırları (workers + 1 pozisyon)
+    
+    Ayırıcıya eşit anahtarlar soldaki kovaya düşer.
+    """
+    points = [0]
+    for splitter in splitters:
+        if reverse:
+            # Azalan sırada: splitter'dan küçük ilk anahtar
+            low, high = points[-1], len(keys)
+            while low < high:
+                mid = (low + high) // 2
+                if keys[mid] < splitter:
+                    high = mid
+                else:
+                    low = mid + 1
+            points.append(low)
+        else:
+            points.append(bisect_right(keys, splitter, points[-1]))
+    points.append(len(keys))
+    return points
+
+
+def _bucket_offsets(split_points, workers):
+    """Her kovanın çıktıdaki başlangıç pozisyonu"""
+    offsets = [0]
+    for bucket in range(workers):
+        size = sum(points[bucket + 1] - points[bucket] for points in split_points)
+        offsets.append(offsets[-1] + size)
+    return offsets
+
+
+# Paylaşımlı bellek (sayısal girdiler)
+
+def _parallel_sort_shared(arr, typecode, workers, sort_func):
+    """Sayısal girdiyi shared_memory üzerinden sıralar"""
+    values = arr if isinstance(arr, array) else array(typecode, arr)
+    n = len(values)
+    splitters = _choose_splitters(values, workers, None, False)
+    bounds = _chunk_bounds(n, workers)
+    
+    source = shared_memory.SharedMemory(create=True, size=max(values.itemsize * n, 1))
+    target = shared_memory.SharedMemory(create=True, size=max(values.itemsize * n, 1))
+    try:
+        view = source.buf.cast(typecode)
+        view[:n] = values
+        view.release()
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 1. aşama: parçaları yerinde sırala, kova sınırlarını bul
+            split_points = list(executor.map(
+                _sort_shared_chunk,
+                [(source.name, typecode, low, high, splitters, sort_func)
+                 for low, high in bounds]))
+            
+            # 2. aşama: her süreç bir kovayı birleştirip çıktıdaki yerine yazar
+            offsets = _bucket_offsets(split_points, workers)
+            segments = [[(low + points[bucket], low + points[bucket + 1])
+                         for (low, _), points in zip(bounds, split_points)]
+                        for bucket in range(workers)]
+            list(executor.map(
+                _merge_shared_bucket,
+                [(source.name, target.name, typecode, segments[bucket], offsets[bucket])
+                 for bucket in range(workers)]))
+        
+        view = target.buf.cast(typecode)
+        result = array(typecode, view[:n])
+        view.release()
+    finally:
+        for block in (source, target):
+            block.close()
+            block.unlink()
+    
+    return result if isinstance(arr, array) else result.tolist()
+
+
+def _sort_shared_chunk(task):
+    """Paylaşımlı buffer'daki bir parçayı sıralar ve kova sınırlarını döndürür"""
+    name, typecode, low, high, splitters, sort_func = task
+    block = shared_memory.SharedMemory(name=name)
+    view = block.buf.cast(typecode)
+    try:
+        chunk = sort_func(view[low:high].tolist())
+        view[low:high] = array(typecode, chunk)
+        return _split_points(chunk, splitters, False)
+    finally:
+        view.release()
+        block.close()
+
+
+def _merge_shared_bucket(task):
+    """Parçaların aynı kovaya düşen sıralı bölümlerini birleştirip yazar"""
+    source_name, target_name, typecode, segments, offset = task
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    source_view = source.buf.cast(typecode)
+    target_view = target.buf.cast(typecode)
+    try:
+        runs = [source_view[low:high].tolist() for low, high in segments]
+        bucket = array(typecode, merge(*runs))
+        target_view[offset:offset + len(bucket)] = bucket
+    finally:
+        source_view.release()
+        target_view.release()
+        source.close()
+        target.close()
+
+
+# Pickle ile (genel nesneler)
+
+def _parallel_sort_pickled(items, workers, key, reverse, sort_func):
+    """Genel nesneleri parçaları süreçlere göndererek sıralar"""
+    splitters = _choose_splitters(items, workers, key, reverse)
+    bounds = _chunk_bounds(len(items), workers)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = list(executor.map(
+            _sort_chunk,
+            [(items[low:high], key, reverse, splitters, sort_func) for low, high in bounds]))
+        buckets = executor.map(
+            _merge_bucket,
+            [([chunk[points[bucket]:points[bucket + 1]] for chunk, points in chunks],
+              key, reverse)
+             for bucket in range(workers)])
+        
+        result = []
+        for bucket in buckets:
+            result.extend(bucket)
+    return result
+
+
+def _sort_chunk(task):
+    """Bir parçayı sıralar; (sıralı parça, kova sınırları) döndürür"""
+    chunk, key, reverse, splitters, sort_func = task
+    chunk = sort_func(chunk, key=key, reverse=reverse)
+    keys = chunk if key is None else [key(item) for item in chunk]
+    return chunk, _split_points(keys, splitters, reverse)
+
+
+def _merge_bucket(task):
+    """Bir kovanın parçalardan gelen sıralı bölümlerini kararlı birleştirir"""
+    runs, key, reverse = task
+    return list(merge(*runs, key=key, reverse=reverse))
+
+
+def benchmark(sizes=(10 ** 6, 10 ** 7), worker_counts=(1, 2, 4, 8)):
+    """
+    Farklı süreç sayıları için sıralama sürelerini ölçer
+    
+    Returns:
+        list: (n, workers, saniye) üçlüleri
+    """
+    import time
+    
+    results = []
+    for n in sizes:
+        values = array('q', (random.randint(-10 ** 12, 10 ** 12) for _ in range(n)))
+        for workers in worker_counts:
+            start_time = time.perf_counter()
+            parallel_sort(values, workers=workers)
+            results.append((n, workers, time.perf_counter() - start_time))
+    return results
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    print("=== Paralel Sıralama Örnekleri ===")
+    
+    data = [random.randint(0, 1000) for _ in range(50_000)]
+    result = parallel_sort(data, workers=4)
+    print(f"50 000 eleman, 4 süreç: doğru mu: {result == sorted(data)}")
+    
+    words = [f"kelime-{random.randint(0, 10 ** 6)}" for _ in range(20_000)]
+    result = parallel_sort(words, workers=2, key=len, reverse=True)
+    print(f"20 000 kelime (key=len, reverse): doğru mu: "
+          f"{result == sorted(words, key=len, reverse=True)}")
+    
+    print(f"\n=== Ölçekleme (işlemci sayısı: {os.cpu_count()}) ===")
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    sizes = tuple(10 ** power for power in range(6, max_power + 1))
+    print(f"{'n':>12} {'süreç':>6} {'saniye':>10}")
+    for n, workers, seconds in benchmark(sizes):
+        print(f"{n:>12} {workers:>6} {seconds:>10.2f}")
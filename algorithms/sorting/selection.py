@@ -0,0 +1,248 @@
+"""
+Seçim ve Kısmi Sıralama
+
+Bu modül, tam sıralama yapmadan k. elemanı veya en iyi k elemanı bulan
+algoritmaları içerir.
+
+- nth_element / quickselect: Introselect. Quickselect (median-of-three /
+  ninther pivot, üç yollu bölme) derinlik 2 * log2(n)'i aşarsa
+  median-of-medians pivotuna geçer; en kötü durum O(n) kalır
+- partial_sort: nth_element ile en küçük k eleman ayrılır, sadece onlar
+  sıralanır
+- top_k: k boyutlu sınırlı heap; girdi bir kez gezilir, bellekte sadece k
+  eleman tutulur (generator / dosya gibi akışlarla çalışır)
+
+Zaman Karmaşıklıkları:
+- nth_element / quickselect: O(n) ortalama, O(n) en kötü
+- partial_sort: O(n + k log k)
+- top_k: O(n log k), O(k) bellek
+"""
+
+import heapq
+import os
+import sys
+from typing import Callable, Iterable, List, Optional
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.sorting.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from algorithms.sorting.sorting_algorithms import (
+    INSERTION_SORT_CUTOFF, choose_pivot, introsort_range, insertion_sort_range,
+    partition_three_way
+)
+
+
+def nth_element(arr: List, k: int, key: Optional[Callable] = None,
+                reverse: bool = False):
+    """
+    arr'ı yerinde k. eleman doğru yerine gelecek şekilde düzenler
+    
+    İşlemden sonra arr[k] sıralı dizide k. pozisyondaki elemandır;
+    arr[:k] elemanları ondan büyük değil, arr[k + 1:] elemanları ondan
+    küçük değildir (reverse=True'da tersi). Eşit key'lerde sıralı dizideki
+    (kararlı) sıra esas alınır.
+    
+    Returns:
+        arr[k]
+    
+    Zaman Karmaşıklığı: O(n) average, O(n) worst
+    Uzay Karmaşıklığı: O(1) (key/reverse verildiğinde O(n))
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError("k out of range")
+    
+    if key is None and not reverse:
+        introselect_range(arr, 0, n, k)
+        return arr[k]
+    
+    decorated = _decorate(arr, key, reverse)
+    introselect_range(decorated, 0, n, n - 1 - k if reverse else k)
+    if reverse:
+        decorated.reverse()
+    arr[:] = [item for _, _, item in decorated]
+    return arr[k]
+
+
+def quickselect(arr: List, k: int, key: Optional[Callable] = None,
+                reverse: bool = False):
+    """
+    Sıralı dizide k. (0 tabanlı) pozisyona düşecek elemanı döndürür
+    
+    arr değiştirilmez. Ör. quickselect(arr, len(arr) // 2) medyandır.
+    
+    Zaman Karmaşıklığı: O(n) average, O(n) worst
+    Uzay Karmaşıklığı: O(n)
+    """
+    return nth_element(list(arr), k, key, reverse)
+
+
+def partial_sort(arr: List, k: int, key: Optional[Callable] = None,
+                 reverse: bool = False) -> List:
+    """
+    İlk k elemanı sıralı olan yeni bir liste döndürür
+    
+    result[:k], sıralı dizinin ilk k elemanıdır (kararlı sırayla);
+    result[k:] kalan elemanları belirsiz sırada içerir.
+    
+    Zaman Karmaşıklığı: O(n + k log k)
+    Uzay Karmaşıklığı: O(n)
+    """
+    n = len(arr)
+    k = min(max(k, 0), n)
+    if key is None and not reverse:
+        result = list(arr)
+        if k == 0:
+            return result
+        if k < n:
+            introselect_range(result, 0, n, k - 1)
+        introsort_range(result, 0, k)
+        return result
+    
+    decorated = _decorate(arr, key, reverse)
+    if k > 0:
+        # reverse'de sona düşen en büyük k eleman sıralanıp başa çevrilir
+        low, high = (n - k, n) if reverse else (0, k)
+        if 0 < low:
+            introselect_range(decorated, 0, n, low)
+        elif high < n:
+            introselect_range(decorated, 0, n, high - 1)
+        introsort_range(decorated, low, high)
+    if reverse:
+        decorated.reverse()
+    return [item for _, _, item in decorated]
+
+
+def top_k(iterable: Iterable, k: int, key: Optional[Callable] = None,
+          largest: bool = True) -> List:
+    """
+    En büyük (largest=False ise en küçük) k elemanı sıralı döndürür
+    
+    Girdi bir kez gezilir ve k boyutlu bir heap tutulur; heap'in kökü
+    tutulan en kötü elemandır ve yeni eleman sadece ondan iyiyse yerine
+    geçer. Eşit key'lerde önce gelen eleman tercih edilir ve sonuçta
+    önce yer alır.
+    
+    Zaman Karmaşıklığı: O(n log k)
+    Uzay Karmaşıklığı: O(k)
+    """
+    if k <= 0:
+        return []
+    
+    heap = []
+    if largest:
+        # Min-heap: kök en küçük key, eşitlikte en son gelen
+        for i, item in enumerate(iterable):
+            entry = (item if key is None else key(item), -i, item)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap[0] < entry:
+                heapq.heapreplace(heap, entry)
+        result = [heapq.heappop(heap)[2] for _ in range(len(heap))]
+    else:
+        # Max-heap: kök en büyük key, eşitlikte en son gelen
+        for i, item in enumerate(iterable):
+            entry = _Descending((item if key is None else key(item), i, item))
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap[0] < entry:
+                heapq.heapreplace(heap, entry)
+        result = [heapq.heappop(heap).entry[2] for _ in range(len(heap))]
+    
+    result.reverse()
+    return result
+
+
+def introselect_range(arr: List, low: int, high: int, k: int,
+                      depth_limit: Optional[int] = None):
+    """
+    arr[low:high] içinde k. pozisyonu yerinde seçer (introselect)
+    
+    depth_limit bölmeden sonra pivot median-of-medians ile seçilir.
+    """
+    if depth_limit is None:
+        depth_limit = 2 * max(high - low, 1).bit_length()
+    
+    while high - low > INSERTION_SORT_CUTOFF:
+        if depth_limit == 0:
+            # Kötü pivot dizisi: O(n) garantisi için median-of-medians
+            pivot = median_of_medians(arr, low, high)
+        else:
+            depth_limit -= 1
+            pivot = choose_pivot(arr, low, high)
+        
+        lt, gt = partition_three_way(arr, low, high, pivot)
+        if k < lt:
+            high = lt
+        elif k < gt:
+            return
+        else:
+            low = gt
+    
+    insertion_sort_range(arr, low, high)
+
+
+def median_of_medians(arr: List, low: int, high: int):
+    """
+    arr[low:high] için yaklaşık medyan pivotu (BFPRT)
+    
+    Elemanlar beşli gruplara ayrılır, grup medyanlarının medyanı bulunur.
+    Bu pivot her iki tarafa da elemanların en az ~%30'unu bırakır.
+    """
+    medians = []
+    for start in range(low, high, 5):
+        group = arr[start:min(start + 5, high)]
+        insertion_sort_range(group, 0, len(group))
+        medians.append(group[(len(group) - 1) // 2])
+    
+    middle = (len(medians) - 1) // 2
+    introselect_range(medians, 0, len(medians), middle, depth_limit=0)
+    return medians[middle]
+
+
+def _decorate(arr: List, key: Optional[Callable], reverse: bool) -> List:
+    """(key, sıra no, eleman) üçlüleri (bkz. sorting_algorithms.sort_decorated)"""
+    sign = -1 if reverse else 1
+    if key is None:
+        return [(item, sign * i, item) for i, item in enumerate(arr)]
+    return [(key(item), sign * i, item) for i, item in enumerate(arr)]
+
+
+class _Descending:
+    """Karşılaştırması ters çevrilmiş heap girdisi (heapq ile max-heap)"""
+    
+    __slots__ = ('entry',)
+    
+    def __init__(self, entry):
+        self.entry = entry
+    
+    def __lt__(self, other):
+        return other.entry < self.entry
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import random
+    import time
+    from algorithms.sorting.sorting_algorithms import quick_sort
+    
+    print("=== Seçim Algoritmaları Örnekleri ===")
+    
+    arr = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Array: {arr}")
+    print(f"Medyan (quickselect): {quickselect(arr, len(arr) // 2)}")
+    print(f"En küçük 3 (partial_sort): {partial_sort(arr, 3)[:3]}")
+    print(f"En büyük 3 (top_k): {top_k(arr, 3)}")
+    print(f"En küçük 2 (top_k): {top_k(arr, 2, largest=False)}")
+    
+    print("\n=== Performans: 10^6 eleman ===")
+    data = [random.random() for _ in range(10 ** 6)]
+    for name, func in [("top_k (en iyi 10)", lambda: top_k(data, 10)),
+                       ("partial_sort (10)", lambda: partial_sort(data, 10)),
+                       ("quickselect (medyan)", lambda: quickselect(data, len(data) // 2)),
+                       ("quick_sort (tam)", lambda: quick_sort(data))]:
+        start_time = time.perf_counter()
+        func()
+        print(f"{name:<21}: {time.perf_counter() - start_time:.3f} saniye")
@@ -0,0 +1,294 @@
+"""
+Akıllı Sıralama (Sort Dispatcher)
+
+Bu modül, girdinin ucuz bir profilini çıkarıp en uygun sıralama
+algoritmasını seçen smart_sort fonksiyonunu içerir.
+
+Profil (O(n) C seviyesinde taramalar + örnekleme):
+- n ve anahtar tipi ('int', 'float' veya 'other')
+- Sayısal anahtarlarda min / max (tamsayı aralığı)
+- Örneklenen komşu çiftlerde azalan / artan çift oranı (ön sıralılık)
+- Örneklenen anahtarlarda farklı değer oranı (tekrar oranı)
+
+Seçim (eşikler SortThresholds ile ayarlanabilir):
+1. Küçük girdi -> insertion_sort
+2. Neredeyse sıralı veya ters sıralı -> tim_sort (adaptif merge)
+3. Dar aralıklı veya çok tekrarlı tamsayılar -> counting_sort
+4. Büyük tamsayı dizileri -> radix_sort
+5. Diğer durumlar -> quick_sort (introsort)
+
+Verilen karar SortDecision olarak plan_sort ile alınabilir ve smart_sort
+her çağrıda 'smart_sort' logger'ına DEBUG seviyesinde yazar.
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+from operator import gt, itemgetter, lt
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.sorting.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from algorithms.sorting.sorting_algorithms import (
+    insertion_sort, tim_sort, quick_sort, counting_sort, radix_sort,
+    DENSE_RANGE_FACTOR, SPARSE_DISTINCT_DIVISOR
+)
+
+
+logger = logging.getLogger('smart_sort')
+
+ALGORITHMS = {
+    'insertion': insertion_sort,
+    'tim': tim_sort,
+    'quick': quick_sort,
+    'counting': counting_sort,
+    'radix': radix_sort,
+}
+
+
+class SortThresholds:
+    """smart_sort'un karar eşikleri (calibrate ile ölçülerek ayarlanabilir)"""
+    
+    def __init__(self, insertion_max_size=16, presorted_ratio=0.02,
+                 radix_min_size=50_000, dense_range_factor=DENSE_RANGE_FACTOR,
+                 distinct_ratio=1 / SPARSE_DISTINCT_DIVISOR, sample_size=1024):
+        """
+        Args:
+            insertion_max_size (int): Bu boyut ve altı insertion sort ile sıralanır
+            presorted_ratio (float): Ters yöndeki komşu çift oranı bunu
+                aşmıyorsa girdi neredeyse sıralı sayılır
+            radix_min_size (int): Tamsayılarda radix sort'a geçilen en küçük boyut
+            dense_range_factor (int): Aralık n'in bu katını aşmıyorsa counting sort
+            distinct_ratio (float): Farklı değer oranı bunu aşmıyorsa counting sort
+            sample_size (int): Örneklenen anahtar / komşu çift sayısı
+        """
+        self.insertion_max_size = insertion_max_size
+        self.presorted_ratio = presorted_ratio
+        self.radix_min_size = radix_min_size
+        self.dense_range_factor = dense_range_factor
+        self.distinct_ratio = distinct_ratio
+        self.sample_size = sample_size
+    
+    def to_dict(self):
+        """JSON'a yazılabilir sözlük (SortThresholds(**d) ile geri yüklenir)"""
+        return dict(vars(self))
+    
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"SortThresholds({fields})"
+
+
+DEFAULT_THRESHOLDS = SortThresholds()
+
+
+class SortProfile:
+    """Girdinin sıralama açısından özeti"""
+    
+    def __init__(self, n, kind, min_key=None, max_key=None,
+                 descent_ratio=0.0, ascent_ratio=0.0, distinct_ratio=1.0):
+        self.n = n
+        self.kind = kind
+        self.min_key = min_key
+        self.max_key = max_key
+        self.descent_ratio = descent_ratio
+        self.ascent_ratio = ascent_ratio
+        self.distinct_ratio = distinct_ratio
+    
+    @property
+    def key_range(self):
+        """Tamsayı anahtarlarda max - min + 1 (diğerlerinde None)"""
+        if self.kind != 'int':
+            return None
+        return self.max_key - self.min_key + 1
+    
+    def __repr__(self):
+        return (f"SortProfile(n={self.n}, kind={self.kind!r}, "
+                f"range={self.key_range}, descents={self.descent_ratio:.3f}, "
+                f"ascents={self.ascent_ratio:.3f}, distinct={self.distinct_ratio:.3f})")
+
+
+class SortDecision:
+    """Seçilen algoritma, seçim nedeni ve kullanılan profil"""
+    
+    def __init__(self, algorithm, reason, profile):
+        self.algorithm = algorithm
+        self.reason = reason
+        self.profile = profile
+    
+    def __repr__(self):
+        return f"SortDecision({self.algorithm!r}, {self.reason!r}, {self.profile!r})"
+
+
+def profile_keys(keys, sample_size=DEFAULT_THRESHOLDS.sample_size, rng=random):
+    """
+    Anahtar listesinin profilini çıkarır
+    
+    Tip ve min/max tüm liste üzerinde C seviyesinde taranır; ön sıralılık
+    ve tekrar oranı sample_size elemanlık örneklerden tahmin edilir.
+    
+    Zaman Karmaşıklığı: O(n + s)
+    """
+    n = len(keys)
+    if n < 2:
+        return SortProfile(n, 'other')
+    
+    types = set(map(type, keys))
+    if types == {int}:
+        kind = 'int'
+    elif types <= {int, float}:
+        kind = 'float'
+    else:
+        kind = 'other'
+    
+    # Ön sıralılık: komşu çiftlerin ne kadarı ters yönde
+    pairs = n - 1
+    if pairs <= sample_size:
+        positions = range(pairs)
+    else:
+        positions = rng.sample(range(pairs), sample_size)
+    left = [keys[i] for i in positions]
+    right = [keys[i + 1] for i in positions]
+    descents = sum(map(gt, left, right)) / len(left)
+    ascents = sum(map(lt, left, right)) / len(left)
+    
+    # Tekrar oranı: örnekteki farklı değerlerin oranı
+    sample = keys if n <= sample_size else rng.sample(keys, sample_size)
+    try:
+        distinct = len(set(sample)) / len(sample)
+    except TypeError:
+        distinct = 1.0  # Hash'lenemeyen anahtarlar
+    
+    min_key = max_key = None
+    if kind != 'other':
+        min_key, max_key = min(keys), max(keys)
+    
+    return SortProfile(n, kind, min_key, max_key, descents, ascents, distinct)
+
+
+def choose_algorithm(profile, thresholds=DEFAULT_THRESHOLDS):
+    """Profile göre algoritma seçer; SortDecision döndürür"""
+    n = profile.n
+    if n <= thresholds.insertion_max_size:
+        return SortDecision('insertion', 'small input', profile)
+    
+    if profile.descent_ratio <= thresholds.presorted_ratio:
+        return SortDecision('tim', 'nearly sorted', profile)
+    if profile.ascent_ratio <= thresholds.presorted_ratio:
+        return SortDecision('tim', 'nearly reverse sorted', profile)
+    
+    if profile.kind == 'int':
+        if profile.key_range <= thresholds.dense_range_factor * n:
+            return SortDecision('counting', 'dense integer range', profile)
+        if profile.distinct_ratio <= thresholds.distinct_ratio:
+            return SortDecision('counting', 'few distinct integers', profile)
+        if n >= thresholds.radix_min_size:
+            return SortDecision('radix', 'large wide-range integers', profile)
+    
+    return SortDecision('quick', 'general case', profile)
+
+
+def plan_sort(arr, key=None, thresholds=None):
+    """smart_sort'un arr için vereceği kararı (sıralamadan) döndürür"""
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    keys = arr if key is None else [key(item) for item in arr]
+    return choose_algorithm(profile_keys(keys, thresholds.sample_size), thresholds)
+
+
+def smart_sort(arr, key=None, reverse=False, thresholds=None):
+    """
+    Girdinin profiline göre seçilen algoritma ile sıralar
+    
+    Args:
+        arr: Sıralanacak liste
+        key: Sıralama anahtarı (her eleman için bir kez hesaplanır)
+        reverse (bool): Büyükten küçüğe sırala
+        thresholds (SortThresholds): Karar eşikleri (None: varsayılanlar)
+    
+    Returns:
+        list: Sıralı yeni liste
+    
+    Zaman Karmaşıklığı: O(n) profil + seçilen algoritmanın maliyeti
+    Kararlı: key/reverse verildiğinde evet (tüm algoritmalar süslenmiş
+    girdiyi kararlı sıralar)
+    """
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    keys = arr if key is None else [key(item) for item in arr]
+    decision = choose_algorithm(profile_keys(keys, thresholds.sample_size), thresholds)
+    logger.debug("smart_sort: %s", decision)
+    
+    sort_func = ALGORITHMS[decision.algorithm]
+    if key is None:
+        return sort_func(list(arr), reverse=reverse)
+    
+    # Anahtar zaten hesaplandı; (anahtar, eleman) çiftleri sıralanır
+    result = sort_func(list(zip(keys, arr)), key=itemgetter(0), reverse=reverse)
+    return [item for _, item in result]
+
+
+def calibrate(thresholds=None, repeat=5, rng=None):
+    """
+    Bu makinede eşikleri ölçerek yeni bir SortThresholds döndürür
+    
+    - insertion_max_size: insertion sort'un quick sort'tan yavaş olmadığı
+      en büyük boyut
+    - radix_min_size: geniş aralıklı tamsayılarda radix sort'un quick
+      sort'u geçtiği en küçük boyut
+    """
+    rng = rng or random.Random(0)
+    base = (thresholds or DEFAULT_THRESHOLDS).to_dict()
+    
+    def best_time(sort_func, data):
+        times = []
+        for _ in range(repeat):
+            start_time = time.perf_counter()
+            sort_func(list(data))
+            times.append(time.perf_counter() - start_time)
+        return min(times)
+    
+    insertion_max_size = 1
+    for n in (4, 8, 12, 16, 24, 32, 48, 64):
+        data = [rng.random() for _ in range(n)]
+        if best_time(insertion_sort, data) > best_time(quick_sort, data):
+            break
+        insertion_max_size = n
+    
+    radix_min_size = base['radix_min_size']
+    for n in (10 ** 3, 5 * 10 ** 3, 10 ** 4, 5 * 10 ** 4, 10 ** 5, 2 * 10 ** 5):
+        data = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(n)]
+        if best_time(radix_sort, data) < best_time(quick_sort, data):
+            radix_min_size = n
+            break
+    
+    base.update(insertion_max_size=insertion_max_size, radix_min_size=radix_min_size)
+    return SortThresholds(**base)
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    print("=== Akıllı Sıralama Örnekleri ===")
+    
+    n = 100_000
+    inputs = {
+        "küçük": [random.random() for _ in range(10)],
+        "sıralı + birkaç ekleme": list(range(n)) + [random.randint(0, n) for _ in range(10)],
+        "ters sıralı": list(range(n, 0, -1)),
+        "yaşlar (0-100)": [random.randint(0, 100) for _ in range(n)],
+        "az farklı geniş değer": [random.choice((10 ** 9, -5, 42)) for _ in range(n)],
+        "geniş aralıklı int": [random.randint(-10 ** 12, 10 ** 12) for _ in range(n)],
+        "float": [random.random() for _ in range(n)],
+        "string": [f"kayıt-{random.randint(0, n)}" for _ in range(n)],
+    }
+    for name, data in inputs.items():
+        decision = plan_sort(data)
+        start_time = time.perf_counter()
+        result = smart_sort(data)
+        seconds = time.perf_counter() - start_time
+        print(f"{name:<24} -> {decision.algorithm:<10} ({decision.reason}), "
+              f"{seconds:.3f} sn, doğru mu: {result == sorted(data)}")
+    
+    if len(sys.argv) > 1 and sys.argv[1] == "calibrate":
+        print(f"\nÖlçülen eşikler: {calibrate()}")
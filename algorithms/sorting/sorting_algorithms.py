@@ -8,23 +8,84 @@ Zaman Karmaşıklıkları:
 - Selection Sort: O(n²)
 - Insertion Sort: O(n²)
 - Merge Sort: O(n log n)
-- Quick Sort: O(n log n) average, O(n²) worst
+- Quick Sort (introsort): O(n log n)
+- Tim Sort: O(n log n), r doğal run'dan oluşan girdilerde O(n log r)
 - Heap Sort: O(n log n)
 - Counting Sort: O(n + k)
-- Radix Sort: O(d * (n + k))
+- Radix Sort: O(d * (n + 2^b)), b bitlik basamaklarla
+
+Tüm sıralama fonksiyonları key= ve reverse= parametrelerini kabul eder.
+key her eleman için tam olarak bir kez hesaplanır (decorate-sort-undecorate).
+key veya reverse verildiğinde elemanlar (key, sıra no, eleman) olarak
+süslendiği için sonuç her algoritmada kararlıdır; bu sayede çok anahtarlı
+sıralamalar ikincil anahtardan birincile doğru zincirlenebilir.
 """
 
-import random
-from typing import List, Callable
+import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# algorithms.sorting.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from data_structures.heaps.heap import build_heap, sift_down
+
+
+# Bu boyut ve altındaki aralıklar insertion sort ile sıralanır
+INSERTION_SORT_CUTOFF = 16
+# Bu boyutun üzerindeki aralıklarda pivot ninther (9 elemanın medyanı) ile seçilir
+NINTHER_THRESHOLD = 128
+# Bir taraf art arda bu kadar kazanınca birleştirme galloping moduna geçer
+MIN_GALLOP = 7
+# tim_sort bu boyutun altındaki girdileri tek run olarak sıralar
+MIN_MERGE = 32
+# counting_sort: key aralığı n'in bu katını aşmıyorsa yoğun sayaç dizisi kullanılır
+DENSE_RANGE_FACTOR = 4
+# counting_sort: farklı key sayısı n / bu değeri aşmıyorsa hash histogramı kullanılır
+SPARSE_DISTINCT_DIVISOR = 4
+
+
+def sort_decorated(sort_func: Callable, arr: List, key: Optional[Callable],
+                   reverse: bool) -> List:
+    """
+    key / reverse desteği (decorate-sort-undecorate)
+    
+    Her eleman (key(eleman), sıra no, eleman) üçlüsüne çevrilir; key her
+    eleman için bir kez hesaplanır ve eşit key'lerde sıra no karşılaştırılır,
+    elemanların kendisi hiç karşılaştırılmaz. reverse=True'da sıra no
+    negatif alınıp artan sıralanır ve sonuç ters çevrilir: eşit key'li
+    elemanlar yine orijinal sıralarında kalır.
+    """
+    sign = -1 if reverse else 1
+    if key is None:
+        decorated = [(item, sign * i, item) for i, item in enumerate(arr)]
+    else:
+        decorated = [(key(item), sign * i, item) for i, item in enumerate(arr)]
+    
+    result = [item for _, _, item in sort_func(decorated)]
+    if reverse:
+        result.reverse()
+    return result
 
 
-def bubble_sort(arr: List[int]) -> List[int]:
+def bubble_sort(arr: List[int], key: Optional[Callable] = None,
+                reverse: bool = False) -> List[int]:
     """
     Bubble Sort Algoritması
     
     Zaman Karmaşıklığı: O(n²)
     Uzay Karmaşıklığı: O(1)
+    Kararlı: Evet
     """
+    if key is not None or reverse:
+        return sort_decorated(bubble_sort, arr, key, reverse)
+    
     n = len(arr)
     arr = arr.copy()  # Orijinal array'i değiştirmemek için kopyala
     
@@ -43,13 +104,18 @@ def bubble_sort(arr: List[int]) -> List[int]:
     return arr
 
 
-def selection_sort(arr: List[int]) -> List[int]:
+def selection_sort(arr: List[int], key: Optional[Callable] = None,
+                   reverse: bool = False) -> List[int]:
     """
     Selection Sort Algoritması
     
     Zaman Karmaşıklığı: O(n²)
     Uzay Karmaşıklığı: O(1)
+    Kararlı: Hayır (key/reverse verildiğinde kararlı)
     """
+    if key is not None or reverse:
+        return sort_decorated(selection_sort, arr, key, reverse)
+    
     n = len(arr)
     arr = arr.copy()
     
@@ -66,46 +132,144 @@ def selection_sort(arr: List[int]) -> List[int]:
     return arr
 
 
-def insertion_sort(arr: List[int]) -> List[int]:
+def insertion_sort(arr: List[int], key: Optional[Callable] = None,
+                   reverse: bool = False) -> List[int]:
     """
     Insertion Sort Algoritması
     
     Zaman Karmaşıklığı: O(n²)
     Uzay Karmaşıklığı: O(1)
+    Kararlı: Evet
     """
+    if key is not None or reverse:
+        return sort_decorated(insertion_sort, arr, key, reverse)
+    
     arr = arr.copy()
     
     for i in range(1, len(arr)):
-        key = arr[i]
+        current = arr[i]
         j = i - 1
         
-        # key'den büyük elemanları sağa kaydır
-        while j >= 0 and arr[j] > key:
+        # current'tan büyük elemanları sağa kaydır
+        while j >= 0 and arr[j] > current:
             arr[j + 1] = arr[j]
             j -= 1
         
-        arr[j + 1] = key
+        arr[j + 1] = current
     
     return arr
 
 
-def merge_sort(arr: List[int]) -> List[int]:
+def merge_sort(arr: List[int], key: Optional[Callable] = None,
+               reverse: bool = False) -> List[int]:
     """
-    Merge Sort Algoritması
+    Merge Sort Algoritması (bottom-up, kararlı)
     
-    Zaman Karmaşıklığı: O(n log n)
+    Özyineleme ve her seviyede alt liste oluşturma yerine, çıktı kopyası ile
+    tek bir yardımcı buffer arasında gidip gelerek (ping-pong) çalışır:
+    
+    - Önce INSERTION_SORT_CUTOFF boyutlu bloklar insertion sort ile sıralanır
+    - Her geçişte yan yana iki sıralı parça diğer buffer'a birleştirilir
+    - Sol parçanın sonu sağ parçanın başından büyük değilse parçalar zaten
+      sıralıdır, birleştirme yapılmadan kopyalanır
+    - Bir taraf art arda MIN_GALLOP kez kazanınca galloping ile o taraftan
+      bir blok tek seferde kopyalanır
+    
+    Zaman Karmaşıklığı: O(n log n), sıralı girdilerde O(n)
     Uzay Karmaşıklığı: O(n)
+    Kararlı: Evet
     """
-    if len(arr) <= 1:
+    if key is not None or reverse:
+        return sort_decorated(merge_sort, arr, key, reverse)
+    
+    n = len(arr)
+    if n <= 1:
         return arr
     
-    # Array'i ikiye böl
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
+    source = arr.copy()
+    for low in range(0, n, INSERTION_SORT_CUTOFF):
+        insertion_sort_range(source, low, min(low + INSERTION_SORT_CUTOFF, n))
+    
+    target = [None] * n
+    width = INSERTION_SORT_CUTOFF
+    while width < n:
+        for low in range(0, n, 2 * width):
+            mid = min(low + width, n)
+            high = min(low + 2 * width, n)
+            if mid == high or not source[mid] < source[mid - 1]:
+                target[low:high] = source[low:high]
+            else:
+                merge_into(source, target, low, mid, high)
+        source, target = target, source
+        width *= 2
     
-    # İki sıralı array'i birleştir
-    return merge(left, right)
+    return source
+
+
+def merge_into(source: List[int], target: List[int], low: int, mid: int, high: int):
+    """
+    source[low:mid] ve source[mid:high] sıralı parçalarını target[low:high]
+    aralığına kararlı şekilde birleştirir (galloping ile)
+    """
+    i, j, k = low, mid, low
+    left_wins = right_wins = 0
+    
+    while i < mid and j < high:
+        if source[j] < source[i]:
+            target[k] = source[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:
+                # Sağ taraftan source[i]'den küçük tüm blok
+                end = gallop_left(source, source[i], j, high)
+                target[k:k + end - j] = source[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            target[k] = source[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and j < high:
+                # Sol taraftan source[j]'den büyük olmayan tüm blok (kararlılık)
+                end = gallop_right(source, source[j], i, mid)
+                target[k:k + end - i] = source[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+    
+    target[k:k + mid - i] = source[i:mid]
+    k += mid - i
+    target[k:k + high - j] = source[j:high]
+
+
+def gallop_left(arr: List[int], value, low: int, high: int) -> int:
+    """
+    arr[low:high] sıralı aralığında value'dan küçük olmayan ilk pozisyon
+    
+    Önce 1, 3, 7, ... adımlarla üstel olarak ilerler, sonra bulunan aralıkta
+    ikili arama yapar: sonuç low'a yakınsa O(log d) karşılaştırma yeterlidir.
+    """
+    step = 1
+    last = low
+    while last + step < high and arr[last + step - 1] < value:
+        last += step
+        step *= 2
+    return bisect_left(arr, value, last, min(last + step, high))
+
+
+def gallop_right(arr: List[int], value, low: int, high: int) -> int:
+    """arr[low:high] sıralı aralığında value'dan büyük ilk pozisyon (üstel arama)"""
+    step = 1
+    last = low
+    while last + step < high and not value < arr[last + step - 1]:
+        last += step
+        step *= 2
+    return bisect_right(arr, value, last, min(last + step, high))
 
 
 def merge(left: List[int], right: List[int]) -> List[int]:
@@ -128,23 +292,273 @@ def merge(left: List[int], right: List[int]) -> List[int]:
     return result
 
 
-def quick_sort(arr: List[int]) -> List[int]:
+def tim_sort(arr: List[int], key: Optional[Callable] = None,
+             reverse: bool = False) -> List[int]:
+    """
+    Tim Sort Algoritması (uyarlamalı, kararlı)
+    
+    Girdideki doğal run'ları (artan veya kesin azalan ardışık diziler)
+    bulur ve birleştirir:
+    
+    - Azalan run'lar yerinde ters çevrilir
+    - minrun'dan kısa run'lar binary insertion sort ile minrun'a uzatılır
+    - Run'lar bir yığında tutulur; yığının tepesindeki uzunluklar
+      A > B + C ve B > C koşullarını bozunca komşu run'lar birleştirilir
+      (birleştirmeler dengeli kalır)
+    - Birleştirmeden önce zaten yerinde olan önek/sonek galloping ile
+      atlanır; birleştirme merge_into ile tek bir yardımcı buffer üzerinden
+      yapılır
+    
+    r run'dan oluşan girdilerde O(n log r) karşılaştırma yapar (r: run
+    sayısı); sıralı/ters sıralı girdilerde n - 1. Run'lar birbiriyle az
+    örtüşüyorsa (ör. sıralı bir diziye eklenmiş kayıtlar) galloping
+    sayesinde O(n + r log r)'ye yaklaşır.
+    
+    Zaman Karmaşıklığı: O(n log n) worst, O(n) best
+    Uzay Karmaşıklığı: O(n)
+    Kararlı: Evet
+    """
+    if key is not None or reverse:
+        return sort_decorated(tim_sort, arr, key, reverse)
+    
+    n = len(arr)
+    if n <= 1:
+        return arr
+    
+    arr = arr.copy()
+    min_run = min_run_length(n)
+    buffer = [None] * n
+    runs = []  # (başlangıç, uzunluk)
+    
+    low = 0
+    while low < n:
+        run_length = count_run_and_make_ascending(arr, low, n)
+        if run_length < min_run:
+            forced = min(min_run, n - low)
+            binary_insertion_sort(arr, low, low + forced, low + run_length)
+            run_length = forced
+        runs.append((low, run_length))
+        _merge_collapse(arr, runs, buffer)
+        low += run_length
+    
+    # Kalan run'ları sağdan sola birleştir
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        _merge_at(arr, runs, i, buffer)
+    
+    return arr
+
+
+def min_run_length(n: int) -> int:
+    """
+    n'yi 2'nin kuvvetine yakın sayıda run'a bölen minimum run uzunluğu
+    (MIN_MERGE / 2 ile MIN_MERGE arası)
+    """
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def count_run_and_make_ascending(arr: List[int], low: int, high: int) -> int:
+    """
+    arr[low]'dan başlayan doğal run'ın uzunluğunu döndürür
+    
+    Kesin azalan run'lar yerinde ters çevrilir (eşit elemanlar azalan run'a
+    dahil edilmediği için kararlılık bozulmaz).
+    """
+    run_high = low + 1
+    if run_high == high:
+        return 1
+    
+    if arr[run_high] < arr[low]:
+        run_high += 1
+        while run_high < high and arr[run_high] < arr[run_high - 1]:
+            run_high += 1
+        arr[low:run_high] = arr[low:run_high][::-1]
+    else:
+        run_high += 1
+        while run_high < high and not arr[run_high] < arr[run_high - 1]:
+            run_high += 1
+    
+    return run_high - low
+
+
+def binary_insertion_sort(arr: List[int], low: int, high: int, start: int):
     """
-    Quick Sort Algoritması
+    arr[low:start] sıralıyken arr[low:high] aralığını sıralar
     
-    Zaman Karmaşıklığı: O(n log n) average, O(n²) worst
-    Uzay Karmaşıklığı: O(log n) average, O(n) worst
+    Yeni elemanın yeri ikili arama ile bulunur; kaydırma tek bir slice
+    ataması ile yapılır.
     """
+    for i in range(start, high):
+        pivot = arr[i]
+        position = bisect_right(arr, pivot, low, i)
+        arr[position + 1:i + 1] = arr[position:i]
+        arr[position] = pivot
+
+
+def _merge_collapse(arr: List[int], runs: list, buffer: list):
+    """Run yığınının uzunluk koşullarını yeniden sağlar"""
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        _merge_at(arr, runs, i, buffer)
+
+
+def _merge_at(arr: List[int], runs: list, i: int, buffer: list):
+    """Yığındaki i. ve i+1. run'ları birleştirir"""
+    start, first_length = runs[i]
+    mid, second_length = runs[i + 1]
+    end = mid + second_length
+    runs[i] = (start, first_length + second_length)
+    del runs[i + 1]
+    
+    # İlk run'ın ikinci run'ın ilk elemanından büyük olmayan öneki yerinde
+    start = gallop_right(arr, arr[mid], start, mid)
+    if start == mid:
+        return
+    # İkinci run'ın ilk run'ın son elemanından küçük olmayan soneki yerinde
+    end = gallop_left(arr, arr[mid - 1], mid, end)
+    
+    buffer[start:end] = arr[start:end]
+    merge_into(buffer, arr, start, mid, end)
+
+
+def quick_sort(arr: List[int], key: Optional[Callable] = None,
+               reverse: bool = False) -> List[int]:
+    """
+    Quick Sort Algoritması (introsort)
+    
+    - Pivot: median-of-three, büyük aralıklarda ninther
+    - Üç yollu (Dutch flag) bölme: pivota eşit elemanlar tek geçişte ayrılır
+    - Küçük aralıklar (<= INSERTION_SORT_CUTOFF) insertion sort ile sıralanır
+    - Derinlik 2 * log2(n)'i aşarsa aralık heap sort ile sıralanır
+    - Özyineleme yerine O(log n) ile sınırlı açık bir yığın kullanılır
+    
+    Sıralı, ters sıralı ve tüm elemanları eşit girdiler de O(n log n)
+    (eşit elemanlarda O(n)) sürede sıralanır. Kararlı değildir.
+    
+    Zaman Karmaşıklığı: O(n log n) average, O(n log n) worst
+    Uzay Karmaşıklığı: O(log n)
+    Kararlı: Hayır (key/reverse verildiğinde kararlı)
+    """
+    if key is not None or reverse:
+        return sort_decorated(quick_sort, arr, key, reverse)
+    
     if len(arr) <= 1:
         return arr
     
     arr = arr.copy()
-    quick_sort_helper(arr, 0, len(arr) - 1)
+    introsort_range(arr, 0, len(arr))
     return arr
 
 
+def introsort_range(arr: List[int], low: int, high: int):
+    """arr[low:high] aralığını yerinde introsort ile sıralar"""
+    depth_limit = 2 * max(high - low, 1).bit_length()
+    stack = [(low, high, depth_limit)]
+    
+    while stack:
+        low, high, depth = stack.pop()
+        
+        while high - low > INSERTION_SORT_CUTOFF:
+            if depth == 0:
+                # Kötü pivot dizisi: O(n log n) garantisi için heap sort
+                heap_sort_range(arr, low, high)
+                break
+            depth -= 1
+            
+            pivot = choose_pivot(arr, low, high)
+            lt, gt = partition_three_way(arr, low, high, pivot)
+            
+            # Büyük parçayı yığına at, küçük parçayla devam et:
+            # yığın derinliği O(log n) ile sınırlı kalır
+            if lt - low < high - gt:
+                stack.append((gt, high, depth))
+                high = lt
+            else:
+                stack.append((low, lt, depth))
+                low = gt
+        else:
+            insertion_sort_range(arr, low, high)
+
+
+def choose_pivot(arr: List[int], low: int, high: int) -> int:
+    """Median-of-three (büyük aralıklarda ninther) ile pivot değeri seçer"""
+    size = high - low
+    mid = low + size // 2
+    last = high - 1
+    if size > NINTHER_THRESHOLD:
+        step = size // 8
+        return _median_of_three(
+            _median_of_three(arr[low], arr[low + step], arr[low + 2 * step]),
+            _median_of_three(arr[mid - step], arr[mid], arr[mid + step]),
+            _median_of_three(arr[last - 2 * step], arr[last - step], arr[last]),
+        )
+    return _median_of_three(arr[low], arr[mid], arr[last])
+
+
+def _median_of_three(a, b, c):
+    """Üç değerin medyanı (sadece < karşılaştırması ile)"""
+    if b < a:
+        a, b = b, a
+    if c < b:
+        b = c
+        if b < a:
+            b = a
+    return b
+
+
+def partition_three_way(arr: List[int], low: int, high: int, pivot) -> Tuple[int, int]:
+    """
+    Dutch national flag bölmesi
+    
+    arr[low:high] aralığını < pivot, == pivot, > pivot olacak şekilde üçe
+    böler ve eşit bölgenin [lt, gt) sınırlarını döndürür.
+    """
+    lt = i = low
+    gt = high
+    while i < gt:
+        value = arr[i]
+        if value < pivot:
+            arr[lt], arr[i] = value, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            gt -= 1
+            arr[i], arr[gt] = arr[gt], value
+        else:
+            i += 1
+    return lt, gt
+
+
+def insertion_sort_range(arr: List[int], low: int, high: int):
+    """arr[low:high] aralığını yerinde insertion sort ile sıralar"""
+    for i in range(low + 1, high):
+        key = arr[i]
+        j = i - 1
+        while j >= low and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
 def quick_sort_helper(arr: List[int], low: int, high: int):
-    """Quick sort yardımcı fonksiyonu"""
+    """
+    Klasik (özyinelemeli, Lomuto) quick sort yardımcı fonksiyonu
+    
+    Not: Sıralı girdilerde O(n²) sürer ve özyineleme derinliği n'e ulaşır;
+    quick_sort artık introsort_range kullanır.
+    """
     if low < high:
         # Pivot'u doğru pozisyona yerleştir
         pivot_index = partition(arr, low, high)
@@ -169,126 +583,277 @@ def partition(arr: List[int], low: int, high: int) -> int:
     return i + 1
 
 
-def heap_sort(arr: List[int]) -> List[int]:
+def heap_sort(arr: List[int], key: Optional[Callable] = None,
+              reverse: bool = False, arity: int = 2) -> List[int]:
     """
     Heap Sort Algoritması
     
+    data_structures.heaps.heap çekirdeklerini kullanır: Floyd'un O(n) heap
+    kurma yöntemi ve özyinelemesiz, aşağıdan-yukarı sift_down. arity
+    (2, 4 veya 8) heap'in her düğümündeki çocuk sayısıdır.
+    
     Zaman Karmaşıklığı: O(n log n)
     Uzay Karmaşıklığı: O(1)
+    Kararlı: Hayır (key/reverse verildiğinde kararlı)
     """
-    arr = arr.copy()
-    n = len(arr)
-    
-    # Max heap oluştur
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
-    
-    # Heap'ten elemanları çıkar
-    for i in range(n - 1, 0, -1):
-        arr[0], arr[i] = arr[i], arr[0]  # Root'u sona taşı
-        heapify(arr, i, 0)  # Kalan heap'i düzenle
+    if key is not None or reverse:
+        return sort_decorated(partial(heap_sort, arity=arity), arr, key, reverse)
     
+    arr = arr.copy()
+    heap_sort_range(arr, 0, len(arr), arity)
     return arr
 
 
-def heapify(arr: List[int], n: int, i: int):
-    """Heap property'yi koruma"""
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-    
-    if left < n and arr[left] > arr[largest]:
-        largest = left
+def heap_sort_range(arr: List[int], low: int, high: int, arity: int = 2):
+    """
+    arr[low:high] aralığını yerinde heap sort ile sıralar (özyinelemesiz)
     
-    if right < n and arr[right] > arr[largest]:
-        largest = right
+    Min-heap'in kökü her adımda aralığın sonuna taşınır; aralık azalan
+    sırada dolar ve sonunda yerinde ters çevrilir.
+    """
+    n = high - low
+    build_heap(arr, arity, low, high)
+    for end in range(n - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        sift_down(arr, 0, end, arity, low)
     
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+    i, j = low, high - 1
+    while i < j:
+        arr[i], arr[j] = arr[j], arr[i]
+        i += 1
+        j -= 1
 
 
-def counting_sort(arr: List[int]) -> List[int]:
+def heapify(arr: List[int], n: int, i: int):
+    """Heap property'yi koruma (max heap, özyinelemesiz)"""
+    value = arr[i]
+    child = 2 * i + 1
+    while child < n:
+        if child + 1 < n and arr[child] < arr[child + 1]:
+            child += 1
+        if not value < arr[child]:
+            break
+        arr[i] = arr[child]
+        i = child
+        child = 2 * i + 1
+    arr[i] = value
+
+
+def counting_sort(arr: List[int], key: Optional[Callable] = None,
+                  reverse: bool = False) -> List[int]:
     """
-    Counting Sort Algoritması
+    Counting Sort Algoritması (aralığa duyarlı)
+    
+    key verilirse elemanlar key(eleman) tamsayısına göre sıralanır
+    (ör. yaş, not); elemanların kendisinin tamsayı olması gerekmez.
+    
+    Key aralığı (k = max - min + 1) n'e göre değerlendirilip strateji seçilir
+    (bkz. counting_strategy):
+    - 'dense': k <= DENSE_RANGE_FACTOR * n ise k boyutlu sayaç dizisi
+    - 'sparse': aralık geniş ama farklı key sayısı d az ise sadece farklı
+      key'ler üzerinde hash histogramı (O(n + d log d))
+    - 'radix': aralık geniş ve key'ler çoğunlukla farklıysa radix_sort
+    Böylece [0, 10**9] gibi seyrek girdiler için dev sayaç dizisi ayrılmaz.
     
     Zaman Karmaşıklığı: O(n + k) where k is the range of input
-    Uzay Karmaşıklığı: O(k)
+    Uzay Karmaşıklığı: O(n + min(k, n))
+    Kararlı: Evet
     """
     if not arr:
         return []
     
-    # Maksimum değeri bul
-    max_val = max(arr)
-    min_val = min(arr)
+    keys = arr if key is None else [key(item) for item in arr]
+    min_val = min(keys)
+    max_val = max(keys)
+    
+    n = len(keys)
+    key_range = max_val - min_val + 1
+    
+    # Farklı key sayısı sadece aralık genişse hesaplanır
+    histogram = None if key_range <= DENSE_RANGE_FACTOR * n else Counter(keys)
+    strategy = counting_strategy(n, key_range, len(histogram) if histogram else 0)
+    
+    if strategy == 'dense':
+        return _place_by_counts(arr, keys, min_val, max_val, reverse)
+    
+    if strategy == 'sparse':
+        # Sadece farklı key'ler sıralanır, başlangıç pozisyonları hash'te tutulur
+        starts = {}
+        total = 0
+        for value in radix_sort(list(histogram), reverse=reverse):
+            starts[value] = total
+            total += histogram[value]
+        
+        output = [None] * len(arr)
+        for item, value in zip(arr, keys):
+            output[starts[value]] = item
+            starts[value] += 1
+        return output
+    
+    items = arr if key is None else list(zip(keys, arr))
+    result = radix_sort(items, key=None if key is None else _first, reverse=reverse)
+    return result if key is None else [item for _, item in result]
+
+
+def counting_strategy(n: int, key_range: int, distinct: int) -> str:
+    """
+    counting_sort'un kullanacağı stratejiyi seçer
+    
+    Args:
+        n (int): Eleman sayısı
+        key_range (int): max - min + 1
+        distinct (int): Farklı key sayısı (aralık darsa kullanılmaz)
+    
+    Returns:
+        str: 'dense', 'sparse' veya 'radix'
+    """
+    if key_range <= DENSE_RANGE_FACTOR * n:
+        return 'dense'
+    if distinct * SPARSE_DISTINCT_DIVISOR <= n:
+        return 'sparse'
+    return 'radix'
+
+
+def counting_sort_by_key(arr: List, key: Callable, max_key: int, min_key: int = 0,
+                         reverse: bool = False) -> List:
+    """
+    Kayıtları [min_key, max_key] aralığında sınırlı bir tamsayı key'e göre
+    sıralar (ör. yaş, not)
+    
+    Aralık önceden bilindiği için min/max taraması ve strateji seçimi
+    yapılmaz; süre her zaman O(n + k)'dir. Aralık dışındaki key'ler
+    ValueError verir.
+    
+    Zaman Karmaşıklığı: O(n + k), k = max_key - min_key + 1
+    Uzay Karmaşıklığı: O(n + k)
+    Kararlı: Evet
+    """
+    keys = [key(item) for item in arr]
+    if keys and not (min_key <= min(keys) and max(keys) <= max_key):
+        raise ValueError(f"Key out of range [{min_key}, {max_key}]")
+    return _place_by_counts(arr, keys, min_key, max_key, reverse)
+
+
+def _place_by_counts(arr: List, keys: List[int], min_val: int, max_val: int,
+                     reverse: bool) -> List:
+    """Yoğun sayaç dizisi ile kararlı yerleştirme"""
     range_val = max_val - min_val + 1
     
-    # Count array oluştur
+    # Her key'in sayısını say
     count = [0] * range_val
-    output = [0] * len(arr)
-    
-    # Her elemanın sayısını say
-    for num in arr:
-        count[num - min_val] += 1
+    for value in keys:
+        count[value - min_val] += 1
     
-    # Cumulative count hesapla
-    for i in range(1, range_val):
-        count[i] += count[i - 1]
+    # Her key'in çıktıdaki başlangıç pozisyonu (reverse'te büyükten küçüğe)
+    buckets = range(range_val - 1, -1, -1) if reverse else range(range_val)
+    total = 0
+    for bucket in buckets:
+        count[bucket], total = total, total + count[bucket]
     
-    # Output array'i oluştur
-    for i in range(len(arr) - 1, -1, -1):
-        output[count[arr[i] - min_val] - 1] = arr[i]
-        count[arr[i] - min_val] -= 1
+    # Elemanları orijinal sırayla yerleştir (kararlılık)
+    output = [None] * len(arr)
+    for item, value in zip(arr, keys):
+        output[count[value - min_val]] = item
+        count[value - min_val] += 1
     
     return output
 
 
-def radix_sort(arr: List[int]) -> List[int]:
+def _first(pair):
+    return pair[0]
+
+
+def radix_sort(arr: List[int], key: Optional[Callable] = None,
+               reverse: bool = False, digit_bits: Optional[int] = None) -> List[int]:
     """
-    Radix Sort Algoritması
+    Radix Sort Algoritması (byte tabanlı LSD)
     
-    Zaman Karmaşıklığı: O(d * (n + k)) where d is number of digits
-    Uzay Karmaşıklığı: O(n + k)
+    Anahtarlar önce sıralamayı koruyan negatif olmayan tamsayılara çevrilir
+    (radix_keys), sonra en düşük basamaktan başlayarak digit_bits'lik
+    (8 veya 16 bit) basamaklara göre kararlı şekilde dağıtılır:
+    
+    - Negatif sayılar ve keyfi genişlikteki tamsayılar desteklenir
+    - float anahtarlar IEEE-754 bit desenine göre sıralanır
+    - Tüm anahtarların aynı basamağa sahip olduğu geçişler atlanır
+    - Her geçiş iki buffer arasında gidip gelir (ping-pong), geri kopyalama yok
+    
+    key verilirse elemanlar key(eleman) sayısına göre sıralanır. reverse=True'da
+    girdi ters çevrilip kararlı şekilde artan sıralanır ve sonuç ters
+    çevrilir; eşit key'ler orijinal sırada kalır.
+    
+    Zaman Karmaşıklığı: O(d * (n + 2^b)) where d = ⌈w / b⌉ geçiş
+    Uzay Karmaşıklığı: O(n + 2^b)
+    Kararlı: Evet
     """
     if not arr:
         return []
     
-    arr = arr.copy()
-    max_val = max(arr)
+    items = arr[::-1] if reverse else arr
+    keys = radix_keys(items if key is None else [key(item) for item in items])
     
-    # Her basamak için counting sort uygula
-    exp = 1
-    while max_val // exp > 0:
-        counting_sort_by_digit(arr, exp)
-        exp *= 10
+    n = len(items)
+    if digit_bits is None:
+        digit_bits = 16 if n >= 1 << 16 else 8
+    radix = 1 << digit_bits
+    mask = radix - 1
+    width = max(keys).bit_length()
     
-    return arr
+    order = list(range(n))
+    target_order = [0] * n
+    target_keys = [0] * n
+    
+    for shift in range(0, width, digit_bits):
+        digits = [(value >> shift) & mask for value in keys]
+        
+        counts = [0] * radix
+        for digit in digits:
+            counts[digit] += 1
+        if counts[digits[0]] == n:
+            continue  # Tüm anahtarlar bu basamakta aynı: geçiş gereksiz
+        
+        # Her basamak değerinin hedef buffer'daki başlangıç pozisyonu
+        total = 0
+        for digit in range(radix):
+            counts[digit], total = total, total + counts[digit]
+        
+        for digit, value, index in zip(digits, keys, order):
+            position = counts[digit]
+            target_keys[position] = value
+            target_order[position] = index
+            counts[digit] = position + 1
+        
+        keys, target_keys = target_keys, keys
+        order, target_order = target_order, order
+    
+    result = [items[index] for index in order]
+    if reverse:
+        result.reverse()
+    return result
 
 
-def counting_sort_by_digit(arr: List[int], exp: int):
-    """Belirli bir basamak için counting sort"""
-    n = len(arr)
-    output = [0] * n
-    count = [0] * 10
-    
-    # Count array'i doldur
-    for i in range(n):
-        index = (arr[i] // exp) % 10
-        count[index] += 1
+def radix_keys(keys: List) -> List[int]:
+    """
+    Sayısal anahtarları sırayı koruyan negatif olmayan tamsayılara çevirir
     
-    # Cumulative count
-    for i in range(1, 10):
-        count[i] += count[i - 1]
+    - int: en küçük anahtar çıkarılır (keyfi genişlikte tamsayılar için de
+      geçerli; sabit genişlikte two's complement işaret biti çevirmeye denk)
+    - float: IEEE-754 bit deseni; pozitiflerde işaret biti set edilir,
+      negatiflerde tüm bitler ters çevrilir. int ve float karışıksa tümü
+      float'a çevrilir (2^53'ten büyük tamsayılarda hassasiyet kaybı olabilir)
+    """
+    if all(type(value) is int for value in keys):
+        low = min(keys)
+        return [value - low for value in keys] if low else list(keys)
     
-    # Output array'i oluştur
-    for i in range(n - 1, -1, -1):
-        index = (arr[i] // exp) % 10
-        output[count[index] - 1] = arr[i]
-        count[index] -= 1
+    try:
+        floats = array('d', keys)
+    except TypeError:
+        raise TypeError("radix_sort requires int or float keys") from None
     
-    # Orijinal array'i güncelle
-    for i in range(n):
-        arr[i] = output[i]
+    sign = 1 << 63
+    full = (1 << 64) - 1
+    bits = array('Q', floats.tobytes())
+    return [value ^ full if value & sign else value | sign for value in bits]
 
 
 def test_sorting_algorithm(sort_func: Callable, arr: List[int], name: str):
@@ -314,6 +879,7 @@ if __name__ == "__main__":
         (selection_sort, "Selection Sort"),
         (insertion_sort, "Insertion Sort"),
         (merge_sort, "Merge Sort"),
+        (tim_sort, "Tim Sort"),
         (quick_sort, "Quick Sort"),
         (heap_sort, "Heap Sort"),
         (counting_sort, "Counting Sort"),
@@ -323,25 +889,15 @@ if __name__ == "__main__":
     for sort_func, name in algorithms:
         test_sorting_algorithm(sort_func, test_array, name)
     
-    # Büyük array ile performans testi
+    # Performans karşılaştırması: benchmark.py (dağılımlar, medyan/p95, JSON)
+    from algorithms.sorting.benchmark import TABLE_HEADER, format_row, run_benchmarks
+    
     print("\n" + "=" * 50)
-    print("Performans Testi (1000 eleman)")
+    print("Performans Testi (1000 eleman, 5 ölçüm medyanı)")
     print("=" * 50)
-    
-    large_array = [random.randint(1, 1000) for _ in range(1000)]
-    
-    # Sadece hızlı algoritmaları test et
-    fast_algorithms = [
-        (merge_sort, "Merge Sort"),
-        (quick_sort, "Quick Sort"),
-        (heap_sort, "Heap Sort"),
-        (counting_sort, "Counting Sort"),
-        (radix_sort, "Radix Sort")
-    ]
-    
-    for sort_func, name in fast_algorithms:
-        import time
-        start_time = time.time()
-        sorted_arr = sort_func(large_array)
-        end_time = time.time()
-        print(f"{name}: {end_time - start_time:.4f} saniye") 
\ No newline at end of file
+    print(TABLE_HEADER)
+    fast_sorts = ['merge_sort', 'tim_sort', 'quick_sort', 'heap_sort',
+                  'counting_sort', 'radix_sort']
+    for row in run_benchmarks(fast_sorts, sizes=[1000], distributions=['random']):
+        print(format_row(row))
+    print("\nTüm dağılımlar ve boyutlar için: python benchmark.py --help")
@@ -0,0 +1,165 @@
+"""
+String Sıralama (MSD Radix Sort)
+
+Bu modül, string anahtarları karakter karakter sıralayan MSD (en anlamlı
+karakterden başlayan) radix sort içerir.
+
+Karşılaştırmalı sıralamalar her karşılaştırmada iki string'i baştan
+tarar; ortak önekli anahtarlarda (isimler, yollar, URL'ler) aynı önek
+O(log n) kez yeniden okunur. MSD radix sort her karakteri bir kez okur:
+
+1. Aralıktaki anahtarlar depth. karakterlerine göre kovalara dağıtılır;
+   depth'ten kısa (bu derinlikte biten) anahtarlar en başa gider
+2. Kovalar karakter sırasıyla yazılır, her kova depth + 1 ile sıralanır
+3. STRING_SORT_CUTOFF ve altındaki aralıklar insertion sort ile sıralanır
+
+Dağıtım girdi sırasını koruduğu için sıralama kararlıdır. Özyineleme
+yerine açık bir yığın kullanılır; çok uzun ortak önekler özyineleme
+limitine takılmaz.
+
+Zaman Karmaşıklıkları:
+- O(D + n * c), D: anahtarları ayırt eden önek uzunluklarının toplamı,
+  c: küçük aralıklardaki insertion sort maliyeti
+- Kova karakterlerinin sıralanması: her düğümde O(σ log σ)
+- Uzay: O(n + σ) (σ: bir aralıktaki farklı karakter sayısı)
+"""
+
+from typing import Callable, List, Optional
+
+
+# Bu boyut ve altındaki aralıklar insertion sort ile sıralanır
+STRING_SORT_CUTOFF = 32
+
+
+def string_sort(arr: List, key: Optional[Callable] = None, reverse: bool = False,
+                casefold: bool = False) -> List:
+    """
+    String anahtarlara göre MSD radix sort
+    
+    Args:
+        arr: Sıralanacak liste
+        key: Her elemandan string anahtar üreten fonksiyon (bir kez çağrılır)
+        reverse (bool): Büyükten küçüğe sırala
+        casefold (bool): Anahtarları büyük/küçük harf duyarsız karşılaştır
+            (str.casefold her anahtar için bir kez hesaplanır)
+    
+    Returns:
+        list: Sıralı yeni liste
+    
+    Zaman Karmaşıklığı: O(D + n * c) (bkz. modül açıklaması)
+    Uzay Karmaşıklığı: O(n)
+    Kararlı: Evet
+    """
+    keys = list(arr) if key is None else [key(item) for item in arr]
+    if not all(isinstance(value, str) for value in keys):
+        raise TypeError("string_sort requires str keys")
+    if casefold:
+        keys = [value.casefold() for value in keys]
+    
+    order = list(range(len(keys)))
+    msd_sort_indices(keys, order, reverse)
+    return [arr[i] for i in order]
+
+
+def msd_sort_indices(keys: List[str], order: List[int], reverse: bool = False):
+    """
+    order'daki index'leri keys[index] string'lerine göre yerinde sıralar
+    
+    order başlangıçta artan sıradaysa eşit anahtarlar artan index
+    sırasında kalır.
+    """
+    stack = [(0, len(order), 0)]
+    while stack:
+        low, high, depth = stack.pop()
+        if high - low <= STRING_SORT_CUTOFF:
+            _insertion_sort_indices(keys, order, low, high, reverse)
+            continue
+        
+        # Kovalara dağıtım (girdi sırası korunur)
+        finished = []
+        buckets = {}
+        for index in order[low:high]:
+            value = keys[index]
+            if len(value) > depth:
+                char = value[depth]
+                bucket = buckets.get(char)
+                if bucket is None:
+                    buckets[char] = [index]
+                else:
+                    bucket.append(index)
+            else:
+                finished.append(index)
+        
+        # Geniş alfabelerde (CJK) σ binlerce olabilir: O(σ log σ) sıralama
+        chars = sorted(buckets, reverse=reverse)
+        groups = [buckets[char] for char in chars]
+        # Biten anahtarlar uzantılarından küçüktür
+        if reverse:
+            groups.append(finished)
+        else:
+            groups.insert(0, finished)
+        
+        position = low
+        for group in groups:
+            end = position + len(group)
+            order[position:end] = group
+            if group is not finished and end - position > 1:
+                stack.append((position, end, depth + 1))
+            position = end
+
+
+def _insertion_sort_indices(keys: List[str], order: List[int], low: int, high: int,
+                            reverse: bool):
+    """order[low:high] aralığını keys'e göre kararlı insertion sort ile sıralar"""
+    for i in range(low + 1, high):
+        index = order[i]
+        value = keys[index]
+        j = i - 1
+        if reverse:
+            while j >= low and keys[order[j]] < value:
+                order[j + 1] = order[j]
+                j -= 1
+        else:
+            while j >= low and value < keys[order[j]]:
+                order[j + 1] = order[j]
+                j -= 1
+        order[j + 1] = index
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import os
+    import random
+    import sys
+    import time
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from algorithms.sorting.sorting_algorithms import merge_sort, tim_sort
+    
+    print("=== String Sıralama Örnekleri ===")
+    
+    names = ["zeynep", "Ahmet", "ayşe", "Ali", "mehmet", "ali", "Zehra"]
+    print(f"İsimler: {names}")
+    print(f"Sıralı: {string_sort(names)}")
+    print(f"Büyük/küçük harf duyarsız: {string_sort(names, casefold=True)}")
+    print(f"Ters: {string_sort(names, casefold=True, reverse=True)}")
+    
+    print("\n=== Performans (ortak önekli anahtarlar) ===")
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    first_names = ["Ahmet", "Ayşe", "Mehmet", "Fatma", "Mustafa", "Zeynep", "Ali", "Elif"]
+    last_names = ["Yılmaz", "Kaya", "Demir", "Çelik", "Şahin", "Yıldız", "Öztürk", "Aydın"]
+    keys = [f"{random.choice(first_names)} {random.choice(last_names)} {random.randint(0, n)}"
+            for _ in range(n)]
+    for name, func in [("string_sort", lambda: string_sort(keys, casefold=True)),
+                       ("merge_sort", lambda: merge_sort(keys, key=str.casefold)),
+                       ("tim_sort", lambda: tim_sort(keys, key=str.casefold))]:
+        start_time = time.perf_counter()
+        func()
+        print(f"{name:<12}: {time.perf_counter() - start_time:.3f} saniye")
+    
+    print("\n=== Performans (geniş alfabe, ~20 000 farklı CJK ilk karakter) ===")
+    keys = ["".join(chr(random.randint(0x4E00, 0x9FFF)) for _ in range(4)) for _ in range(n)]
+    for name, func in [("string_sort", lambda: string_sort(keys)),
+                       ("tim_sort", lambda: tim_sort(keys))]:
+        start_time = time.perf_counter()
+        func()
+        print(f"{name:<12}: {time.perf_counter() - start_time:.3f} saniye")
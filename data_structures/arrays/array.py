@@ -12,66 +12,343 @@ Zaman Karmaşıklıkları:
 - Güncelleme: O(1)
 """
 
+import importlib
+import math
+import os
+import sys
+import weakref
+from bisect import bisect_left, insort
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain, islice
+
+
+def _import_stdlib_array():
+    """
+    Standart kütüphanedeki array modülünü yükler.
+    
+    Bu dosyanın adı da 'array.py' olduğu için, bu klasördeki bir dosya script
+    olarak çalıştırıldığında (ör. python data_structures/arrays/array.py)
+    klasör sys.path'in başına eklenir ve 'import array' bu dosyayı bulur.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    saved_path = sys.path[:]
+    shadow = sys.modules.pop('array', None) if __name__ == 'array' else None
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != here]
+    try:
+        return importlib.import_module('array')
+    finally:
+        sys.path[:] = saved_path
+        if shadow is not None:
+            sys.modules['array'] = shadow
+
+
+_stdlib_array = _import_stdlib_array()
+
+
+def _hashable(values):
+    """Hashlenebilen değerleri döndürür"""
+    for value in values:
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        yield value
+
+
 class DynamicArray:
-    """Dinamik Array implementasyonu"""
+    """
+    Dinamik Array implementasyonu
+    
+    indexed=True verilirse her değerden bulunduğu pozisyonların sıralı
+    listesine giden bir hash index tutulur. Bu modda index, count, remove
+    ve `in` işlemleri hashlenebilir değerler için O(1) amortized olur;
+    karşılığında ekleme/silme işlemleri kaydırılan elemanların index
+    kayıtlarını da günceller (zaten O(n) olan işlemlere O(n) ek yük).
+    Hashlenemeyen değerler (list, dict, ...) de saklanabilir: pozisyonları
+    ayrı bir sıralı listede tutulur ve aramalarda lineer taranır.
+    
+    lazy_delete=True verilirse pop/remove elemanları kaydırmaz; slotu
+    tombstone (silindi işareti) olarak işaretler. Okuma ve iterasyon
+    tombstone'ları atlar, mantıksal index'ler değişmez. Tombstone oranı
+    TOMBSTONE_RATIO'yu geçince tüm tombstone'lar tek O(n) geçişte
+    temizlenir (compact). Kaydırma gerektiren diğer işlemler (insert,
+    slice, sort, ...) önce compact çağırır.
+    
+    snapshot() O(1) sürede değişmez bir ArraySnapshot döndürür. Snapshot
+    alındıktan sonra yapılan yazmalar, üzerine yazacakları chunk'ların
+    eski halini canlı snapshot'lara kaydeder (copy-on-write); bellek
+    maliyeti snapshot sayısıyla değil değişen chunk sayısıyla orantılıdır.
+    """
     
-    def __init__(self, initial_capacity=10):
+    # Boş slotlara yazılan değer (alt sınıflar değiştirebilir)
+    _empty = None
+    # Değer -> sıralı pozisyon listesi (indexed modda)
+    _positions = None
+    # Hashlenemeyen değerlerin sıralı pozisyonları (indexed modda)
+    _unhashable = None
+    # Silinmiş slotların sıralı fiziksel pozisyonları (lazy_delete modda)
+    _tombstones = None
+    # Kapasitenin altına küçültülmeyeceği sınır
+    _min_capacity = 1
+    # Canlı snapshot'lar (snapshot alındıysa WeakSet)
+    _versions = None
+    # Son alınan ve o zamandan beri yazma görmemiş snapshot
+    _latest_snapshot = None
+    
+    # Tombstone sayısı / fiziksel boyut bu oranı geçince compact yapılır
+    TOMBSTONE_RATIO = 0.5
+    
+    def __init__(self, initial_capacity=10, indexed=False, lazy_delete=False):
         """
         Args:
             initial_capacity (int): Başlangıç kapasitesi
+            indexed (bool): Değer -> pozisyon hash index'i tutulsun mu?
+            lazy_delete (bool): Silmeler tombstone ile ertelensin mi?
         """
         self.capacity = initial_capacity
         self.size = 0
         self.data = [None] * initial_capacity
+        self._min_capacity = max(1, initial_capacity)
+        if indexed:
+            self._positions = {}
+            self._unhashable = []
+        if lazy_delete:
+            self._tombstones = []
     
     def __len__(self):
         """Array'in boyutunu döndürür"""
+        if self._tombstones:
+            return self.size - len(self._tombstones)
         return self.size
     
+    def _live_segments(self):
+        """Tombstone'lar arasında kalan canlı [start, stop) aralıkları"""
+        start = 0
+        for tombstone in self._tombstones:
+            if start < tombstone:
+                yield start, tombstone
+            start = tombstone + 1
+        if start < self.size:
+            yield start, self.size
+    
+    def __iter__(self):
+        """Elemanlar üzerinde kopyasız iterasyon (eleman başına sınır kontrolü yok)"""
+        if self._tombstones:
+            data = self.data
+            return chain.from_iterable(
+                islice(data, start, stop) for start, stop in self._live_segments())
+        return islice(self.data, self.size)
+    
+    def __reversed__(self):
+        """Elemanlar üzerinde sondan başa kopyasız iterasyon"""
+        if self._tombstones:
+            getter = self.data.__getitem__
+            return chain.from_iterable(
+                map(getter, range(stop - 1, start - 1, -1))
+                for start, stop in reversed(list(self._live_segments())))
+        return map(self.data.__getitem__, range(self.size - 1, -1, -1))
+    
+    def view(self, start=0, stop=None, step=1, writable=False):
+        """Elemanları kopyalamadan adımlı bir pencere (ArrayView) döndürür"""
+        if self._tombstones:
+            self.compact()
+        return ArrayView(self, start, stop, step, writable)
+    
+    def _physical(self, index):
+        """
+        Mantıksal index'i buffer pozisyonuna çevirir (lazy_delete modda)
+        
+        k, T[k] - k > index koşulunu sağlayan en küçük tombstone sırasıdır
+        (T[k] - k, T[k]'den önceki canlı eleman sayısı); fiziksel pozisyon
+        index + k olur: O(log t).
+        """
+        tombstones = self._tombstones
+        low, high = 0, len(tombstones)
+        while low < high:
+            mid = (low + high) // 2
+            if tombstones[mid] - mid > index:
+                high = mid
+            else:
+                low = mid + 1
+        return index + low
+    
+    def _logical(self, position):
+        """Buffer pozisyonunu mantıksal index'e çevirir (lazy_delete modda)"""
+        if self._tombstones:
+            return position - bisect_left(self._tombstones, position)
+        return position
+    
     def __getitem__(self, index):
-        """Index ile elemana erişim"""
+        """Index veya slice ile elemana erişim"""
+        if isinstance(index, slice):
+            if self._tombstones:
+                self.compact()
+            result = self._new_empty()
+            result.extend(self.data[self._bounded_slice(index)])
+            return result
+        if self._tombstones:
+            if not 0 <= index < len(self):
+                raise IndexError("Index out of range")
+            return self.data[self._physical(index)]
         if not 0 <= index < self.size:
             raise IndexError("Index out of range")
         return self.data[index]
     
     def __setitem__(self, index, value):
-        """Index ile eleman güncelleme"""
+        """Index veya slice ile eleman güncelleme"""
+        if self._tombstones:
+            self._lazy_setitem(index, value)
+            return
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
         if not 0 <= index < self.size:
             raise IndexError("Index out of range")
+        if self._versions:
+            self._before_write(index, index + 1)
+        if self._positions is not None:
+            self._index_discard(self.data[index], index)
+            self._index_add(value, index)
         self.data[index] = value
     
+    def __contains__(self, value):
+        """Değer array'de var mı? (indexed modda O(1))"""
+        if self._positions is not None:
+            positions = self._index_lookup(value)
+            if positions is not None:
+                return bool(positions)
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
+    
+    def _lazy_setitem(self, index, value):
+        """Tombstone varken güncelleme: tek eleman yerinde, slice compact sonrası"""
+        if isinstance(index, slice) or not 0 <= index < len(self):
+            self.compact()
+            self[index] = value
+            return
+        position = self._physical(index)
+        if self._versions:
+            self._before_write(position, position + 1)
+        if self._positions is not None:
+            self._index_discard(self.data[position], position)
+            self._index_add(value, position)
+        self.data[position] = value
+    
+    def __delitem__(self, index):
+        """Index veya slice ile eleman silme"""
+        if not isinstance(index, slice):
+            self.pop(index)
+            return
+        if self._tombstones:
+            self.compact()
+        start, stop, step = index.indices(self.size)
+        if step == 1:
+            self.delete_range(start, max(start, stop))
+            return
+        # Adımlı slice: kalan elemanlar tek geçişte sola toplanır
+        if self._versions:
+            self._before_write(0, self.size)
+        remaining = self._to_buffer(self.data[:self.size])
+        del remaining[index]
+        old_size = self.size
+        self.size = len(remaining)
+        self.data[:self.size] = remaining
+        self._clear(self.size, old_size)
+        self._shrink_if_sparse()
+        if self._positions is not None:
+            self._rebuild_index()
+    
     def append(self, value):
         """Array'in sonuna eleman ekleme"""
         if self.size == self.capacity:
             self._resize(2 * self.capacity)
+        if self._versions:
+            self._before_write(self.size, self.size + 1)
+        if self._positions is not None:
+            self._index_add(value, self.size)
         self.data[self.size] = value
         self.size += 1
     
+    def extend(self, iterable):
+        """
+        Birden fazla elemanı sona ekleme
+        
+        En fazla bir kez yeniden boyutlandırma yapılır ve elemanlar tek
+        slice ataması ile yazılır: O(k) amortized.
+        """
+        values = self._to_buffer(iterable)
+        count = len(values)
+        self._reserve(self.size + count)
+        if self._versions:
+            self._before_write(self.size, self.size + count)
+        if self._positions is not None:
+            for offset, value in enumerate(values):
+                self._index_add(value, self.size + offset)
+        self.data[self.size:self.size + count] = values
+        self.size += count
+    
     def insert(self, index, value):
         """Belirtilen index'e eleman ekleme"""
+        if self._tombstones:
+            self.compact()
         if not 0 <= index <= self.size:
             raise IndexError("Index out of range")
         
         if self.size == self.capacity:
             self._resize(2 * self.capacity)
         
-        # Elemanları sağa kaydır
-        for i in range(self.size, index, -1):
-            self.data[i] = self.data[i - 1]
+        if self._versions:
+            self._before_write(index, self.size + 1)
+        if self._positions is not None:
+            self._index_shift(index, 1)
+            self._index_add(value, index)
+        
+        # Elemanları blok halinde sağa kaydır
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
         
         self.data[index] = value
         self.size += 1
     
+    def insert_many(self, index, values):
+        """
+        Belirtilen index'e birden fazla eleman ekleme
+        
+        Kuyruk tek blok olarak kaydırılır: k eleman için O(n + k),
+        tek tek insert ile O(n * k) olurdu.
+        """
+        if self._tombstones:
+            self.compact()
+        if not 0 <= index <= self.size:
+            raise IndexError("Index out of range")
+        
+        values = self._to_buffer(values)
+        count = len(values)
+        self._reserve(self.size + count)
+        
+        if self._versions:
+            self._before_write(index, self.size + count)
+        if self._positions is not None:
+            self._index_shift(index, count)
+            for offset, value in enumerate(values):
+                self._index_add(value, index + offset)
+        
+        self.data[index + count:self.size + count] = self.data[index:self.size]
+        self.data[index:index + count] = values
+        self.size += count
+    
     def remove(self, value):
         """İlk bulunan değeri silme"""
-        for i in range(self.size):
-            if self.data[i] == value:
-                self.pop(i)
-                return
-        raise ValueError("Value not found")
+        self.pop(self.index(value))
     
     def pop(self, index=None):
         """Belirtilen index'teki elemanı silme (varsayılan: son eleman)"""
+        if self._tombstones is not None:
+            return self._lazy_pop(index)
+        
         if index is None:
             index = self.size - 1
         
@@ -80,61 +357,486 @@ class DynamicArray:
         
         value = self.data[index]
         
-        # Elemanları sola kaydır
-        for i in range(index, self.size - 1):
-            self.data[i] = self.data[i + 1]
+        if self._versions:
+            self._before_write(index, self.size)
+        if self._positions is not None:
+            self._index_discard(value, index)
+            self._index_shift(index + 1, -1)
+        
+        # Elemanları blok halinde sola kaydır
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
         
         self.size -= 1
-        self.data[self.size] = None  # Garbage collection için
+        self.data[self.size] = self._empty  # Garbage collection için
         
         # Kapasiteyi küçült (opsiyonel)
-        if self.size < self.capacity // 4:
-            self._resize(self.capacity // 2)
+        self._shrink_if_sparse()
         
         return value
     
+    def _lazy_pop(self, index):
+        """
+        Tombstone ile silme: elemanlar kaydırılmaz
+        
+        Slot tombstone olarak işaretlenir (sıralı listeye eklenir); sondaki
+        slotlar ise doğrudan kırpılır. Kapasite burada küçültülmez, sadece
+        compact sırasında küçültülür.
+        """
+        length = len(self)
+        if index is None:
+            index = length - 1
+        if not 0 <= index < length:
+            raise IndexError("Index out of range")
+        
+        position = self._physical(index) if self._tombstones else index
+        value = self.data[position]
+        if self._versions:
+            self._before_write(position, position + 1)
+        if self._positions is not None:
+            self._index_discard(value, position)
+        self.data[position] = self._empty  # Garbage collection için
+        
+        tombstones = self._tombstones
+        if position == self.size - 1:
+            # Sondaki slot ve arkasında kalan tombstone'lar doğrudan kırpılır
+            self.size -= 1
+            while tombstones and tombstones[-1] == self.size - 1:
+                tombstones.pop()
+                self.size -= 1
+        else:
+            insort(tombstones, position)
+            if len(tombstones) > self.TOMBSTONE_RATIO * self.size:
+                self.compact()
+        return value
+    
+    def compact(self):
+        """
+        Tombstone'ları tek geçişte temizleme: O(n)
+        
+        Canlı bölümler blok halinde sola kaydırılır, ardından kapasite
+        gerekirse tek adımda küçültülür.
+        """
+        if not self._tombstones:
+            return
+        if self._versions:
+            self._before_write(self._tombstones[0], self.size)
+        write = 0
+        for start, stop in list(self._live_segments()):
+            if write != start:
+                self.data[write:write + stop - start] = self.data[start:stop]
+            write += stop - start
+        old_size = self.size
+        self.size = write
+        self._tombstones = []
+        self._clear(self.size, old_size)
+        self._shrink_if_sparse()
+        if self._positions is not None:
+            self._rebuild_index()
+    
+    def delete_range(self, start, stop):
+        """
+        [start, stop) aralığındaki elemanları silme
+        
+        Kuyruk tek blok olarak sola kaydırılır: O(n), en fazla bir
+        yeniden boyutlandırma.
+        """
+        if self._tombstones:
+            self.compact()
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError("Index out of range")
+        
+        count = stop - start
+        if count == 0:
+            return
+        
+        if self._versions:
+            self._before_write(start, self.size)
+        if self._positions is not None:
+            for position in range(start, stop):
+                self._index_discard(self.data[position], position)
+            self._index_shift(stop, -count)
+        
+        self.data[start:self.size - count] = self.data[stop:self.size]
+        self.size -= count
+        self._clear(self.size, self.size + count)
+        self._shrink_if_sparse()
+    
+    def _set_slice(self, index, values):
+        """Slice ataması (adım 1 ise uzunluk değişebilir)"""
+        if self._tombstones:
+            self.compact()
+        start, stop, step = index.indices(self.size)
+        values = self._to_buffer(values)
+        
+        if step != 1:
+            positions = range(start, stop, step)
+            if len(values) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} "
+                    f"to extended slice of size {len(positions)}")
+            if self._versions and positions:
+                self._before_write(min(positions[0], positions[-1]),
+                                   max(positions[0], positions[-1]) + 1)
+            if self._positions is not None:
+                for position, value in zip(positions, values):
+                    self._index_discard(self.data[position], position)
+                    self._index_add(value, position)
+            self.data[self._bounded_slice(index)] = values
+            return
+        
+        stop = max(start, stop)
+        delta = len(values) - (stop - start)
+        if delta > 0:
+            self._reserve(self.size + delta)
+        if self._versions:
+            self._before_write(start, max(self.size, self.size + delta))
+        if self._positions is not None:
+            for position in range(start, stop):
+                self._index_discard(self.data[position], position)
+            self._index_shift(stop, delta)
+            for offset, value in enumerate(values):
+                self._index_add(value, start + offset)
+        if delta != 0:
+            self.data[stop + delta:self.size + delta] = self.data[stop:self.size]
+        self.data[start:start + len(values)] = values
+        
+        old_size = self.size
+        self.size += delta
+        if delta < 0:
+            self._clear(self.size, old_size)
+            self._shrink_if_sparse()
+    
+    def _bounded_slice(self, index):
+        """Slice'ı kapasite değil boyut sınırlarına göre normalize etme"""
+        positions = range(*index.indices(self.size))
+        if not positions:
+            return slice(0, 0)
+        step = positions.step
+        last = positions[-1]
+        if step > 0:
+            return slice(positions[0], last + 1, step)
+        # Negatif adımda -1, buffer'ın sonunu değil 0'ın öncesini ifade eder
+        return slice(positions[0], last - 1 if last > 0 else None, step)
+    
+    def _reserve(self, min_capacity):
+        """Kapasiteyi tek adımda en az min_capacity'ye çıkarma"""
+        if min_capacity > self.capacity:
+            self._resize(max(2 * self.capacity, min_capacity))
+    
+    def _shrink_if_sparse(self):
+        """
+        Doluluk oranı 1/4'ün altına düştüyse kapasiteyi tek adımda küçültme
+        
+        Büyütme %100 dolulukta (2x), küçültme %25'in altında (1/2x) yapılır;
+        aradaki bant sınırda art arda ekleme/silmenin sürekli yeniden
+        boyutlandırma yapmasını (thrashing) engeller. Kapasite başlangıç
+        kapasitesinin altına indirilmez; lazy_delete modda sadece compact
+        sırasında küçültülür.
+        """
+        new_capacity = self.capacity
+        while new_capacity // 2 >= self._min_capacity and self.size < new_capacity // 4:
+            new_capacity //= 2
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+    
     def _resize(self, new_capacity):
-        """Array'i yeniden boyutlandırma"""
-        new_data = [None] * new_capacity
-        for i in range(self.size):
-            new_data[i] = self.data[i]
-        self.data = new_data
+        """
+        Array'i yerinde yeniden boyutlandırma
+        
+        Liste nesnesi korunur; büyütme tek extend, küçültme tek del ile
+        yapılır (eleman eleman kopyalama yok).
+        """
+        if new_capacity > self.capacity:
+            self.data.extend([self._empty] * (new_capacity - self.capacity))
+        else:
+            del self.data[new_capacity:]
         self.capacity = new_capacity
     
+    def _clear(self, start, stop):
+        """Kullanılmayan slotları boşaltma (Garbage collection için)"""
+        self.data[start:stop] = [self._empty] * (stop - start)
+    
+    def _to_buffer(self, values):
+        """Değerleri slice atamasına uygun bir buffer'a çevirme"""
+        return list(values)
+    
+    def _new_empty(self):
+        """Aynı türden boş bir array oluşturma"""
+        return DynamicArray()
+    
+    def _index_add(self, value, position):
+        """Index'e (değer, pozisyon) kaydı ekleme"""
+        try:
+            positions = self._positions.get(value)
+        except TypeError:
+            insort(self._unhashable, position)
+            return
+        if positions is None:
+            self._positions[value] = [position]
+        elif positions[-1] < position:
+            positions.append(position)
+        else:
+            insort(positions, position)
+    
+    def _index_discard(self, value, position):
+        """Index'ten (değer, pozisyon) kaydını silme"""
+        try:
+            positions = self._positions[value]
+        except TypeError:
+            del self._unhashable[bisect_left(self._unhashable, position)]
+            return
+        if len(positions) == 1:
+            del self._positions[value]
+        elif positions[-1] == position:
+            positions.pop()
+        else:
+            del positions[bisect_left(positions, position)]
+    
+    def _index_shift(self, start, delta):
+        """start ve sonrasındaki pozisyonları delta kadar kaydırma"""
+        tail = self.data[start:self.size]
+        try:
+            values = set(tail)
+        except TypeError:
+            values = set(_hashable(tail))
+        for positions in chain(map(self._positions.__getitem__, values), [self._unhashable]):
+            first = bisect_left(positions, start)
+            positions[first:] = [position + delta for position in positions[first:]]
+    
+    def _rebuild_index(self):
+        """Index'i baştan kurma: O(n)"""
+        self._positions = {}
+        self._unhashable = []
+        for position in range(self.size):
+            self._index_add(self.data[position], position)
+    
+    def _index_lookup(self, value):
+        """
+        Değerin sıralı fiziksel pozisyonları (indexed modda)
+        
+        Hashlenemeyen elemanlar ayrıca lineer taranır. Aranan değer
+        hashlenemiyorsa None döner ve çağıran tüm array'i tarar: dict'te
+        ona eşit hashlenebilir bir değer olabilir (ör. set ve frozenset).
+        """
+        try:
+            positions = self._positions.get(value, [])
+        except TypeError:
+            return None
+        matches = [position for position in self._unhashable if self.data[position] == value]
+        if matches:
+            return sorted(positions + matches)
+        return positions
+    
     def index(self, value):
-        """Değerin index'ini bulma"""
-        for i in range(self.size):
-            if self.data[i] == value:
+        """Değerin index'ini bulma (indexed modda O(1))"""
+        if self._positions is not None:
+            positions = self._index_lookup(value)
+            if positions is not None:
+                if not positions:
+                    raise ValueError("Value not found")
+                return self._logical(positions[0])
+        for i, item in enumerate(self):
+            if item == value:
                 return i
         raise ValueError("Value not found")
     
     def count(self, value):
-        """Değerin kaç kez geçtiğini sayma"""
+        """Değerin kaç kez geçtiğini sayma (indexed modda O(1))"""
+        if self._positions is not None:
+            positions = self._index_lookup(value)
+            if positions is not None:
+                return len(positions)
         count = 0
-        for i in range(self.size):
-            if self.data[i] == value:
+        for item in self:
+            if item == value:
                 count += 1
         return count
     
+    @contextmanager
+    def _live_region(self):
+        """
+        Buffer'ı geçici olarak boyut kadar kısaltır
+        
+        Böylece canlı bölge, kopyalanmadan buffer'ın kendi yerinde çalışan
+        metotlarıyla (list.sort, reverse) işlenebilir. Kapasite fazlası
+        işlem sonunda geri eklenir.
+        """
+        if self._tombstones:
+            self.compact()
+        capacity = self.capacity
+        del self.data[self.size:]
+        self.capacity = self.size
+        try:
+            yield self.data
+        finally:
+            self._resize(capacity)
+    
     def reverse(self):
-        """Array'i ters çevirme"""
-        left, right = 0, self.size - 1
-        while left < right:
-            self.data[left], self.data[right] = self.data[right], self.data[left]
-            left += 1
-            right -= 1
+        """Array'i yerinde ters çevirme"""
+        if self._versions:
+            self._before_write(0, self.size)
+        with self._live_region() as live:
+            live.reverse()
+        if self._positions is not None:
+            self._rebuild_index()
     
     def sort(self):
-        """Array'i sıralama (built-in sort kullanarak)"""
-        self.data[:self.size] = sorted(self.data[:self.size])
+        """Array'i yerinde sıralama (built-in sort kullanarak)"""
+        if self._versions:
+            self._before_write(0, self.size)
+        with self._live_region() as live:
+            live.sort()
+        if self._positions is not None:
+            self._rebuild_index()
+    
+    def snapshot(self):
+        """
+        Array'in o anki halinin değişmez bir kopyasını O(1) sürede döndürür
+        
+        Arada yazma olmadıysa art arda alınan snapshot'lar aynı nesneyi
+        paylaşır. lazy_delete modda bekleyen tombstone'lar önce compact
+        ile temizlenir.
+        """
+        if self._tombstones:
+            self.compact()
+        latest = self._latest_snapshot() if self._latest_snapshot is not None else None
+        if latest is not None:
+            return latest
+        if self._versions is None:
+            self._versions = weakref.WeakSet()
+        snapshot = ArraySnapshot(self)
+        self._versions.add(snapshot)
+        self._latest_snapshot = weakref.ref(snapshot)
+        return snapshot
+    
+    def _before_write(self, start, stop):
+        """
+        [start, stop) buffer aralığına yazılmadan önce çağrılır
+        
+        Canlı snapshot'ların görebildiği ve henüz kaydetmedikleri chunk'lar
+        bir kez kopyalanır; aynı chunk'ı kaydetmesi gereken snapshot'lar
+        tek kopyayı paylaşır.
+        """
+        self._latest_snapshot = None
+        chunk_size = ArraySnapshot.CHUNK_SIZE
+        saved = {}
+        for snapshot in list(self._versions):
+            if start >= snapshot.size:
+                continue  # Snapshot'ın görmediği bölge (ör. sona ekleme)
+            last = min(stop, snapshot.size) - 1
+            for chunk in range(start // chunk_size, last // chunk_size + 1):
+                if chunk in snapshot.chunks:
+                    continue
+                copy = saved.get(chunk)
+                if copy is None:
+                    begin = chunk * chunk_size
+                    copy = self._to_buffer(self.data[begin:min(begin + chunk_size, self.size)])
+                    saved[chunk] = copy
+                snapshot.chunks[chunk] = copy
     
     def __str__(self):
         """String temsili"""
-        return str(self.data[:self.size])
+        return "[" + ", ".join(map(repr, self)) + "]"
     
     def __repr__(self):
         """Detaylı string temsili"""
-        return f"DynamicArray(size={self.size}, capacity={self.capacity}, data={self.data[:self.size]})"
+        return f"DynamicArray(size={len(self)}, capacity={self.capacity}, data={self})"
+
+
+class TypedDynamicArray(DynamicArray):
+    """
+    Tipli ve sıkıştırılmış Dinamik Array
+    
+    Elemanlar Python nesnesi olarak değil, array modülü ile bitişik bir
+    bellek bloğunda ham değer olarak saklanır. Örneğin 'q' (int64) tipinde
+    eleman başına 8 byte harcanır; list tabanlı DynamicArray'de ise her int
+    için ~28 byte'lık nesne + 8 byte'lık işaretçi gerekir.
+    
+    Desteklenen tip kodları array modülündekilerle aynıdır
+    ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd').
+    """
+    
+    _empty = 0
+    
+    def __init__(self, typecode='q', initial_capacity=10, indexed=False, lazy_delete=False):
+        """
+        Args:
+            typecode (str): array modülü tip kodu (varsayılan: 'q', int64)
+            initial_capacity (int): Başlangıç kapasitesi
+            indexed (bool): Değer -> pozisyon hash index'i tutulsun mu?
+            lazy_delete (bool): Silmeler tombstone ile ertelensin mi?
+        """
+        self.typecode = typecode
+        self.capacity = initial_capacity
+        self.size = 0
+        self.data = _stdlib_array.array(typecode)
+        self.data.frombytes(bytes(initial_capacity * self.data.itemsize))
+        self._min_capacity = max(1, initial_capacity)
+        if indexed:
+            self._positions = {}
+            self._unhashable = []
+        if lazy_delete:
+            self._tombstones = []
+    
+    @property
+    def itemsize(self):
+        """Eleman başına byte sayısı"""
+        return self.data.itemsize
+    
+    @property
+    def nbytes(self):
+        """Buffer'ın kapasite dahil toplam byte boyutu"""
+        return self.capacity * self.data.itemsize
+    
+    def _resize(self, new_capacity):
+        """
+        Buffer'ı yerinde boyutlandırma
+        
+        array nesnesi realloc ile büyütülür/küçültülür; elemanlar Python
+        seviyesinde tek tek kopyalanmaz.
+        """
+        if new_capacity > self.capacity:
+            self.data.frombytes(bytes((new_capacity - self.capacity) * self.data.itemsize))
+        else:
+            del self.data[new_capacity:]
+        self.capacity = new_capacity
+    
+    def _clear(self, start, stop):
+        """Ham değerler nesne tutmadığı için boşaltmaya gerek yok"""
+    
+    def _to_buffer(self, values):
+        """Değerleri aynı tip kodlu bir array'e çevirme"""
+        return _stdlib_array.array(self.typecode, values)
+    
+    def _new_empty(self):
+        """Aynı tip kodlu boş bir array oluşturma"""
+        return TypedDynamicArray(self.typecode)
+    
+    def sort(self):
+        """
+        Array'i sıralama (built-in sort kullanarak)
+        
+        array nesnesinin yerinde sort metodu olmadığı için canlı bölge
+        bir kez kopyalanarak sıralanır.
+        """
+        if self._tombstones:
+            self.compact()
+        if self._versions:
+            self._before_write(0, self.size)
+        self.data[:self.size] = _stdlib_array.array(self.typecode, sorted(self.data[:self.size]))
+        if self._positions is not None:
+            self._rebuild_index()
+    
+    def tolist(self):
+        """Elemanları Python listesi olarak döndürür"""
+        if self._tombstones:
+            return list(self)
+        return self.data[:self.size].tolist()
+    
+    def __repr__(self):
+        """Detaylı string temsili"""
+        return (f"TypedDynamicArray(typecode={self.typecode!r}, size={len(self)}, "
+                f"capacity={self.capacity}, data={self.tolist()})")
 
 
 class StaticArray:
@@ -151,6 +853,16 @@ class StaticArray:
     def __len__(self):
         return self.size
     
+    def __iter__(self):
+        return iter(self.data)
+    
+    def __reversed__(self):
+        return reversed(self.data)
+    
+    def view(self, start=0, stop=None, step=1, writable=False):
+        """Elemanları kopyalamadan adımlı bir pencere (ArrayView) döndürür"""
+        return ArrayView(self, start, stop, step, writable)
+    
     def __getitem__(self, index):
         if not 0 <= index < self.size:
             raise IndexError("Index out of range")
@@ -168,6 +880,328 @@ class StaticArray:
         return f"StaticArray(size={self.size}, data={self.data})"
 
 
+class RingArray:
+    """
+    Sabit pencereli dairesel (ring buffer) array
+    
+    Elemanlar kapasite boyutunda bir StaticArray'de tutulur. Pencere
+    dolduğunda push en eski elemanın üzerine yazar; index 0 her zaman
+    penceredeki en eski elemandır. Pencere üzerindeki toplam, minimum ve
+    maksimum her push'ta O(1) amortized sürede güncellenir (min/max için
+    monotonik kuyruklar kullanılır).
+    
+    Toplam Neumaier (telafili) toplama ile tutulur: büyük bir değer
+    pencereden çıktığında küçük değerler kaybolmaz. Float toplamlar ayrıca
+    her capacity push'ta buffer'dan math.fsum ile yeniden hesaplanır
+    (amortized O(1)); kalan yuvarlama hatası birikmez.
+    """
+    
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (int): Pencere boyutu
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.buffer = StaticArray(capacity)
+        self.head = 0  # En eski elemanın buffer pozisyonu
+        self.size = 0
+        self.total = 0
+        self._compensation = 0  # Neumaier telafisi: total'a eklenemeyen düşük bitler
+        self._since_resync = 0
+        self._pushed = 0  # Toplam push sayısı (monotonik kuyruk sıra numarası)
+        self._min_queue = deque()  # (sıra no, değer), değerler artan
+        self._max_queue = deque()  # (sıra no, değer), değerler azalan
+    
+    def __len__(self):
+        return self.size
+    
+    @property
+    def full(self):
+        """Pencere dolu mu?"""
+        return self.size == self.capacity
+    
+    def push(self, value):
+        """
+        Pencereye yeni eleman ekleme: O(1) amortized
+        
+        Returns:
+            Pencere doluysa üzerine yazılan en eski eleman, değilse None
+        """
+        evicted = None
+        if self.size == self.capacity:
+            evicted = self.buffer.data[self.head]
+            self.buffer.data[self.head] = value
+            self.head = (self.head + 1) % self.capacity
+            self._add(-evicted)
+        else:
+            self.buffer.data[(self.head + self.size) % self.capacity] = value
+            self.size += 1
+        self._add(value)
+        
+        self._since_resync += 1
+        if self._since_resync >= self.capacity:
+            self._resync()
+        
+        # Pencereden çıkan sıra numaralarını kuyruklardan at
+        sequence = self._pushed
+        self._pushed += 1
+        oldest = self._pushed - self.size
+        min_queue, max_queue = self._min_queue, self._max_queue
+        while min_queue and min_queue[-1][1] >= value:
+            min_queue.pop()
+        min_queue.append((sequence, value))
+        if min_queue[0][0] < oldest:
+            min_queue.popleft()
+        while max_queue and max_queue[-1][1] <= value:
+            max_queue.pop()
+        max_queue.append((sequence, value))
+        if max_queue[0][0] < oldest:
+            max_queue.popleft()
+        return evicted
+    
+    def _add(self, value):
+        """Neumaier toplama adımı (int'lerde telafi hep 0 kalır)"""
+        total = self.total
+        new_total = total + value
+        if abs(total) >= abs(value):
+            self._compensation += (total - new_total) + value
+        else:
+            self._compensation += (value - new_total) + total
+        self.total = new_total
+    
+    def _resync(self):
+        """Float toplamı buffer'dan tam olarak yeniden hesaplar: O(capacity)"""
+        self._since_resync = 0
+        if isinstance(self.total, float) or isinstance(self._compensation, float):
+            values = list(self)
+            self.total = math.fsum(values)
+            # Yuvarlanan kısım telafide kalır (1e20 + 1.0 gibi)
+            values.append(-self.total)
+            self._compensation = math.fsum(values)
+    
+    def extend(self, iterable):
+        """Birden fazla elemanı sırayla pencereye ekleme"""
+        for value in iterable:
+            self.push(value)
+    
+    def clear(self):
+        """Pencereyi boşaltma"""
+        self.buffer = StaticArray(self.capacity)
+        self.head = 0
+        self.size = 0
+        self.total = 0
+        self._compensation = 0
+        self._since_resync = 0
+        self._min_queue.clear()
+        self._max_queue.clear()
+    
+    def __getitem__(self, index):
+        """En eskiden başlayan mantıksal index ile erişim"""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        return self.buffer.data[(self.head + index) % self.capacity]
+    
+    def __iter__(self):
+        first, second = self.segments()
+        return chain(first, second)
+    
+    def __reversed__(self):
+        first, second = self.segments()
+        return chain(reversed(second), reversed(first))
+    
+    def segments(self):
+        """
+        Penceredeki elemanları sırayla kapsayan iki bitişik bölgeyi kopyasız
+        döndürür (ArrayView)
+        
+        Pencere buffer'ın sonundan başına sarmıyorsa ikinci bölge boştur.
+        """
+        end = self.head + self.size
+        if end <= self.capacity:
+            return self.buffer.view(self.head, end), self.buffer.view(0, 0)
+        return (self.buffer.view(self.head, self.capacity),
+                self.buffer.view(0, end - self.capacity))
+    
+    def sum(self):
+        """Penceredeki elemanların toplamı: O(1)"""
+        return self.total + self._compensation
+    
+    def mean(self):
+        """Penceredeki elemanların ortalaması: O(1)"""
+        if not self.size:
+            raise ValueError("mean() of empty RingArray")
+        return self.sum() / self.size
+    
+    def min(self):
+        """Penceredeki en küçük eleman: O(1)"""
+        if not self.size:
+            raise ValueError("min() of empty RingArray")
+        return self._min_queue[0][1]
+    
+    def max(self):
+        """Penceredeki en büyük eleman: O(1)"""
+        if not self.size:
+            raise ValueError("max() of empty RingArray")
+        return self._max_queue[0][1]
+    
+    def tolist(self):
+        """Penceredeki elemanları en eskiden en yeniye liste olarak döndürür"""
+        return list(self)
+    
+    def __str__(self):
+        return str(self.tolist())
+    
+    def __repr__(self):
+        return f"RingArray(capacity={self.capacity}, size={self.size}, data={self.tolist()})"
+
+
+class ArrayView:
+    """
+    Array üzerinde kopyasız, adımlı pencere
+    
+    Görünüm kaynak array'in buffer'ını doğrudan okur; kaynakta yapılan
+    değişiklikler görünümde de görülür. writable=True ise yazma işlemleri
+    kaynağın __setitem__ metodu üzerinden yapılır (indexed mod gibi ek
+    yapılar güncel kalır). Görünümün uzunluğu oluşturulduğu anda sabitlenir.
+    """
+    
+    def __init__(self, source, start=0, stop=None, step=1, writable=False):
+        """
+        Args:
+            source: DynamicArray, StaticArray veya başka bir ArrayView
+            start, stop, step: Python slice semantiği ile pencere sınırları
+            writable (bool): Görünüm üzerinden yazmaya izin verilsin mi?
+        """
+        if isinstance(source, ArrayView):
+            # Görünümün görünümü: pozisyonlar doğrudan kaynağa çevrilir
+            self.positions = source.positions[start:stop:step]
+            self.source = source.source
+            self.writable = writable and source.writable
+        else:
+            self.positions = range(*slice(start, stop, step).indices(len(source)))
+            self.source = source
+            self.writable = writable
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def _check_source(self):
+        """Kaynak array görünümün son pozisyonundan kısa olmamalı"""
+        if self.positions and max(self.positions[0], self.positions[-1]) >= self.source.size:
+            raise IndexError("Source array has shrunk")
+    
+    def _position(self, index):
+        """Görünüm index'ini kaynak buffer pozisyonuna çevirir"""
+        if not 0 <= index < len(self.positions):
+            raise IndexError("Index out of range")
+        position = self.positions[index]
+        if position >= self.source.size:
+            raise IndexError("Source array has shrunk")
+        return position
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArrayView(self, index.start, index.stop, index.step, self.writable)
+        return self.source.data[self._position(index)]
+    
+    def __setitem__(self, index, value):
+        if not self.writable:
+            raise TypeError("ArrayView is read-only")
+        self.source[self._position(index)] = value
+    
+    def __iter__(self):
+        self._check_source()
+        return map(self.source.data.__getitem__, self.positions)
+    
+    def __reversed__(self):
+        self._check_source()
+        return map(self.source.data.__getitem__, reversed(self.positions))
+    
+    def tolist(self):
+        """Görünümdeki elemanları Python listesine kopyalar"""
+        return list(self)
+    
+    def __str__(self):
+        return "[" + ", ".join(map(repr, self)) + "]"
+    
+    def __repr__(self):
+        positions = self.positions
+        return (f"ArrayView(start={positions.start}, stop={positions.stop}, "
+                f"step={positions.step}, writable={self.writable}, data={self})")
+
+
+class ArraySnapshot:
+    """
+    DynamicArray'in değişmez (immutable) bir sürümü
+    
+    Snapshot alındığında hiçbir eleman kopyalanmaz; değişmemiş chunk'lar
+    doğrudan kaynak array'in buffer'ından okunur. Kaynakta bir chunk'a
+    yazılmadan hemen önce o chunk'ın eski hali bu snapshot'a kaydedilir
+    (copy-on-write). Böylece okuyucular yazıcılar çalışırken tutarlı bir
+    görünüme sahip olur.
+    """
+    
+    # Copy-on-write birimi (eleman sayısı)
+    CHUNK_SIZE = 256
+    
+    def __init__(self, source):
+        """
+        Args:
+            source (DynamicArray): Snapshot'ı alınan array
+        """
+        self.source = source
+        self.size = source.size
+        # chunk no -> snapshot anındaki chunk içeriği (sadece değişenler)
+        self.chunks = {}
+    
+    def __len__(self):
+        return self.size
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        chunk, offset = divmod(index, self.CHUNK_SIZE)
+        saved = self.chunks.get(chunk)
+        if saved is not None:
+            return saved[offset]
+        return self.source.data[index]
+    
+    def __setitem__(self, index, value):
+        raise TypeError("ArraySnapshot is immutable")
+    
+    def __iter__(self):
+        chunk_size = self.CHUNK_SIZE
+        for begin in range(0, self.size, chunk_size):
+            end = min(begin + chunk_size, self.size)
+            saved = self.chunks.get(begin // chunk_size)
+            if saved is not None:
+                yield from islice(saved, end - begin)
+            else:
+                yield from islice(self.source.data, begin, end)
+    
+    def __contains__(self, value):
+        return any(item == value for item in self)
+    
+    def tolist(self):
+        """Snapshot'taki elemanları Python listesine kopyalar"""
+        return list(self)
+    
+    @property
+    def copied_chunks(self):
+        """Copy-on-write ile kopyalanmış chunk sayısı"""
+        return len(self.chunks)
+    
+    def __str__(self):
+        return "[" + ", ".join(map(repr, self)) + "]"
+    
+    def __repr__(self):
+        return f"ArraySnapshot(size={self.size}, copied_chunks={self.copied_chunks}, data={self})"
+
+
 # Kullanım örnekleri
 if __name__ == "__main__":
     print("=== Dinamik Array Örnekleri ===")
@@ -220,4 +1254,22 @@ if __name__ == "__main__":
     static_arr[2] = 3
     print(f"Elemanlar atandıktan sonra: {static_arr}")
     
-    print(f"Index 1'deki eleman: {static_arr[1]}") 
\ No newline at end of file
+    print(f"Index 1'deki eleman: {static_arr[1]}")
+    
+    print("\n=== Dairesel Array (Kayan Pencere) Örnekleri ===")
+    
+    window = RingArray(3)
+    for measurement in (5, 1, 4, 2, 8):
+        window.push(measurement)
+    print(f"Son 3 ölçüm: {window}")
+    print(f"Toplam: {window.sum()}, ortalama: {window.mean():.2f}, "
+          f"min: {window.min()}, max: {window.max()}")
+    
+    print("\n=== Tipli Dinamik Array Örnekleri ===")
+    
+    typed_arr = TypedDynamicArray('q')
+    for value in (30, 10, 20):
+        typed_arr.append(value)
+    typed_arr.sort()
+    print(f"Sıralanmış tipli array: {typed_arr}")
+    print(f"Eleman başına byte: {typed_arr.itemsize}") 
\ No newline at end of file
@@ -0,0 +1,308 @@
+"""
+Bit Array (Bitset)
+
+Bu modül, her elemanı tek bir bit olarak saklayan sabit boyutlu bir bit
+array içerir. 100 milyon bayrak için ~12 MB yeterlidir; Python bool
+listesinde bu sayı ~800 MB, set'te ise çok daha fazladır.
+
+Yapı:
+- Bitler bir bytearray'de tutulur; i. bit, i // 8. byte'ın i % 8. bitidir
+  (little-endian). Bu sayede bytearray int.from_bytes(..., 'little') ile
+  tek bir büyük tamsayıya çevrildiğinde i. bit tamsayının i. biti olur
+- Toplu işlemler (and/or/xor/andnot) tamsayı işlemleriyle C seviyesinde
+  word word yapılır
+- rank/select için her RANK_BLOCK_BYTES byte'lık blok başına kümülatif
+  bit sayısı tutan bir dizin yazmalardan sonra ilk ihtiyaçta yeniden kurulur
+
+Zaman Karmaşıklıkları:
+- Erişim / Güncelleme: O(1)
+- and / or / xor / andnot / popcount: O(n / w)
+- Sonraki set biti bulma: O(n / w) en kötü durumda
+- rank / select: O(1) / O(log n) (dizin kurulduktan sonra)
+"""
+
+import re
+from bisect import bisect_right
+
+
+# Her byte değeri için set bit sayısı (bytes.translate ile popcount)
+_POPCOUNT = bytes(bin(value).count('1') for value in range(256))
+_INVERT = bytes(255 - value for value in range(256))
+_NONZERO_BYTE = re.compile(b'[^\x00]')
+_NONFULL_BYTE = re.compile(b'[^\xff]')
+
+
+class BitArray:
+    """Bit başına bir eleman saklayan sabit boyutlu Bit Array"""
+    
+    # rank dizininin blok boyutu (byte)
+    RANK_BLOCK_BYTES = 64
+    
+    def __init__(self, size, fill=False):
+        """
+        Args:
+            size (int): Bit sayısı
+            fill (bool): Tüm bitlerin başlangıç değeri
+        """
+        if size < 0:
+            raise ValueError("Size must be non-negative")
+        self.size = size
+        self.data = bytearray((size + 7) // 8)
+        self._ranks = None
+        if fill:
+            self.setall(True)
+    
+    @classmethod
+    def from_indices(cls, size, indices):
+        """Verilen index'leri set edilmiş bir BitArray oluşturur"""
+        bits = cls(size)
+        for index in indices:
+            bits.add(index)
+        return bits
+    
+    def __len__(self):
+        return self.size
+    
+    @property
+    def nbytes(self):
+        """Bitlerin kapladığı byte sayısı"""
+        return len(self.data)
+    
+    def __getitem__(self, index):
+        """index'teki bit (bool)"""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        return bool(self.data[index >> 3] >> (index & 7) & 1)
+    
+    def __setitem__(self, index, value):
+        """index'teki biti set etme / temizleme"""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        if value:
+            self.data[index >> 3] |= 1 << (index & 7)
+        else:
+            self.data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        self._ranks = None
+    
+    def add(self, index):
+        """index'teki biti set etme (set arayüzü, ör. BFS/DFS visited)"""
+        self[index] = True
+    
+    def discard(self, index):
+        """index'teki biti temizleme (set arayüzü)"""
+        self[index] = False
+    
+    def __contains__(self, index):
+        """index'teki bit set mi? (aralık dışındaki index'ler için False)"""
+        return (0 <= index < self.size
+                and self.data[index >> 3] >> (index & 7) & 1 == 1)
+    
+    def __iter__(self):
+        """Bitleri sırayla bool olarak döndürür"""
+        data = self.data
+        return (bool(data[index >> 3] >> (index & 7) & 1) for index in range(self.size))
+    
+    def setall(self, value):
+        """Tüm bitleri set etme / temizleme"""
+        self.data[:] = (b'\xff' if value else b'\x00') * len(self.data)
+        self._clear_padding()
+        self._ranks = None
+    
+    def _clear_padding(self):
+        """Son byte'taki size dışında kalan bitleri sıfırlar"""
+        extra = self.size & 7
+        if extra:
+            self.data[-1] &= (1 << extra) - 1
+    
+    # Toplu işlemler
+    
+    def _to_int(self):
+        return int.from_bytes(self.data, 'little')
+    
+    def _store_int(self, value):
+        self.data[:] = value.to_bytes(len(self.data), 'little')
+        self._ranks = None
+    
+    def _check_same_size(self, other):
+        if not isinstance(other, BitArray):
+            return NotImplemented
+        if other.size != self.size:
+            raise ValueError("BitArray sizes differ")
+        return other
+    
+    def _combined(self, other, operation):
+        """operation(self, other) sonucunu yeni bir BitArray olarak döndürür"""
+        if self._check_same_size(other) is NotImplemented:
+            return NotImplemented
+        result = BitArray(self.size)
+        result._store_int(operation(self._to_int(), other._to_int()))
+        return result
+    
+    def _update(self, other, operation):
+        """operation(self, other) sonucunu yerinde yazar"""
+        if self._check_same_size(other) is NotImplemented:
+            return NotImplemented
+        self._store_int(operation(self._to_int(), other._to_int()))
+        return self
+    
+    def __and__(self, other):
+        return self._combined(other, lambda a, b: a & b)
+    
+    def __or__(self, other):
+        return self._combined(other, lambda a, b: a | b)
+    
+    def __xor__(self, other):
+        return self._combined(other, lambda a, b: a ^ b)
+    
+    def __iand__(self, other):
+        return self._update(other, lambda a, b: a & b)
+    
+    def __ior__(self, other):
+        return self._update(other, lambda a, b: a | b)
+    
+    def __ixor__(self, other):
+        return self._update(other, lambda a, b: a ^ b)
+    
+    def andnot(self, other):
+        """self & ~other (self'te olup other'da olmayan bitler)"""
+        return self._combined(other, lambda a, b: a & ~b)
+    
+    def iandnot(self, other):
+        """self &= ~other (yerinde)"""
+        return self._update(other, lambda a, b: a & ~b)
+    
+    def __invert__(self):
+        result = BitArray(self.size)
+        result.data[:] = self.data.translate(_INVERT)
+        result._clear_padding()
+        return result
+    
+    def __eq__(self, other):
+        if not isinstance(other, BitArray):
+            return NotImplemented
+        return self.size == other.size and self.data == other.data
+    
+    # Sayma ve arama
+    
+    def count(self, value=True):
+        """Set (veya value=False ise temiz) bit sayısı (popcount)"""
+        ones = sum(self.data.translate(_POPCOUNT))
+        return ones if value else self.size - ones
+    
+    def find_next(self, start=0):
+        """
+        start'tan itibaren ilk set bitin index'i (yoksa -1)
+        
+        Sıfır olmayan ilk byte regex ile C seviyesinde bulunur.
+        """
+        return self._find(start, _NONZERO_BYTE, 0)
+    
+    def find_next_clear(self, start=0):
+        """start'tan itibaren ilk temiz bitin index'i (yoksa -1)"""
+        return self._find(start, _NONFULL_BYTE, 0xFF)
+    
+    def _find(self, start, pattern, skip):
+        if start < 0:
+            start = 0
+        if start >= self.size:
+            return -1
+        data = self.data
+        byte = start >> 3
+        
+        # İlk byte'ın start'tan önceki bitleri atlanır
+        current = (data[byte] ^ skip) >> (start & 7) << (start & 7)
+        if not current:
+            match = pattern.search(data, byte + 1)
+            if match is None:
+                return -1
+            byte = match.start()
+            current = data[byte] ^ skip
+        index = (byte << 3) + (current & -current).bit_length() - 1
+        return index if index < self.size else -1
+    
+    def iter_set(self):
+        """Set bitlerin index'lerini artan sırada döndürür"""
+        index = self.find_next(0)
+        while index != -1:
+            yield index
+            index = self.find_next(index + 1)
+    
+    def _rank_directory(self):
+        """Blok başına kümülatif set bit sayıları (gerekirse yeniden kurulur)"""
+        if self._ranks is None:
+            block = self.RANK_BLOCK_BYTES
+            counts = self.data.translate(_POPCOUNT)
+            ranks = [0]
+            total = 0
+            for begin in range(0, len(counts), block):
+                total += sum(counts[begin:begin + block])
+                ranks.append(total)
+            self._ranks = ranks
+        return self._ranks
+    
+    def rank(self, index):
+        """[0, index) aralığındaki set bit sayısı"""
+        if not 0 <= index <= self.size:
+            raise IndexError("Index out of range")
+        ranks = self._rank_directory()
+        byte = index >> 3
+        block_start = byte - byte % self.RANK_BLOCK_BYTES
+        total = ranks[block_start // self.RANK_BLOCK_BYTES]
+        total += sum(self.data[block_start:byte].translate(_POPCOUNT))
+        if index & 7:
+            total += _POPCOUNT[self.data[byte] & ((1 << (index & 7)) - 1)]
+        return total
+    
+    def select(self, k):
+        """k. (0 tabanlı) set bitin index'i"""
+        ranks = self._rank_directory()
+        if not 0 <= k < ranks[-1]:
+            raise IndexError("Rank out of range")
+        block = bisect_right(ranks, k) - 1
+        remaining = k - ranks[block]
+        data = self.data
+        byte = block * self.RANK_BLOCK_BYTES
+        while _POPCOUNT[data[byte]] <= remaining:
+            remaining -= _POPCOUNT[data[byte]]
+            byte += 1
+        current = data[byte]
+        for _ in range(remaining):
+            current &= current - 1  # En düşük set biti temizle
+        return (byte << 3) + (current & -current).bit_length() - 1
+    
+    def __str__(self):
+        return ''.join('1' if bit else '0' for bit in self)
+    
+    def __repr__(self):
+        return f"BitArray(size={self.size}, count={self.count()})"
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import sys
+    import time
+    
+    print("=== Bit Array Örnekleri ===")
+    
+    bits = BitArray.from_indices(16, [1, 3, 5, 8, 13])
+    print(f"Bitler: {bits}")
+    print(f"Set bit sayısı: {bits.count()}")
+    print(f"4'ten sonraki ilk set bit: {bits.find_next(4)}")
+    print(f"rank(9) = {bits.rank(9)}, select(3) = {bits.select(3)}")
+    
+    evens = BitArray.from_indices(16, range(0, 16, 2))
+    print(f"Çift index'ler:        {evens}")
+    print(f"Ortak (and):           {bits & evens}")
+    print(f"Çift olmayan (andnot): {bits.andnot(evens)}")
+    
+    print("\n=== Bellek Karşılaştırması ===")
+    n = 10 ** 7
+    flags = BitArray(n)
+    start_time = time.time()
+    for index in range(0, n, 3):
+        flags.add(index)
+    print(f"{n} bayrak: BitArray {flags.nbytes} byte, "
+          f"bool listesi ~{sys.getsizeof([False] * n)} byte")
+    print(f"Yazma süresi: {time.time() - start_time:.4f} saniye")
+    start_time = time.time()
+    print(f"popcount: {flags.count()} ({time.time() - start_time:.4f} saniye)")
@@ -0,0 +1,539 @@
+"""
+Bloklu Dinamik Array (Tiered Vector)
+
+Bu modül, elemanları sabit boyutlu bloklarda saklayan ve ortaya ekleme /
+ortadan silme işlemlerini O(√n) sürede yapan bir dinamik array içerir.
+
+Yapı:
+- Her blok en fazla B eleman tutan, list üzerinde dairesel bir buffer'dır
+  (_Block); blok içi erişim ve iki uçta ekleme / silme O(1)'dir
+- Bloklar da dairesel bir buffer'da tutulur: bir list ve baş offset'i.
+  i. blok tek bir list index'iyle O(1) sürede bulunur, başa / sona blok
+  ekleme O(1) amortized'dir (deque index'lemesi O(n/64) olurdu)
+- İlk ve son blok dışındaki tüm bloklar her zaman doludur; bu sayede
+  i. elemanın bloğu ve blok içi konumu O(1) sürede hesaplanır
+- B ≈ √n olacak şekilde boyut değiştikçe bloklar yeniden kurulur
+
+Zaman Karmaşıklıkları:
+- Erişim / Güncelleme: O(1)
+- Ekleme / Silme (başa veya sona): O(1) amortized
+- Ekleme / Silme (ortaya): O(B + n/B) = O(√n)
+- Toplu ekleme / silme (k eleman): O(min(k√n, n + k))
+- Arama: O(n)
+
+Arayüz DynamicArray ile aynıdır (index / slice erişimi, güncelleme ve
+silme, insert_many, delete_range, iterasyon); ek olarak appendleft ve
+popleft vardır. DynamicArray'e özgü view / snapshot (copy-on-write),
+indexed ve lazy_delete modları bilinçli olarak yoktur.
+"""
+
+from itertools import chain, islice
+
+
+class _Block:
+    """B kapasiteli dairesel buffer (blok içi konumlar start'tan itibaren)"""
+    
+    __slots__ = ('data', 'start', 'length')
+    
+    def __init__(self, capacity, values=()):
+        self.data = list(values)
+        self.length = len(self.data)
+        self.data.extend([None] * (capacity - self.length))
+        self.start = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __getitem__(self, offset):
+        return self.data[(self.start + offset) % len(self.data)]
+    
+    def __setitem__(self, offset, value):
+        self.data[(self.start + offset) % len(self.data)] = value
+    
+    def __iter__(self):
+        data, start, end = self.data, self.start, self.start + self.length
+        if end <= len(data):
+            return iter(data[start:end])
+        return chain(data[start:], data[:end - len(data)])
+    
+    def full(self):
+        return self.length == len(self.data)
+    
+    def append(self, value):
+        self.data[(self.start + self.length) % len(self.data)] = value
+        self.length += 1
+    
+    def appendleft(self, value):
+        self.start = (self.start - 1) % len(self.data)
+        self.data[self.start] = value
+        self.length += 1
+    
+    def pop(self):
+        self.length -= 1
+        position = (self.start + self.length) % len(self.data)
+        value = self.data[position]
+        self.data[position] = None
+        return value
+    
+    def popleft(self):
+        value = self.data[self.start]
+        self.data[self.start] = None
+        self.start = (self.start + 1) % len(self.data)
+        self.length -= 1
+        return value
+    
+    def shift_left(self, value):
+        """Dolu blokta popleft + append: baştaki eleman döner, value sona girer"""
+        data, start = self.data, self.start
+        evicted = data[start]
+        data[start] = value
+        self.start = (start + 1) % len(data)
+        return evicted
+    
+    def shift_right(self, value):
+        """Dolu blokta pop + appendleft: sondaki eleman döner, value başa girer"""
+        data = self.data
+        start = self.start = (self.start - 1) % len(data)
+        evicted = data[start]
+        data[start] = value
+        return evicted
+    
+    def insert(self, offset, value):
+        """Dolu olmayan bloğa ortadan ekleme: O(B), kaydırma C seviyesinde"""
+        self._normalize()
+        self.data.insert(offset, value)
+        self.data.pop()  # Sondaki boş slot
+        self.length += 1
+    
+    def delete(self, offset):
+        """Ortadan silme: O(B)"""
+        self._normalize()
+        value = self.data.pop(offset)
+        self.data.append(None)
+        self.length -= 1
+        return value
+    
+    def _normalize(self):
+        """Elemanları data[0:length]'e taşır (start = 0)"""
+        if self.start:
+            self.data[:] = self.data[self.start:] + self.data[:self.start]
+            self.start = 0
+
+
+class BlockedDynamicArray:
+    """Bloklu (tiered vector) Dinamik Array implementasyonu"""
+    
+    MIN_BLOCK_SIZE = 32
+    
+    def __init__(self, block_size=None):
+        """
+        Args:
+            block_size (int): Sabit blok boyutu (None ise √n'e göre uyarlanır)
+        """
+        self.adaptive = block_size is None
+        self.block_size = block_size or self.MIN_BLOCK_SIZE
+        self._ring = [None]
+        self._head = 0
+        self._count = 0
+        self.size = 0
+    
+    def __len__(self):
+        """Array'in boyutunu döndürür"""
+        return self.size
+    
+    @property
+    def blocks(self):
+        """Bloklar mantıksal sırayla (yeni bir list, O(n/B))"""
+        return [self._block(i) for i in range(self._count)]
+    
+    def _block(self, i):
+        """i. blok: O(1)"""
+        return self._ring[(self._head + i) % len(self._ring)]
+    
+    def _grow_ring(self):
+        """Blok halkasının kapasitesini ikiye katlar (O(n/B), amortized O(1))"""
+        blocks = self.blocks
+        self._ring = blocks + [None] * len(blocks)
+        self._head = 0
+    
+    def _push_block(self):
+        """Sona boş blok ekler ve döndürür"""
+        if self._count == len(self._ring):
+            self._grow_ring()
+        block = _Block(self.block_size)
+        self._ring[(self._head + self._count) % len(self._ring)] = block
+        self._count += 1
+        return block
+    
+    def _push_block_left(self):
+        """Başa boş blok ekler ve döndürür"""
+        if self._count == len(self._ring):
+            self._grow_ring()
+        block = _Block(self.block_size)
+        self._head = (self._head - 1) % len(self._ring)
+        self._ring[self._head] = block
+        self._count += 1
+        return block
+    
+    def _drop_empty_ends(self):
+        """Boşalan ilk / son bloğu halkadan çıkarır"""
+        if self._count and not self._block(0):
+            self._ring[self._head] = None
+            self._head = (self._head + 1) % len(self._ring)
+            self._count -= 1
+        if self._count and not self._block(self._count - 1):
+            self._ring[(self._head + self._count - 1) % len(self._ring)] = None
+            self._count -= 1
+    
+    def _locate(self, index):
+        """Mantıksal index'i (blok no, blok içi konum) çiftine çevirir: O(1)"""
+        first_len = len(self._ring[self._head])
+        if index < first_len:
+            return 0, index
+        index -= first_len
+        return 1 + index // self.block_size, index % self.block_size
+    
+    def __iter__(self):
+        return self._values()
+    
+    def __reversed__(self):
+        return chain.from_iterable(reversed(list(block)) for block in reversed(self.blocks))
+    
+    def __contains__(self, value):
+        """Değer array'de var mı? O(n)"""
+        return value in self._values()
+    
+    def __getitem__(self, index):
+        """Index (O(1)) veya slice (O(k)) ile erişim"""
+        if isinstance(index, slice):
+            result = self._new_empty()
+            result.extend(self[position] for position in range(*index.indices(self.size)))
+            return result
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        block, offset = self._locate(index)
+        return self._block(block)[offset]
+    
+    def __setitem__(self, index, value):
+        """Index (O(1)) veya slice ile eleman güncelleme"""
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        block, offset = self._locate(index)
+        self._block(block)[offset] = value
+    
+    def append(self, value):
+        """Array'in sonuna eleman ekleme: O(1) amortized"""
+        if not self._count or self._block(self._count - 1).full():
+            self._push_block()
+        self._block(self._count - 1).append(value)
+        self.size += 1
+        self._rebalance()
+    
+    def appendleft(self, value):
+        """Array'in başına eleman ekleme: O(1) amortized"""
+        if not self._count or self._block(0).full():
+            self._push_block_left()
+        self._block(0).appendleft(value)
+        self.size += 1
+        self._rebalance()
+    
+    def extend(self, iterable):
+        """Birden fazla elemanı sona ekleme"""
+        for value in iterable:
+            self.append(value)
+    
+    def insert(self, index, value):
+        """Belirtilen index'e eleman ekleme: O(√n)"""
+        if not 0 <= index <= self.size:
+            raise IndexError("Index out of range")
+        
+        if index == self.size:
+            self.append(value)
+            return
+        if index == 0:
+            self.appendleft(value)
+            return
+        
+        position, offset = self._locate(index)
+        block = self._block(position)
+        
+        # Dolu bloktan en yakın uca doğru taşan eleman bloktan bloğa aktarılır;
+        # her adım halkada O(1) index ve blokta O(1) uç işlemidir
+        if position < self._count - 1 - position:
+            if not block.full():
+                block.insert(offset, value)
+            else:
+                if offset == 0:
+                    carry = value
+                else:
+                    carry = block.popleft()
+                    block.insert(offset - 1, value)
+                for previous in range(position - 1, -1, -1):
+                    block = self._block(previous)
+                    if not block.full():
+                        block.append(carry)
+                        break
+                    carry = block.shift_left(carry)
+                else:
+                    self._push_block_left().append(carry)
+        else:
+            if not block.full():
+                block.insert(offset, value)
+            else:
+                carry = block.pop()
+                block.insert(offset, value)
+                for following in range(position + 1, self._count):
+                    block = self._block(following)
+                    if not block.full():
+                        block.appendleft(carry)
+                        break
+                    carry = block.shift_right(carry)
+                else:
+                    self._push_block().appendleft(carry)
+        
+        self.size += 1
+        self._rebalance()
+    
+    def __delitem__(self, index):
+        """Index veya slice ile eleman silme"""
+        if not isinstance(index, slice):
+            self.pop(index)
+            return
+        start, stop, step = index.indices(self.size)
+        if step == 1:
+            self.delete_range(start, max(start, stop))
+            return
+        remaining = list(self._values())
+        del remaining[index]
+        self._rebuild(remaining)
+        self._rebalance()
+    
+    def insert_many(self, index, values):
+        """
+        Belirtilen index'e birden fazla eleman ekleme
+        
+        Tek tek insert k * O(√n) tutar; k büyükse bloklar bir kez yeniden
+        kurulur (O(n + k)). Ucuz olan seçilir.
+        """
+        if not 0 <= index <= self.size:
+            raise IndexError("Index out of range")
+        values = list(values)
+        if self._bulk_is_cheaper(len(values)):
+            merged = list(self._values())
+            merged[index:index] = values
+            self._rebuild(merged)
+            self._rebalance()
+            return
+        for offset, value in enumerate(values):
+            self.insert(index + offset, value)
+    
+    def delete_range(self, start, stop):
+        """[start, stop) aralığındaki elemanları silme: O(min(k√n, n))"""
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError("Index out of range")
+        count = stop - start
+        if self._bulk_is_cheaper(count):
+            remaining = list(self._values())
+            del remaining[start:stop]
+            self._rebuild(remaining)
+            self._rebalance()
+            return
+        for _ in range(count):
+            self.pop(start)
+    
+    def _set_slice(self, index, values):
+        """Slice ataması (adım 1 ise uzunluk değişebilir)"""
+        start, stop, step = index.indices(self.size)
+        values = list(values)
+        if step != 1:
+            positions = range(start, stop, step)
+            if len(values) != len(positions):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(values)} "
+                    f"to extended slice of size {len(positions)}")
+            for position, value in zip(positions, values):
+                self[position] = value
+            return
+        
+        stop = max(start, stop)
+        overlap = min(stop - start, len(values))
+        for offset in range(overlap):
+            self[start + offset] = values[offset]
+        if len(values) > overlap:
+            self.insert_many(start + overlap, values[overlap:])
+        else:
+            self.delete_range(start + overlap, stop)
+    
+    def _bulk_is_cheaper(self, count):
+        """k tek işlem (her biri ~B + n/B) yerine O(n) yeniden kurma daha mı ucuz?"""
+        return count * (self.block_size + self.size // self.block_size) > self.size
+    
+    def popleft(self):
+        """Baştaki elemanı silme: O(1) amortized"""
+        return self.pop(0)
+    
+    def pop(self, index=None):
+        """Belirtilen index'teki elemanı silme (varsayılan: son eleman)"""
+        if index is None:
+            index = self.size - 1
+        
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        
+        position, offset = self._locate(index)
+        block = self._block(position)
+        last = self._count - 1
+        if offset == 0 and position == 0:
+            value = block.popleft()
+        elif offset == len(block) - 1 and position == last:
+            value = block.pop()
+        else:
+            value = block.delete(offset)
+            # Oluşan boşluğu en yakın uçtan gelen elemanlarla doldur: uç blok
+            # bir eleman verir, aradaki dolu bloklar birer slot döner
+            if position < last - position:
+                if position > 0:
+                    carry = self._block(0).pop()
+                    for current in range(1, position):
+                        carry = self._block(current).shift_right(carry)
+                    block.appendleft(carry)
+            elif position < last:
+                carry = self._block(last).popleft()
+                for current in range(last - 1, position, -1):
+                    carry = self._block(current).shift_left(carry)
+                block.append(carry)
+        
+        self._drop_empty_ends()
+        self.size -= 1
+        self._rebalance()
+        return value
+    
+    def remove(self, value):
+        """İlk bulunan değeri silme"""
+        self.pop(self.index(value))
+    
+    def index(self, value):
+        """Değerin index'ini bulma"""
+        for i, item in enumerate(self._values()):
+            if item == value:
+                return i
+        raise ValueError("Value not found")
+    
+    def count(self, value):
+        """Değerin kaç kez geçtiğini sayma"""
+        return sum(list(block).count(value) for block in self.blocks)
+    
+    def reverse(self):
+        """Array'i ters çevirme"""
+        self._rebuild(reversed(list(self._values())))
+    
+    def sort(self):
+        """Array'i sıralama (built-in sort kullanarak)"""
+        self._rebuild(sorted(self._values()))
+    
+    def _values(self):
+        """Elemanlar sırayla"""
+        return chain.from_iterable(self.blocks)
+    
+    def _rebalance(self):
+        """Blok boyutunu √n civarında tutar (uyarlamalı modda)"""
+        if not self.adaptive:
+            return
+        block_size = self.block_size
+        # Toplu işlemlerden sonra birden fazla ikiye katlama gerekebilir
+        while self.size > 4 * block_size * block_size:
+            block_size *= 2
+        while block_size > self.MIN_BLOCK_SIZE and self.size * 16 < block_size * block_size:
+            block_size //= 2
+        if block_size == self.block_size:
+            return
+        self.block_size = block_size
+        self._rebuild(list(self._values()))
+    
+    def _new_empty(self):
+        """Aynı blok boyutu ayarlı boş array (slice sonuçları için)"""
+        return BlockedDynamicArray(None if self.adaptive else self.block_size)
+    
+    def _rebuild(self, values):
+        """Blokları mevcut blok boyutuyla baştan kurar: O(n)"""
+        iterator = iter(values)
+        blocks = []
+        while True:
+            chunk = list(islice(iterator, self.block_size))
+            if not chunk:
+                break
+            blocks.append(_Block(self.block_size, chunk))
+        self._ring = blocks + [None] * max(len(blocks), 1)
+        self._head = 0
+        self._count = len(blocks)
+        self.size = sum(len(block) for block in blocks)
+    
+    def __str__(self):
+        """String temsili"""
+        return str(list(self._values()))
+    
+    def __repr__(self):
+        """Detaylı string temsili"""
+        return (f"BlockedDynamicArray(size={self.size}, block_size={self.block_size}, "
+                f"blocks={self._count})")
+
+
+def benchmark(sizes=(10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7), operations=200):
+    """
+    BlockedDynamicArray ile DynamicArray'i karşılaştırır
+    
+    Her boyut için başa/ortaya ekleme ve baştan/ortadan silme işlemlerinin
+    işlem başına ortalama süresini (mikrosaniye) döndürür.
+    """
+    import os
+    import sys
+    import time
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from data_structures.arrays.array import DynamicArray
+    
+    workloads = [
+        ("insert(0)", lambda arr, n: arr.insert(0, -1)),
+        ("insert(mid)", lambda arr, n: arr.insert(n // 2, -1)),
+        ("pop(0)", lambda arr, n: arr.pop(0)),
+        ("pop(mid)", lambda arr, n: arr.pop(n // 2)),
+        ("arr[i]", lambda arr, n: arr[n // 3]),
+    ]
+    
+    results = []
+    for n in sizes:
+        for name, factory in (("DynamicArray", DynamicArray),
+                              ("BlockedDynamicArray", BlockedDynamicArray)):
+            arr = factory()
+            arr.extend(range(n))
+            for workload, operation in workloads:
+                start_time = time.perf_counter()
+                for _ in range(operations):
+                    operation(arr, len(arr))
+                elapsed = time.perf_counter() - start_time
+                results.append((n, name, workload, elapsed / operations * 1e6))
+    return results
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import sys
+    
+    print("=== Bloklu Dinamik Array Örnekleri ===")
+    
+    arr = BlockedDynamicArray()
+    arr.extend(range(10))
+    arr.insert(0, -1)
+    arr.insert(5, 99)
+    print(f"Ekleme sonrası: {arr}")
+    print(f"Baştan silinen: {arr.pop(0)}, ortadan silinen: {arr.pop(4)}")
+    print(f"Güncel array: {arr}")
+    
+    print("\n=== Performans Karşılaştırması (işlem başına µs) ===")
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    sizes = tuple(10 ** power for power in range(4, max_power + 1))
+    print(f"{'n':>10} {'Yapı':<22} {'İşlem':<12} {'µs/işlem':>10}")
+    for n, name, workload, micros in benchmark(sizes):
+        print(f"{n:>10} {name:<22} {workload:<12} {micros:>10.2f}")
@@ -0,0 +1,224 @@
+"""
+Bellek Eşlemeli (Memory-Mapped) Dinamik Array
+
+Bu modül, elemanlarını diskteki bir dosyada saklayan ve dosyayı mmap ile
+belleğe eşleyen kalıcı bir dinamik array içerir.
+
+Dosya düzeni:
+- Başlık (64 byte): sihirli değer, tip kodu, boyut (size) ve kapasite
+- Veri: capacity * itemsize byte, ham değerler
+
+Zaman Karmaşıklıkları:
+- Açma: O(1) (dosya okunmaz, sayfalar erişildikçe işletim sistemi yükler)
+- Erişim / Güncelleme: O(1)
+- Ekleme (sona): O(1) amortized
+- Ekleme / Silme (başa/ortaya): O(n)
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+# Sadece script olarak veya kendi klasöründen tek modül olarak yüklendiğinde;
+# data_structures.arrays.* olarak import edilince sys.path'e dokunulmaz
+if not __package__:
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from data_structures.arrays.array import TypedDynamicArray
+
+
+_MAGIC = b'PYDYNARR'
+# magic, tip kodu, boyut, kapasite
+_HEADER = struct.Struct('<8sc7xQQ')
+_HEADER_SIZE = 64
+_SIZE_OFFSET = 16
+_CAPACITY_OFFSET = 24
+
+# Platformdan bağımsız, sabit genişlikli sayısal tip kodları
+FIXED_WIDTH_TYPECODES = 'bBhHiIqQfd'
+
+
+class MappedDynamicArray(TypedDynamicArray):
+    """
+    Dosya tabanlı, kalıcı Dinamik Array
+    
+    TypedDynamicArray ile aynı arayüzü sunar; fark olarak buffer bir
+    dosyanın mmap ile eşlenmiş bölgesidir. Boyut ve kapasite dosya
+    başlığında tutulur, bu yüzden dosya tekrar açıldığında array olduğu
+    gibi geri gelir.
+    
+    readonly=True ile açılan array'ler dosyayı ACCESS_READ ile eşler;
+    aynı dosyayı açan birden fazla süreç işletim sisteminin sayfa
+    önbelleğindeki aynı sayfaları paylaşır.
+    """
+    
+    def __init__(self, path, typecode='q', initial_capacity=1024, readonly=False):
+        """
+        Args:
+            path (str): Dosya yolu (yoksa oluşturulur)
+            typecode (str): Sabit genişlikli sayısal tip kodu (yeni dosyalar için)
+            initial_capacity (int): Başlangıç kapasitesi (yeni dosyalar için)
+            readonly (bool): Sadece okuma modunda aç
+        """
+        self.path = path
+        self.readonly = readonly
+        self._mmap = None
+        self.data = None
+        
+        if os.path.exists(path):
+            self._file = open(path, 'rb' if readonly else 'r+b')
+            self._map()
+        else:
+            if readonly:
+                raise FileNotFoundError(path)
+            if typecode not in FIXED_WIDTH_TYPECODES:
+                raise ValueError(f"Unsupported typecode: {typecode!r}")
+            self._file = open(path, 'w+b')
+            self._file.write(_HEADER.pack(_MAGIC, typecode.encode(), 0, initial_capacity))
+            self._file.truncate(self._file_length(typecode, initial_capacity))
+            self._file.flush()
+            self._map()
+    
+    @staticmethod
+    def _file_length(typecode, capacity):
+        """Başlık dahil dosya boyutu"""
+        return _HEADER_SIZE + capacity * struct.calcsize(typecode)
+    
+    def _map(self):
+        """Dosyayı belleğe eşler ve başlığı okur"""
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        
+        magic, typecode, size, capacity = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a MappedDynamicArray file")
+        
+        self.typecode = typecode.decode()
+        self._size = size
+        self._capacity = capacity
+        end = _HEADER_SIZE + capacity * struct.calcsize(self.typecode)
+        self.data = memoryview(self._mmap)[_HEADER_SIZE:end].cast(self.typecode)
+    
+    def _unmap(self):
+        """Eşlemeyi kaldırır (buffer'a dışarıdan referans kalmamalı)"""
+        if self.data is not None:
+            self.data.release()
+            self.data = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+    
+    @property
+    def size(self):
+        """Eleman sayısı (dosya başlığında saklanır)"""
+        return self._size
+    
+    @size.setter
+    def size(self, value):
+        struct.pack_into('<Q', self._mmap, _SIZE_OFFSET, value)
+        self._size = value
+    
+    @property
+    def capacity(self):
+        """Kapasite (dosya başlığında saklanır)"""
+        return self._capacity
+    
+    @capacity.setter
+    def capacity(self, value):
+        struct.pack_into('<Q', self._mmap, _CAPACITY_OFFSET, value)
+        self._capacity = value
+    
+    def _resize(self, new_capacity):
+        """
+        Dosyayı yeniden boyutlandırma
+        
+        Dosya ftruncate ile büyütülür/küçültülür ve yeniden eşlenir;
+        mevcut veri dosyada yerinde kalır, kopyalanmaz.
+        """
+        if self.readonly:
+            raise TypeError("cannot resize a read-only MappedDynamicArray")
+        self.capacity = new_capacity
+        self._unmap()
+        os.ftruncate(self._file.fileno(), self._file_length(self.typecode, new_capacity))
+        self._map()
+    
+    def reverse(self):
+        """
+        Array'i ters çevirme
+        
+        Eşlenmiş buffer geçici olarak kısaltılamadığı için canlı bölge bir
+        kez kopyalanarak ters çevrilir.
+        """
+        if self._tombstones:
+            self.compact()
+        if self._versions:
+            self._before_write(0, self.size)
+        live = self._to_buffer(self.data[:self.size])
+        live.reverse()
+        self.data[:self.size] = live
+        if self._positions is not None:
+            self._rebuild_index()
+    
+    def flush(self):
+        """Değişiklikleri diske yazar"""
+        if self._mmap is not None and not self.readonly:
+            self._mmap.flush()
+    
+    def close(self):
+        """Dosyayı kapatır"""
+        self.flush()
+        self._unmap()
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __repr__(self):
+        """Detaylı string temsili"""
+        return (f"MappedDynamicArray(path={self.path!r}, typecode={self.typecode!r}, "
+                f"size={len(self)}, capacity={self.capacity}, readonly={self.readonly})")
+
+
+
+def _worker_sum(path):
+    """
+    Dosyayı salt okunur açıp toplamını hesaplar (süreç havuzu örneği)
+    
+    Modül seviyesinde tanımlıdır: spawn başlatma yönteminde (macOS /
+    Windows) alt süreç modülü yeniden import eder ve fonksiyonu adıyla bulur.
+    """
+    with MappedDynamicArray(path, readonly=True) as shared:
+        return sum(shared.data[:len(shared)])
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    
+    print("=== Bellek Eşlemeli Dinamik Array Örnekleri ===")
+    
+    path = os.path.join(tempfile.mkdtemp(), "numbers.dat")
+    
+    with MappedDynamicArray(path, 'q', initial_capacity=4) as arr:
+        arr.extend(range(1_000_000))
+        arr.append(-1)
+        print(f"Yazıldı: {arr!r}")
+    
+    start_time = time.time()
+    reopened = MappedDynamicArray(path, readonly=True)
+    end_time = time.time()
+    print(f"Yeniden açma: {end_time - start_time:.6f} saniye, boyut: {len(reopened)}")
+    print(f"Son eleman: {reopened[len(reopened) - 1]}")
+    reopened.close()
+    
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_worker_sum, [path, path]))
+    print(f"İşçi süreçlerin hesapladığı toplamlar: {results}")
@@ -0,0 +1,280 @@
+"""
+Aralık Sorguları (Fenwick Tree ve Segment Tree)
+
+Bu modül, bir array'in içeriği üzerine kurulan ve aralık sorgularını her
+seferinde veriyi baştan taramadan yanıtlayan iki yapı içerir. Her ikisi de
+herhangi bir iterable'dan (list, StaticArray, DynamicArray,
+TypedDynamicArray, array.array, memoryview) O(n) sürede kurulur.
+
+Zaman Karmaşıklıkları:
+- Kurulum: O(n)
+- FenwickTree: nokta güncelleme ve önek/aralık toplamı O(log n)
+- SegmentTree: nokta güncelleme, aralık toplamı/min/max ve aralığa
+  ekleme (lazy propagation) O(log n)
+
+Aralıklar Python slice'larındaki gibi [start, stop) şeklindedir.
+"""
+
+
+class FenwickTree:
+    """
+    Fenwick Tree (Binary Indexed Tree)
+    
+    tree[i], (i - lowbit(i), i] aralığındaki elemanların toplamını tutar
+    (1 tabanlı). Sadece toplam sorguları ve nokta güncellemeleri için
+    SegmentTree'den daha az bellek kullanır ve daha hızlıdır.
+    """
+    
+    def __init__(self, values=()):
+        """
+        Args:
+            values: Başlangıç değerleri (herhangi bir iterable)
+        """
+        tree = [0]
+        tree.extend(values)
+        size = len(tree) - 1
+        
+        # O(n) kurulum: her düğüm toplamını bir üst sorumlu düğüme aktarır
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        
+        self.tree = tree
+        self.size = size
+    
+    def __len__(self):
+        return self.size
+    
+    def add(self, index, delta):
+        """index'teki elemana delta ekleme: O(log n)"""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        tree = self.tree
+        i = index + 1
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+    
+    def __getitem__(self, index):
+        """index'teki elemanın değeri: O(log n)"""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        return self.prefix_sum(index + 1) - self.prefix_sum(index)
+    
+    def __setitem__(self, index, value):
+        """index'teki elemanı güncelleme: O(log n)"""
+        self.add(index, value - self[index])
+    
+    def prefix_sum(self, stop):
+        """[0, stop) aralığındaki elemanların toplamı: O(log n)"""
+        if not 0 <= stop <= self.size:
+            raise IndexError("Index out of range")
+        tree = self.tree
+        total = 0
+        while stop:
+            total += tree[stop]
+            stop -= stop & -stop
+        return total
+    
+    def range_sum(self, start, stop):
+        """[start, stop) aralığındaki elemanların toplamı: O(log n)"""
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError("Index out of range")
+        return self.prefix_sum(stop) - self.prefix_sum(start)
+    
+    def __repr__(self):
+        return f"FenwickTree(size={self.size}, total={self.prefix_sum(self.size)})"
+
+
+class SegmentTree:
+    """
+    Lazy propagation destekli Segment Tree
+    
+    Yaprakları 2'nin kuvveti olacak şekilde tamamlanmış, iteratif (özyinelemesiz)
+    bir ağaçtır. Her düğüm kendi aralığının toplamını, minimumunu ve
+    maksimumunu birlikte tutar; böylece tek yapı üç sorgu türünü de yanıtlar.
+    range_add ile bir aralığa eklenen değer, sadece aralığı tam kapsayan
+    düğümlere yazılır ve alt düğümlere ihtiyaç olduğunda aktarılır.
+    """
+    
+    def __init__(self, values=()):
+        """
+        Args:
+            values: Başlangıç değerleri (herhangi bir iterable)
+        """
+        values = list(values)
+        n = len(values)
+        log = (n - 1).bit_length() if n > 1 else 0
+        leaves = 1 << log
+        
+        self.size = n
+        self._log = log
+        self._leaves = leaves
+        
+        # Kullanılmayan yapraklar toplam/min/max için etkisiz elemandır
+        self._sum = [0] * leaves + values + [0] * (leaves - n)
+        self._min = [float('inf')] * leaves + values + [float('inf')] * (leaves - n)
+        self._max = [float('-inf')] * leaves + values + [float('-inf')] * (leaves - n)
+        self._length = [0] * leaves + [1] * n + [0] * (leaves - n)
+        self._lazy = [0] * leaves
+        
+        for node in range(leaves - 1, 0, -1):
+            self._pull(node)
+            self._length[node] = self._length[2 * node] + self._length[2 * node + 1]
+    
+    def __len__(self):
+        return self.size
+    
+    def _pull(self, node):
+        """Düğümü iki çocuğundan yeniden hesaplar"""
+        left, right = 2 * node, 2 * node + 1
+        self._sum[node] = self._sum[left] + self._sum[right]
+        self._min[node] = min(self._min[left], self._min[right])
+        self._max[node] = max(self._max[left], self._max[right])
+    
+    def _apply(self, node, delta):
+        """Düğümün tüm aralığına delta ekler (iç düğümlerde lazy olarak)"""
+        self._sum[node] += delta * self._length[node]
+        self._min[node] += delta
+        self._max[node] += delta
+        if node < self._leaves:
+            self._lazy[node] += delta
+    
+    def _push(self, node):
+        """Düğümde bekleyen eklemeyi çocuklarına aktarır"""
+        delta = self._lazy[node]
+        if delta:
+            self._apply(2 * node, delta)
+            self._apply(2 * node + 1, delta)
+            self._lazy[node] = 0
+    
+    def _push_bounds(self, left, right):
+        """[left, right) yaprak aralığının sınır yollarındaki eklemeleri aktarır"""
+        for shift in range(self._log, 0, -1):
+            if (left >> shift) << shift != left:
+                self._push(left >> shift)
+            if (right >> shift) << shift != right:
+                self._push((right - 1) >> shift)
+    
+    def _leaf(self, index):
+        """index'in yaprağına giden yoldaki eklemeleri aktarır ve yaprağı döndürür"""
+        if not 0 <= index < self.size:
+            raise IndexError("Index out of range")
+        leaf = index + self._leaves
+        for shift in range(self._log, 0, -1):
+            self._push(leaf >> shift)
+        return leaf
+    
+    def __getitem__(self, index):
+        """index'teki elemanın değeri: O(log n)"""
+        return self._sum[self._leaf(index)]
+    
+    def __setitem__(self, index, value):
+        """index'teki elemanı güncelleme: O(log n)"""
+        leaf = self._leaf(index)
+        self._sum[leaf] = self._min[leaf] = self._max[leaf] = value
+        leaf >>= 1
+        while leaf:
+            self._pull(leaf)
+            leaf >>= 1
+    
+    def _query(self, start, stop, tree, combine, identity):
+        """[start, stop) aralığındaki düğümleri combine ile birleştirir"""
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError("Index out of range")
+        if start == stop:
+            return identity
+        left, right = start + self._leaves, stop + self._leaves
+        self._push_bounds(left, right)
+        
+        result = identity
+        while left < right:
+            if left & 1:
+                result = combine(result, tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                result = combine(result, tree[right])
+            left >>= 1
+            right >>= 1
+        return result
+    
+    def range_sum(self, start, stop):
+        """[start, stop) aralığındaki elemanların toplamı: O(log n)"""
+        return self._query(start, stop, self._sum, lambda a, b: a + b, 0)
+    
+    def range_min(self, start, stop):
+        """[start, stop) aralığındaki en küçük eleman: O(log n)"""
+        if start >= stop:
+            raise ValueError("range_min() of empty range")
+        return self._query(start, stop, self._min, min, float('inf'))
+    
+    def range_max(self, start, stop):
+        """[start, stop) aralığındaki en büyük eleman: O(log n)"""
+        if start >= stop:
+            raise ValueError("range_max() of empty range")
+        return self._query(start, stop, self._max, max, float('-inf'))
+    
+    def range_add(self, start, stop, delta):
+        """[start, stop) aralığındaki tüm elemanlara delta ekleme: O(log n)"""
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError("Index out of range")
+        if start == stop:
+            return
+        left, right = start + self._leaves, stop + self._leaves
+        self._push_bounds(left, right)
+        
+        low, high = left, right
+        while low < high:
+            if low & 1:
+                self._apply(low, delta)
+                low += 1
+            if high & 1:
+                high -= 1
+                self._apply(high, delta)
+            low >>= 1
+            high >>= 1
+        
+        # Sınır yollarındaki atalar yeniden hesaplanır
+        for shift in range(1, self._log + 1):
+            if (left >> shift) << shift != left:
+                self._pull(left >> shift)
+            if (right >> shift) << shift != right:
+                self._pull((right - 1) >> shift)
+    
+    def tolist(self):
+        """Güncel değerleri liste olarak döndürür"""
+        for node in range(1, self._leaves):
+            self._push(node)
+        return self._sum[self._leaves:self._leaves + self.size]
+    
+    def __repr__(self):
+        return f"SegmentTree(size={self.size}, data={self.tolist()})"
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import os
+    import sys
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from data_structures.arrays.array import TypedDynamicArray
+    
+    print("=== Fenwick Tree Örnekleri ===")
+    
+    measurements = TypedDynamicArray('q')
+    measurements.extend([5, 3, 7, 9, 6, 4, 1, 2])
+    
+    fenwick = FenwickTree(measurements)
+    print(f"İlk 4 elemanın toplamı: {fenwick.prefix_sum(4)}")
+    fenwick.add(2, 10)
+    print(f"Index 2'ye 10 eklendikten sonra [2, 5) toplamı: {fenwick.range_sum(2, 5)}")
+    
+    print("\n=== Segment Tree Örnekleri ===")
+    
+    segment = SegmentTree(measurements)
+    print(f"[1, 6) toplam/min/max: {segment.range_sum(1, 6)}, "
+          f"{segment.range_min(1, 6)}, {segment.range_max(1, 6)}")
+    segment.range_add(0, 4, 100)
+    print(f"[0, 4) aralığına 100 eklendikten sonra: {segment.tolist()}")
+    print(f"[3, 8) min/max: {segment.range_min(3, 8)}, {segment.range_max(3, 8)}")
@@ -0,0 +1,267 @@
+"""
+Heap (Yığın Ağacı)
+
+Bu modül, d-ary (her düğümün d çocuğu olan) min-heap için yeniden
+kullanılabilir, özyinelemesiz çekirdek fonksiyonları ve bunların üzerine
+kurulu DaryHeap öncelik kuyruğunu içerir.
+
+Yapı:
+- Heap düz bir Python listesinde tutulur; i. düğümün çocukları
+  d * i + 1 ... d * i + d, ebeveyni (i - 1) // d pozisyonundadır
+- low parametresi ile listenin bir aralığı (heap[low:low + n]) heap
+  olarak kullanılabilir (ör. introsort'un heap sort yedeği)
+- sift_down "delik" tekniği ve Floyd'un aşağıdan-yukarı yöntemiyle
+  çalışır: delik her seviyede en küçük çocukla yer değiştirerek yaprağa
+  iner, eleman sonra sift_up ile yerine çıkar. pop'ta köke gelen eleman
+  genellikle büyük olduğu için seviye başına bir karşılaştırma kazanılır
+- build_heap Floyd'un O(n) heap kurma yöntemidir (son ebeveynden köke
+  doğru sift_down)
+- İkili heap'in yerleşimi heapq modülüyle aynıdır; arity=2'de heap_push /
+  heap_pop / heap_replace heapq'nun C implementasyonuna devredilir
+
+Arity seçimi:
+- Büyük d ağacı sığlaştırır (log_d n seviye): push / decrease-key ucuzlar
+- Her seviyede d çocuk karşılaştırılır: pop d / log2(d) kat pahalılaşır
+- Saf Python'da seviye başına döngü maliyeti karşılaştırma sayısından
+  baskındır; ikili heap iki çocuğu döngüsüz karşılaştırdığı için heap
+  sort'ta en hızlısıdır. Ölçümler için benchmark() fonksiyonuna bakın
+
+Zaman Karmaşıklıkları:
+- push / sift_up: O(log_d n)
+- pop / sift_down: O(d log_d n)
+- build_heap: O(n)
+- peek: O(1)
+"""
+
+import heapq
+from typing import Iterable, List, Optional
+
+
+def sift_up(heap: List, pos: int, arity: int = 2, low: int = 0):
+    """heap[low + pos] elemanını daha küçük ebeveynler boyunca köke doğru taşır"""
+    pos += low
+    item = heap[pos]
+    while pos > low:
+        parent = low + (pos - low - 1) // arity
+        parent_item = heap[parent]
+        if not item < parent_item:
+            break
+        heap[pos] = parent_item
+        pos = parent
+    heap[pos] = item
+
+
+def sift_down(heap: List, pos: int, end: Optional[int] = None, arity: int = 2,
+              low: int = 0):
+    """
+    heap[low + pos] elemanını heap[low:low + end] içinde aşağı taşır
+    
+    Delik önce en küçük çocuklar boyunca yaprağa iner, eleman sonra
+    sift_up ile pos'a kadar yukarı çıkar (Floyd'un aşağıdan-yukarı yöntemi).
+    İndeksler mutlak tutulur; i. düğümün ilk çocuğu arity * i - shift'tir.
+    """
+    limit = len(heap) if end is None else low + end
+    pos += low
+    start = pos
+    shift = (arity - 1) * low - 1
+    item = heap[pos]
+    
+    child = arity * pos - shift
+    if arity == 2:
+        # İkili heap: iki çocuk doğrudan karşılaştırılır
+        while child < limit:
+            right = child + 1
+            if right < limit and heap[right] < heap[child]:
+                child = right
+            heap[pos] = heap[child]
+            pos = child
+            child = 2 * pos - shift
+    else:
+        while child < limit:
+            best = child
+            best_item = heap[child]
+            last = child + arity
+            if last > limit:
+                last = limit
+            for other in range(child + 1, last):
+                other_item = heap[other]
+                if other_item < best_item:
+                    best, best_item = other, other_item
+            heap[pos] = best_item
+            pos = best
+            child = arity * pos - shift
+    
+    # Eleman yapraktan start'a kadar yerine çıkar
+    while pos > start:
+        parent = low + (pos - low - 1) // arity
+        parent_item = heap[parent]
+        if not item < parent_item:
+            break
+        heap[pos] = parent_item
+        pos = parent
+    heap[pos] = item
+
+
+def build_heap(heap: List, arity: int = 2, low: int = 0, high: Optional[int] = None):
+    """heap[low:high] aralığını yerinde min-heap'e çevirir (Floyd, O(n))"""
+    if high is None:
+        high = len(heap)
+    n = high - low
+    for pos in range((n - 2) // arity, -1, -1):
+        sift_down(heap, pos, n, arity, low)
+
+
+def heap_push(heap: List, item, arity: int = 2):
+    """Elemanı heap'e ekler"""
+    if arity == 2:
+        heapq.heappush(heap, item)
+        return
+    heap.append(item)
+    sift_up(heap, len(heap) - 1, arity)
+
+
+def heap_pop(heap: List, arity: int = 2):
+    """En küçük elemanı çıkarır ve döndürür"""
+    if arity == 2:
+        return heapq.heappop(heap)
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    sift_down(heap, 0, len(heap), arity)
+    return top
+
+
+def heap_replace(heap: List, item, arity: int = 2):
+    """En küçük elemanı çıkarıp yerine item'ı koyar (pop + push'tan ucuz)"""
+    if arity == 2:
+        return heapq.heapreplace(heap, item)
+    top = heap[0]
+    heap[0] = item
+    sift_down(heap, 0, len(heap), arity)
+    return top
+
+
+class DaryHeap:
+    """d-ary min-heap öncelik kuyruğu"""
+    
+    def __init__(self, items: Optional[Iterable] = None, arity: int = 2):
+        """
+        Args:
+            items: Başlangıç elemanları (O(n) build_heap ile yerleştirilir)
+            arity (int): Düğüm başına çocuk sayısı (2, 4, 8, ...)
+        """
+        if arity < 2:
+            raise ValueError("Arity must be at least 2")
+        self.arity = arity
+        self.data = list(items) if items is not None else []
+        build_heap(self.data, arity)
+    
+    def push(self, item):
+        """Eleman ekleme - O(log_d n)"""
+        heap_push(self.data, item, self.arity)
+    
+    def pop(self):
+        """En küçük elemanı çıkarma - O(d log_d n)"""
+        if not self.data:
+            raise IndexError("Pop from empty heap")
+        return heap_pop(self.data, self.arity)
+    
+    def replace(self, item):
+        """En küçük elemanı çıkarıp item'ı ekleme - O(d log_d n)"""
+        if not self.data:
+            raise IndexError("Replace on empty heap")
+        return heap_replace(self.data, item, self.arity)
+    
+    def peek(self):
+        """En küçük eleman - O(1)"""
+        if not self.data:
+            raise IndexError("Peek from empty heap")
+        return self.data[0]
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def __bool__(self):
+        return bool(self.data)
+    
+    def __repr__(self):
+        return f"DaryHeap(size={len(self.data)}, arity={self.arity})"
+
+
+def is_heap(heap: List, arity: int = 2) -> bool:
+    """Heap özelliği sağlanıyor mu? (ebeveyn <= çocuk)"""
+    return all(not heap[i] < heap[(i - 1) // arity] for i in range(1, len(heap)))
+
+
+def benchmark(sizes=(10 ** 5, 10 ** 6), arities=(2, 4, 8)):
+    """
+    Farklı arity değerleri için heap işlemlerini ölçer
+    
+    - heap sort: build_heap + n kez sift_down (pop ağırlıklı)
+    - push ağırlıklı: Dijkstra'daki gibi her pop'a karşılık 4 push
+    
+    Tüm arity değerlerinde saf Python çekirdekleri (sift_up / sift_down)
+    ölçülür; "heapq" satırı C implementasyonu ile karşılaştırma içindir.
+    
+    Returns:
+        list: (iş yükü, n, arity, saniye) dörtlüleri
+    """
+    import random
+    import time
+    
+    results = []
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        for arity in arities:
+            heap = list(values)
+            start_time = time.perf_counter()
+            build_heap(heap, arity)
+            for end in range(n - 1, 0, -1):
+                heap[0], heap[end] = heap[end], heap[0]
+                sift_down(heap, 0, end, arity)
+            results.append(("heap sort", n, arity, time.perf_counter() - start_time))
+            
+            heap = []
+            start_time = time.perf_counter()
+            for i in range(n // 4):
+                for value in values[4 * i:4 * i + 4]:
+                    heap.append(value)
+                    sift_up(heap, len(heap) - 1, arity)
+                heap[0] = heap.pop()
+                sift_down(heap, 0, len(heap), arity)
+            results.append(("4 push / 1 pop", n, arity, time.perf_counter() - start_time))
+        
+        heap = []
+        start_time = time.perf_counter()
+        for i in range(n // 4):
+            for value in values[4 * i:4 * i + 4]:
+                heapq.heappush(heap, value)
+            heapq.heappop(heap)
+        results.append(("4 push / 1 pop", n, "heapq", time.perf_counter() - start_time))
+    return results
+
+
+# Kullanım örnekleri
+if __name__ == "__main__":
+    import sys
+    
+    print("=== Heap Örnekleri ===")
+    
+    heap = DaryHeap([5, 3, 8, 1, 9, 2], arity=4)
+    print(f"Heap: {heap}, en küçük: {heap.peek()}")
+    heap.push(0)
+    print(f"Sırayla çıkarma: {[heap.pop() for _ in range(len(heap))]}")
+    
+    tasks = DaryHeap(arity=2)
+    for priority, name in [(3, "rapor"), (1, "acil düzeltme"), (2, "kod inceleme")]:
+        tasks.push((priority, name))
+    print(f"Öncelik sırası: {[tasks.pop()[1] for _ in range(len(tasks))]}")
+    
+    print("\n=== Arity Karşılaştırması ===")
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    sizes = tuple(10 ** power for power in range(5, max_power + 1))
+    print(f"{'iş yükü':<16} {'n':>9} {'arity':>6} {'saniye':>8}")
+    for workload, n, arity, seconds in benchmark(sizes):
+        print(f"{workload:<16} {n:>9} {arity:>6} {seconds:>8.3f}")
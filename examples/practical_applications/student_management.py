@@ -7,10 +7,13 @@ Bu örnek, veri yapıları ve algoritmaların gerçek hayatta nasıl kullanıld
 
 import sys
 import os
+from operator import attrgetter
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from data_structures.arrays.array import DynamicArray
-from algorithms.sorting.sorting_algorithms import quick_sort, merge_sort
+from algorithms.sorting.sorting_algorithms import quick_sort, counting_sort
+from algorithms.sorting.selection import top_k, quickselect
+from algorithms.sorting.string_sort import string_sort
 
 
 class Student:
@@ -33,7 +36,8 @@ class StudentManagementSystem:
     """Öğrenci Yönetim Sistemi"""
     
     def __init__(self):
-        self.students = DynamicArray()
+        # Silmeler tombstone ile ertelenir; öğrenciler kaydırılmaz
+        self.students = DynamicArray(lazy_delete=True)
         self.next_id = 1
     
     def add_student(self, name: str, age: int, gpa: float) -> int:
@@ -44,9 +48,9 @@ class StudentManagementSystem:
         return student.student_id
     
     def remove_student(self, student_id: int) -> bool:
-        """Öğrenci silme"""
-        for i in range(len(self.students)):
-            if self.students[i].student_id == student_id:
+        """Öğrenci silme (tombstone ile O(1), kaydırma yok)"""
+        for i, student in enumerate(self.students):
+            if student.student_id == student_id:
                 self.students.pop(i)
                 return True
         return False
@@ -67,33 +71,42 @@ class StudentManagementSystem:
         return results
     
     def sort_by_gpa(self, reverse: bool = True) -> list:
-        """GPA'ya göre sıralama"""
+        """GPA'ya göre sıralama (eşit GPA'lılar ekleme sırasında kalır)"""
         if len(self.students) == 0:
             return []
         
-        # Student listesini GPA listesine çevir
-        student_list = [self.students[i] for i in range(len(self.students))]
-        
-        # Quick sort kullanarak sırala
-        sorted_students = quick_sort_by_gpa(student_list)
-        
-        if reverse:
-            sorted_students.reverse()
-        
-        return sorted_students
+        student_list = list(self.students)
+        return quick_sort(student_list, key=attrgetter('gpa'), reverse=reverse)
     
     def sort_by_name(self) -> list:
-        """İsme göre sıralama"""
+        """İsme göre sıralama (MSD radix, büyük/küçük harf duyarsız)"""
         if len(self.students) == 0:
             return []
         
-        student_list = [self.students[i] for i in range(len(self.students))]
-        return merge_sort_by_name(student_list)
+        student_list = list(self.students)
+        return string_sort(student_list, key=attrgetter('name'), casefold=True)
+    
+    def sort_by_age(self) -> list:
+        """
+        Yaşa göre sıralama (kararlı counting sort)
+        
+        Yaş aralığı sabit bir sınıra bağlanmaz: counting_sort gerçek
+        min/max'a göre sayaç dizisi, seyrek histogram veya radix seçer.
+        """
+        student_list = list(self.students)
+        return counting_sort(student_list, key=attrgetter('age'))
     
     def get_top_students(self, count: int = 5) -> list:
-        """En yüksek GPA'lı öğrencileri getir"""
-        sorted_students = self.sort_by_gpa(reverse=True)
-        return sorted_students[:count]
+        """En yüksek GPA'lı öğrencileri getir (tam sıralama yerine O(n log k) heap)"""
+        return top_k(self.students, count, key=attrgetter('gpa'))
+    
+    def get_median_gpa(self) -> float:
+        """Medyan GPA (quickselect ile O(n); çift sayıda öğrencide alt medyan)"""
+        if len(self.students) == 0:
+            return 0.0
+        
+        gpas = [student.gpa for student in self.students]
+        return quickselect(gpas, (len(gpas) - 1) // 2)
     
     def get_average_gpa(self) -> float:
         """Ortalama GPA hesaplama"""
@@ -121,49 +134,6 @@ class StudentManagementSystem:
             print(f"{student.student_id:<5} {student.name:<20} {student.age:<5} {student.gpa:<8.2f}")
 
 
-def quick_sort_by_gpa(students: list) -> list:
-    """GPA'ya göre quick sort"""
-    if len(students) <= 1:
-        return students
-    
-    pivot = students[len(students) // 2]
-    left = [s for s in students if s.gpa < pivot.gpa]
-    middle = [s for s in students if s.gpa == pivot.gpa]
-    right = [s for s in students if s.gpa > pivot.gpa]
-    
-    return quick_sort_by_gpa(left) + middle + quick_sort_by_gpa(right)
-
-
-def merge_sort_by_name(students: list) -> list:
-    """İsme göre merge sort"""
-    if len(students) <= 1:
-        return students
-    
-    mid = len(students) // 2
-    left = merge_sort_by_name(students[:mid])
-    right = merge_sort_by_name(students[mid:])
-    
-    return merge_by_name(left, right)
-
-
-def merge_by_name(left: list, right: list) -> list:
-    """İsme göre merge"""
-    result = []
-    i = j = 0
-    
-    while i < len(left) and j < len(right):
-        if left[i].name.lower() <= right[j].name.lower():
-            result.append(left[i])
-            i += 1
-        else:
-            result.append(right[j])
-            j += 1
-    
-    result.extend(left[i:])
-    result.extend(right[j:])
-    return result
-
-
 def binary_search_by_id(students: list, student_id: int) -> Student:
     """ID ile binary search (sıralı liste gerekli)"""
     left, right = 0, len(students) - 1
@@ -213,6 +183,11 @@ def demo_student_management():
     for student in sorted_by_name:
         print(f"- {student.name} (GPA: {student.gpa:.2f})")
     
+    # Yaşa göre sırala
+    print("\n4b. Yaşa göre sıralama:")
+    for student in sms.sort_by_age():
+        print(f"- {student.name} ({student.age})")
+    
     # En iyi öğrenciler
     print("\n5. En iyi 3 öğrenci:")
     top_students = sms.get_top_students(3)
@@ -223,6 +198,7 @@ def demo_student_management():
     print(f"\n6. İstatistikler:")
     print(f"Toplam öğrenci sayısı: {sms.get_student_count()}")
     print(f"Ortalama GPA: {sms.get_average_gpa():.2f}")
+    print(f"Medyan GPA: {sms.get_median_gpa():.2f}")
     
     # Arama örnekleri
     print("\n7. Arama örnekleri:")
@@ -8,8 +8,20 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+import math
+import random
 import pytest
-from data_structures.arrays.array import DynamicArray, StaticArray
+from data_structures.arrays.array import (
+    DynamicArray, StaticArray, TypedDynamicArray, ArrayView, ArraySnapshot,
+    RingArray
+)
+from data_structures.arrays.mapped_array import MappedDynamicArray
+from data_structures.arrays.blocked_array import BlockedDynamicArray
+from data_structures.arrays.range_queries import FenwickTree, SegmentTree
+from data_structures.arrays.bit_array import BitArray
+from algorithms.graph_algorithms.graph_algorithms import (
+    Graph, breadth_first_search, depth_first_search_iterative
+)
 
 
 class TestDynamicArray:
@@ -182,6 +194,527 @@ class TestDynamicArray:
         assert arr[0] == 10
         assert arr[1] == 20
         assert arr[2] == 30
+    
+    def test_iteration(self):
+        """for döngüsü ve reversed testi"""
+        arr = DynamicArray()
+        arr.extend([10, 20, 30])
+        assert list(arr) == [10, 20, 30]
+        assert list(reversed(arr)) == [30, 20, 10]
+        assert list(DynamicArray()) == []
+    
+    def test_view(self):
+        """Kopyasız görünüm testi"""
+        arr = DynamicArray()
+        arr.extend(range(10))
+        
+        view = arr.view(1, 9, 2)
+        assert len(view) == 4
+        assert list(view) == [1, 3, 5, 7]
+        assert list(reversed(view)) == [7, 5, 3, 1]
+        assert view.tolist() == [1, 3, 5, 7]
+        
+        # Kaynaktaki değişiklik görünümde de görülmeli
+        arr[3] = 33
+        assert view[1] == 33
+        
+        # Görünümün görünümü
+        assert list(view[::-1][:2]) == [7, 5]
+        
+        with pytest.raises(TypeError):
+            view[0] = 100
+        with pytest.raises(IndexError):
+            _ = view[4]
+        
+        writable = arr.view(writable=True)
+        writable[0] = -1
+        assert arr[0] == -1
+        
+        arr.delete_range(5, 10)
+        with pytest.raises(IndexError):
+            list(view)
+    
+    def test_contains(self):
+        """in operatörü testi"""
+        arr = DynamicArray()
+        arr.extend([10, 20])
+        assert 10 in arr
+        assert 30 not in arr
+    
+    def test_indexed_mode(self):
+        """Hash index tüm değişikliklerden sonra doğru kalmalı"""
+        arr = DynamicArray(indexed=True)
+        arr.extend([5, 3, 5, 1])
+        assert arr.index(5) == 0
+        assert arr.count(5) == 2
+        assert 3 in arr
+        
+        arr.insert(0, 1)  # [1, 5, 3, 5, 1]
+        assert arr.index(5) == 1
+        assert arr.count(1) == 2
+        
+        arr[1] = 7  # [1, 7, 3, 5, 1]
+        assert arr.index(5) == 3
+        assert arr.index(7) == 1
+        
+        arr.remove(3)  # [1, 7, 5, 1]
+        assert 3 not in arr
+        assert arr.index(5) == 2
+        
+        arr.sort()  # [1, 1, 5, 7]
+        assert arr.index(7) == 3
+        arr.reverse()  # [7, 5, 1, 1]
+        assert arr.index(1) == 2
+        
+        arr[0:2] = [9]  # [9, 1, 1]
+        assert arr.count(7) == 0
+        assert arr.index(1) == 1
+        
+        del arr[0]
+        assert arr.index(1) == 0
+        with pytest.raises(ValueError):
+            arr.index(9)
+        with pytest.raises(ValueError):
+            arr.remove(9)
+    
+    def test_indexed_unhashable(self):
+        """indexed modda hashlenemeyen değerler lineer taramayla bulunmalı"""
+        arr = DynamicArray(indexed=True)
+        arr.extend([1, [1], 2, {3}])
+        arr.append([1])
+        arr.insert(0, {'a': 1})  # [{'a': 1}, 1, [1], 2, {3}, [1]]
+        assert arr.index([1]) == 2
+        assert arr.count([1]) == 2
+        assert {'a': 1} in arr and [2] not in arr
+        assert arr.index(frozenset({3})) == 4
+        assert arr.count(2) == 1
+        
+        arr.remove([1])  # [{'a': 1}, 1, 2, {3}, [1]]
+        assert arr.index([1]) == 4
+        arr[1:3] = [[0], 7]  # [{'a': 1}, [0], 7, {3}, [1]]
+        assert arr.index(7) == 2 and arr.index([0]) == 1
+        del arr[0]
+        assert arr.index({3}) == 2
+        arr.reverse()  # [[1], {3}, 7, [0]]
+        assert arr.index([0]) == 3
+        with pytest.raises(ValueError):
+            arr.remove({'a': 1})
+    
+    def test_lazy_delete(self):
+        """Tombstone ile silme ve compact testi"""
+        arr = DynamicArray(lazy_delete=True)
+        arr.extend(range(10))
+        
+        assert arr.pop(2) == 2
+        assert arr.pop(0) == 0
+        # Elemanlar kaydırılmadı, sadece tombstone eklendi
+        assert arr.size == 10
+        assert len(arr) == 8
+        assert arr[0] == 1
+        assert arr[1] == 3
+        assert list(arr) == [1, 3, 4, 5, 6, 7, 8, 9]
+        assert list(reversed(arr)) == [9, 8, 7, 6, 5, 4, 3, 1]
+        assert arr.index(4) == 2
+        
+        arr[1] = 30
+        assert str(arr) == "[1, 30, 4, 5, 6, 7, 8, 9]"
+        
+        # Oran eşiği geçilince tek geçişte compact yapılır
+        for _ in range(4):
+            arr.pop(1)
+        assert arr.size == len(arr) == 4
+        assert list(arr) == [1, 7, 8, 9]
+        
+        # Kaydırma gerektiren işlemler önce compact yapar
+        arr.pop(0)
+        arr.insert(1, 0)
+        assert arr.size == 4
+        assert list(arr) == [7, 0, 8, 9]
+    
+    def test_shrink_hysteresis(self):
+        """Kapasite sınırında ekle/sil yeniden boyutlandırma yapmamalı"""
+        arr = DynamicArray(4)
+        arr.extend(range(64))
+        arr.append(64)  # 64 -> 128
+        capacity = arr.capacity
+        for _ in range(100):
+            arr.pop()
+            arr.append(0)
+        assert arr.capacity == capacity
+        
+        arr.delete_range(0, 65)
+        assert arr.capacity == 4
+    
+    def test_snapshot(self):
+        """Snapshot sonraki yazmalardan etkilenmemeli"""
+        arr = DynamicArray()
+        arr.extend(range(1000))
+        
+        snapshot = arr.snapshot()
+        assert arr.snapshot() is snapshot  # Arada yazma yok: aynı sürüm
+        assert snapshot.copied_chunks == 0
+        
+        # Sona ekleme snapshot'ın chunk'larına dokunmaz
+        arr.append(1000)
+        assert snapshot.copied_chunks == 0
+        
+        # Sadece yazılan chunk kopyalanır
+        arr[0] = -1
+        assert snapshot.copied_chunks == 1
+        assert snapshot[0] == 0
+        assert arr[0] == -1
+        
+        second = arr.snapshot()
+        assert second is not snapshot
+        arr.pop(0)
+        arr.reverse()
+        
+        assert len(snapshot) == 1000
+        assert list(snapshot) == list(range(1000))
+        assert second[0] == -1
+        assert len(second) == 1001
+        
+        with pytest.raises(TypeError):
+            snapshot[0] = 5
+        with pytest.raises(IndexError):
+            _ = snapshot[1000]
+    
+    def test_snapshot_memory(self):
+        """Kopyalanan chunk sayısı snapshot sayısına değil yazmalara bağlı olmalı"""
+        arr = DynamicArray()
+        arr.extend(range(ArraySnapshot.CHUNK_SIZE * 10))
+        snapshots = [arr.snapshot() for _ in range(5)]
+        arr.append(0)
+        snapshots += [arr.snapshot() for _ in range(5)]
+        
+        arr[0] = -1
+        copies = {id(s.chunks[0]) for s in snapshots}
+        assert len(copies) == 1
+        assert all(s.copied_chunks == 1 for s in snapshots)
+    
+    def test_extend(self):
+        """Toplu ekleme testi"""
+        arr = DynamicArray(2)
+        arr.extend(range(50))
+        assert len(arr) == 50
+        assert arr[49] == 49
+        assert arr.capacity >= 50
+        
+        arr.extend(x * 2 for x in range(3))
+        assert [arr[i] for i in range(50, 53)] == [0, 2, 4]
+    
+    def test_insert_many(self):
+        """Ortaya toplu ekleme testi"""
+        arr = DynamicArray()
+        arr.extend([1, 2, 6])
+        arr.insert_many(2, [3, 4, 5])
+        assert str(arr) == "[1, 2, 3, 4, 5, 6]"
+        
+        arr.insert_many(0, [])
+        assert len(arr) == 6
+        
+        with pytest.raises(IndexError):
+            arr.insert_many(7, [1])
+    
+    def test_delete_range(self):
+        """Aralık silme testi"""
+        arr = DynamicArray()
+        arr.extend(range(100))
+        arr.delete_range(10, 95)
+        assert len(arr) == 15
+        assert arr[9] == 9
+        assert arr[10] == 95
+        assert arr.capacity < 100
+        
+        with pytest.raises(IndexError):
+            arr.delete_range(5, 20)
+    
+    def test_slices(self):
+        """Slice ile erişim, atama ve silme testi"""
+        arr = DynamicArray()
+        arr.extend(range(10))
+        
+        part = arr[2:8:2]
+        assert isinstance(part, DynamicArray)
+        assert str(part) == "[2, 4, 6]"
+        assert str(arr[::-3]) == "[9, 6, 3, 0]"
+        
+        arr[1:3] = ["a", "b", "c", "d"]
+        assert str(arr[:7]) == "[0, 'a', 'b', 'c', 'd', 3, 4]"
+        
+        arr[::2] = [None] * 6
+        assert arr[0] is None and arr[10] is None
+        with pytest.raises(ValueError):
+            arr[::2] = [1]
+        
+        del arr[1:5]
+        assert len(arr) == 8
+        del arr[::2]
+        assert len(arr) == 4
+        del arr[0]
+        assert len(arr) == 3
+
+
+class TestTypedDynamicArray:
+    """TypedDynamicArray sınıfı için testler"""
+    
+    def test_init(self):
+        """Başlangıç durumu testi"""
+        arr = TypedDynamicArray('q')
+        assert len(arr) == 0
+        assert arr.capacity == 10
+        assert arr.itemsize == 8
+        assert arr.nbytes == 80
+        
+        with pytest.raises(ValueError):
+            TypedDynamicArray('z')
+    
+    def test_operations(self):
+        """Temel işlemler list tabanlı DynamicArray ile aynı sonucu vermeli"""
+        arr = TypedDynamicArray('i', 2)
+        for value in (30, 10, 20, 10):
+            arr.append(value)
+        
+        arr.insert(0, 5)
+        assert arr.tolist() == [5, 30, 10, 20, 10]
+        assert arr.pop() == 10
+        assert arr.pop(1) == 30
+        assert arr.index(20) == 2
+        assert arr.count(10) == 1
+        
+        arr.sort()
+        assert arr.tolist() == [5, 10, 20]
+        arr.reverse()
+        assert arr.tolist() == [20, 10, 5]
+        assert str(arr) == "[20, 10, 5]"
+        assert list(arr) == [20, 10, 5]
+        assert len(arr.data) == arr.capacity
+    
+    def test_resize_in_place(self):
+        """Boyutlandırma aynı buffer nesnesini korumalı"""
+        arr = TypedDynamicArray('d', 2)
+        buffer = arr.data
+        for i in range(100):
+            arr.append(i / 2)
+        
+        assert arr.data is buffer
+        assert arr.capacity >= 100
+        assert len(arr.data) == arr.capacity
+        assert arr[99] == 49.5
+        
+        for _ in range(95):
+            arr.pop()
+        assert arr.data is buffer
+        assert arr.capacity < 100
+        assert arr.tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+    
+    def test_bulk_operations(self):
+        """Toplu işlemler tipli buffer üzerinde de çalışmalı"""
+        arr = TypedDynamicArray('q')
+        arr.extend(range(20))
+        arr.insert_many(0, [-2, -1])
+        arr.delete_range(2, 12)
+        assert arr.tolist() == [-2, -1, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
+        
+        part = arr[::4]
+        assert isinstance(part, TypedDynamicArray)
+        assert part.tolist() == [-2, 12, 16]
+    
+    def test_type_check(self):
+        """Tipe uymayan değerler reddedilmeli"""
+        arr = TypedDynamicArray('b')
+        with pytest.raises(OverflowError):
+            arr.append(1000)
+        with pytest.raises(TypeError):
+            arr.append("a")
+
+
+class TestMappedDynamicArray:
+    """MappedDynamicArray sınıfı için testler"""
+    
+    def test_persistence(self, tmp_path):
+        """Dosya kapatılıp açıldığında elemanlar korunmalı"""
+        path = str(tmp_path / "numbers.dat")
+        with MappedDynamicArray(path, 'q', initial_capacity=2) as arr:
+            for value in (10, 20, 30):
+                arr.append(value)
+            arr[0] = 5
+            arr.insert(1, 7)
+            assert arr.pop() == 30
+            assert arr.capacity >= 4
+        
+        with MappedDynamicArray(path) as arr:
+            assert arr.typecode == 'q'
+            assert len(arr) == 3
+            assert arr.tolist() == [5, 7, 20]
+            arr.extend(range(100))
+            assert len(arr) == 103
+            arr.reverse()
+            assert list(arr)[:4] == [99, 98, 97, 96]
+            arr.reverse()
+        
+        with MappedDynamicArray(path, readonly=True) as arr:
+            assert arr[102] == 99
+            with pytest.raises(TypeError):
+                arr[0] = 1
+    
+    def test_invalid_files(self, tmp_path):
+        """Geçersiz dosya ve tip kodları reddedilmeli"""
+        path = tmp_path / "other.dat"
+        path.write_bytes(b"x" * 128)
+        with pytest.raises(ValueError):
+            MappedDynamicArray(str(path))
+        
+        with pytest.raises(ValueError):
+            MappedDynamicArray(str(tmp_path / "new.dat"), typecode='u')
+        
+        with pytest.raises(FileNotFoundError):
+            MappedDynamicArray(str(tmp_path / "missing.dat"), readonly=True)
+
+
+class TestBlockedDynamicArray:
+    """BlockedDynamicArray sınıfı için testler"""
+    
+    def test_both_ends(self):
+        """Başa ve sona ekleme/silme testi"""
+        arr = BlockedDynamicArray(block_size=4)
+        for i in range(10):
+            arr.append(i)
+            arr.insert(0, -i - 1)
+        
+        assert len(arr) == 20
+        assert arr[0] == -10
+        assert arr[19] == 9
+        assert arr.pop(0) == -10
+        assert arr.popleft() == -9
+        assert arr.pop() == 9
+        assert len(arr) == 17
+    
+    def test_middle_operations(self):
+        """Ortaya ekleme/silme bir list ile aynı sonucu vermeli"""
+        arr = BlockedDynamicArray(block_size=3)
+        expected = []
+        for i in range(40):
+            position = (i * 7) % (len(expected) + 1)
+            arr.insert(position, i)
+            expected.insert(position, i)
+        
+        for i in range(15):
+            position = (i * 5) % len(expected)
+            assert arr.pop(position) == expected.pop(position)
+        
+        assert str(arr) == str(expected)
+        # Uçlar dışındaki bloklar her zaman dolu olmalı
+        assert all(len(block) == 3 for block in list(arr.blocks)[1:-1])
+    
+    def test_adaptive_block_size(self):
+        """Blok boyutu eleman sayısıyla büyümeli"""
+        arr = BlockedDynamicArray()
+        arr.extend(range(20000))
+        assert arr.block_size > BlockedDynamicArray.MIN_BLOCK_SIZE
+        assert arr[12345] == 12345
+        
+        arr.remove(0)
+        assert arr.index(1) == 0
+        assert arr.count(5) == 1
+        
+        with pytest.raises(IndexError):
+            arr.insert(len(arr) + 1, 0)
+        with pytest.raises(ValueError):
+            arr.remove(-1)
+    
+    def test_random_operations(self):
+        """Rastgele işlem dizisi list ile aynı sonucu vermeli"""
+        rng = random.Random(7)
+        arr = BlockedDynamicArray(block_size=4)
+        expected = []
+        for i in range(3000):
+            operation = rng.randrange(6)
+            if operation == 0 or not expected:
+                position = rng.randint(0, len(expected))
+                arr.insert(position, i)
+                expected.insert(position, i)
+            elif operation == 1:
+                arr.appendleft(i)
+                expected.insert(0, i)
+            elif operation == 2:
+                arr.append(i)
+                expected.append(i)
+            elif operation == 3:
+                position = rng.randrange(len(expected))
+                assert arr.pop(position) == expected.pop(position)
+            elif operation == 4:
+                assert arr.popleft() == expected.pop(0)
+            else:
+                position = rng.randrange(len(expected))
+                arr[position] = -i
+                expected[position] = -i
+            
+            assert len(arr) == len(expected)
+            blocks = arr.blocks
+            assert all(len(block) == 4 for block in blocks[1:-1])
+            assert all(len(block) > 0 for block in blocks)
+        assert [arr[i] for i in range(len(arr))] == expected
+    
+    def test_sort_reverse(self):
+        """Sıralama ve ters çevirme testi"""
+        arr = BlockedDynamicArray(block_size=2)
+        arr.extend([3, 1, 2, 5, 4])
+        arr.sort()
+        assert str(arr) == "[1, 2, 3, 4, 5]"
+        arr.reverse()
+        assert str(arr) == "[5, 4, 3, 2, 1]"
+    
+    def test_dynamic_array_interface(self):
+        """Slice, iterasyon ve toplu işlemlerin list ile karşılaştırılması"""
+        arr = BlockedDynamicArray(block_size=4)
+        arr.extend(range(30))
+        expected = list(range(30))
+        
+        assert list(arr) == expected
+        assert list(reversed(arr)) == expected[::-1]
+        assert 17 in arr and 30 not in arr
+        assert list(arr[1:3]) == [1, 2]
+        assert list(arr[::-7]) == expected[::-7]
+        assert isinstance(arr[5:], BlockedDynamicArray)
+        
+        arr.insert_many(5, [-1, -2, -3])
+        expected[5:5] = [-1, -2, -3]
+        arr.delete_range(10, 20)
+        del expected[10:20]
+        assert list(arr) == expected
+        
+        arr[2:4] = ['a', 'b', 'c', 'd']
+        expected[2:4] = ['a', 'b', 'c', 'd']
+        arr[::3] = range(len(expected[::3]))
+        expected[::3] = range(len(expected[::3]))
+        del arr[1::4]
+        del expected[1::4]
+        del arr[0]
+        del expected[0]
+        arr[3:] = []
+        expected[3:] = []
+        assert list(arr) == expected
+        assert arr.blocks and all(len(block) > 0 for block in arr.blocks)
+        
+        with pytest.raises(ValueError):
+            arr[::2] = [1, 2, 3, 4]
+        with pytest.raises(IndexError):
+            arr.insert_many(len(arr) + 1, [0])
+        with pytest.raises(IndexError):
+            arr.delete_range(2, 1)
+    
+    def test_bulk_operations_adaptive(self):
+        """Büyük toplu işlemlerden sonra blok boyutu √n civarında kalmalı"""
+        arr = BlockedDynamicArray()
+        arr.extend(range(10))
+        arr.insert_many(5, range(100000))
+        assert len(arr) == 100010
+        assert arr.size <= 4 * arr.block_size ** 2
+        assert arr[5] == 0 and arr[100005] == 5
+        arr.delete_range(0, 100000)
+        assert list(arr) == list(range(99995, 100000)) + [5, 6, 7, 8, 9]
+        assert arr.block_size == BlockedDynamicArray.MIN_BLOCK_SIZE
 
 
 class TestStaticArray:
@@ -210,7 +743,232 @@ class TestStaticArray:
         
         with pytest.raises(IndexError):
             _ = arr[3]
+    
+    def test_iteration_and_view(self):
+        """İterasyon ve görünüm testi"""
+        arr = StaticArray(4)
+        for i in range(4):
+            arr[i] = i * 10
+        
+        assert list(arr) == [0, 10, 20, 30]
+        assert list(reversed(arr)) == [30, 20, 10, 0]
+        
+        view = arr.view(2, writable=True)
+        assert isinstance(view, ArrayView)
+        view[0] = 25
+        assert arr[2] == 25
 
 
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__]) 
+
+
+class TestRingArray:
+    """RingArray sınıfı için testler"""
+    
+    def test_push_overwrites_oldest(self):
+        """Dolu pencerede push en eski elemanın üzerine yazmalı"""
+        ring = RingArray(3)
+        assert ring.push(1) is None
+        ring.extend([2, 3])
+        assert ring.full
+        
+        assert ring.push(4) == 1
+        assert len(ring) == 3
+        assert ring[0] == 2
+        assert ring[2] == 4
+        assert list(ring) == [2, 3, 4]
+        assert list(reversed(ring)) == [4, 3, 2]
+        
+        with pytest.raises(IndexError):
+            _ = ring[3]
+    
+    def test_segments(self):
+        """İki bitişik bölge kopyasız ve sıralı dönmeli"""
+        ring = RingArray(4)
+        ring.extend([1, 2, 3])
+        first, second = ring.segments()
+        assert list(first) == [1, 2, 3]
+        assert len(second) == 0
+        
+        ring.extend([4, 5, 6])
+        first, second = ring.segments()
+        assert isinstance(first, ArrayView)
+        assert list(first) == [3, 4]
+        assert list(second) == [5, 6]
+    
+    def test_aggregates(self):
+        """Pencere toplamı, ortalaması, minimumu ve maksimumu"""
+        ring = RingArray(3)
+        with pytest.raises(ValueError):
+            ring.min()
+        
+        values = [5, 1, 4, 2, 8, 0, 7, 7]
+        for i, value in enumerate(values):
+            ring.push(value)
+            window = values[max(0, i - 2):i + 1]
+            assert ring.sum() == sum(window)
+            assert ring.mean() == sum(window) / len(window)
+            assert ring.min() == min(window)
+            assert ring.max() == max(window)
+        
+        ring.clear()
+        assert len(ring) == 0
+        assert ring.sum() == 0
+    
+    def test_float_sum_after_spike(self):
+        """Pencereden çıkan büyük bir değer küçük değerlerin toplamını bozmamalı"""
+        ring = RingArray(2)
+        ring.extend([1e20, 1.0, 1.0])
+        assert ring.sum() == 2.0
+        assert ring.mean() == 1.0
+        
+        rng = random.Random(4)
+        ring = RingArray(5)
+        values = []
+        for _ in range(5000):
+            value = rng.choice([1e20, -1e18, 1e-3, rng.random()])
+            ring.push(value)
+            values.append(value)
+            assert ring.sum() == pytest.approx(math.fsum(values[-5:]), rel=1e-12, abs=1e-9)
+
+
+class TestFenwickTree:
+    """FenwickTree sınıfı için testler"""
+    
+    def test_prefix_and_range_sum(self):
+        """Önek ve aralık toplamları"""
+        values = [5, 3, 7, 9, 6, 4, 1, 2]
+        tree = FenwickTree(values)
+        
+        for stop in range(len(values) + 1):
+            assert tree.prefix_sum(stop) == sum(values[:stop])
+        assert tree.range_sum(2, 6) == sum(values[2:6])
+        assert tree.range_sum(3, 3) == 0
+        
+        with pytest.raises(IndexError):
+            tree.range_sum(0, 9)
+    
+    def test_point_update(self):
+        """Nokta güncelleme testi"""
+        arr = TypedDynamicArray('q')
+        arr.extend(range(10))
+        tree = FenwickTree(arr)
+        
+        tree.add(3, 10)
+        tree[5] = 0
+        assert tree[3] == 13
+        assert tree[5] == 0
+        assert tree.prefix_sum(10) == sum(range(10)) + 10 - 5
+
+
+class TestSegmentTree:
+    """SegmentTree sınıfı için testler"""
+    
+    def test_range_queries(self):
+        """Aralık toplamı, minimumu ve maksimumu"""
+        arr = DynamicArray()
+        arr.extend([5, 3, 7, 9, 6, 4, 1])
+        tree = SegmentTree(arr)
+        
+        assert tree.range_sum(1, 5) == 25
+        assert tree.range_min(1, 5) == 3
+        assert tree.range_max(1, 5) == 9
+        assert tree.range_min(6, 7) == 1
+        
+        with pytest.raises(ValueError):
+            tree.range_min(2, 2)
+        with pytest.raises(IndexError):
+            tree.range_sum(0, 8)
+    
+    def test_updates(self):
+        """Nokta güncelleme ve aralığa ekleme (lazy propagation)"""
+        values = [5, 3, 7, 9, 6, 4, 1]
+        tree = SegmentTree(values)
+        
+        tree.range_add(0, 4, 10)
+        tree[5] = 20
+        tree.range_add(3, 7, -2)
+        expected = [15, 13, 17, 17, 4, 18, -1]
+        
+        assert tree.tolist() == expected
+        assert tree[3] == 17
+        for start in range(len(expected)):
+            for stop in range(start + 1, len(expected) + 1):
+                window = expected[start:stop]
+                assert tree.range_sum(start, stop) == sum(window)
+                assert tree.range_min(start, stop) == min(window)
+                assert tree.range_max(start, stop) == max(window)
+
+
+class TestBitArray:
+    """BitArray sınıfı için testler"""
+    
+    def test_set_and_get(self):
+        """Bit atama, erişim ve set arayüzü"""
+        bits = BitArray(20)
+        assert bits.nbytes == 3
+        bits[3] = True
+        bits.add(17)
+        assert bits[3] and bits[17]
+        assert not bits[4]
+        assert 17 in bits
+        assert 25 not in bits
+        
+        bits.discard(17)
+        assert 17 not in bits
+        assert bits.count() == 1
+        assert bits.count(False) == 19
+        
+        with pytest.raises(IndexError):
+            bits[20] = True
+    
+    def test_bulk_operations(self):
+        """and / or / xor / andnot / invert"""
+        a = BitArray.from_indices(10, [0, 2, 4, 6])
+        b = BitArray.from_indices(10, [2, 3, 4])
+        
+        assert list((a & b).iter_set()) == [2, 4]
+        assert list((a | b).iter_set()) == [0, 2, 3, 4, 6]
+        assert list((a ^ b).iter_set()) == [0, 3, 6]
+        assert list(a.andnot(b).iter_set()) == [0, 6]
+        assert list((~a).iter_set()) == [1, 3, 5, 7, 8, 9]
+        
+        a |= b
+        assert a.count() == 5
+        with pytest.raises(ValueError):
+            a & BitArray(11)
+    
+    def test_find_rank_select(self):
+        """Sonraki set bit, rank ve select"""
+        positions = [1, 9, 70, 511, 512, 1000]
+        bits = BitArray.from_indices(1024, positions)
+        
+        assert bits.find_next(0) == 1
+        assert bits.find_next(10) == 70
+        assert bits.find_next(1001) == -1
+        assert bits.find_next_clear(1) == 2
+        
+        for k, position in enumerate(positions):
+            assert bits.rank(position) == k
+            assert bits.select(k) == position
+        assert bits.rank(1024) == len(positions)
+        
+        bits[600] = True  # Yazma sonrası rank dizini yenilenmeli
+        assert bits.rank(1000) == 6
+        assert bits.select(5) == 600
+    
+    def test_graph_visited(self):
+        """BFS/DFS ziyaret yapısı olarak BitArray"""
+        graph = Graph()
+        for u, v in [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)]:
+            graph.add_edge(u, v)
+        
+        visited = BitArray(6)
+        distances = breadth_first_search(graph, 0, visited=visited)
+        assert distances == breadth_first_search(graph, 0)
+        assert visited.count() == 5
+        
+        visited = BitArray(6)
+        order = depth_first_search_iterative(graph, 0, visited=visited)
+        assert order == depth_first_search_iterative(graph, 0)
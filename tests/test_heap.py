@@ -0,0 +1,108 @@
+"""
+Heap Veri Yapısı Test Dosyası
+
+Bu dosya, heap.py modülündeki çekirdek fonksiyonları ve DaryHeap'i test eder.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import pytest
+from data_structures.heaps.heap import (
+    DaryHeap, build_heap, sift_down, sift_up, heap_push, heap_pop, heap_replace,
+    is_heap
+)
+from algorithms.sorting.sorting_algorithms import heap_sort
+from algorithms.graph_algorithms.graph_algorithms import (
+    Graph, dijkstra_shortest_path, prim_mst
+)
+
+
+ARITIES = [2, 3, 4, 8]
+
+
+class TestHeapKernels:
+    """sift_up / sift_down / build_heap testleri"""
+    
+    @pytest.mark.parametrize("arity", ARITIES)
+    def test_build_heap(self, arity):
+        """Floyd yöntemi heap özelliğini sağlamalı"""
+        rng = random.Random(arity)
+        for n in (0, 1, 2, 7, 100, 1001):
+            heap = [rng.randint(0, 50) for _ in range(n)]
+            build_heap(heap, arity)
+            assert is_heap(heap, arity)
+    
+    @pytest.mark.parametrize("arity", ARITIES)
+    def test_range_heap(self, arity):
+        """low/high ile sadece verilen aralık heap'e çevrilmeli"""
+        data = list(range(30, 0, -1))
+        heap = list(data)
+        build_heap(heap, arity, 5, 20)
+        assert heap[:5] == data[:5] and heap[20:] == data[20:]
+        assert is_heap(heap[5:20], arity)
+        
+        heap[5] = 100
+        sift_down(heap, 0, 15, arity, low=5)
+        assert is_heap(heap[5:20], arity)
+        heap[19] = -1
+        sift_up(heap, 14, arity, low=5)
+        assert heap[5] == -1 and is_heap(heap[5:20], arity)
+    
+    @pytest.mark.parametrize("arity", ARITIES)
+    def test_push_pop(self, arity):
+        """Elemanlar sıralı çıkmalı"""
+        rng = random.Random(7)
+        values = [rng.random() for _ in range(500)]
+        heap = []
+        for value in values:
+            heap_push(heap, value, arity)
+        assert heap_replace(heap, 2.0, arity) == min(values)
+        result = [heap_pop(heap, arity) for _ in range(len(heap))]
+        assert result == sorted(values)[1:] + [2.0]
+
+
+class TestDaryHeap:
+    """DaryHeap öncelik kuyruğu testleri"""
+    
+    def test_priority_queue(self):
+        """Başlangıç elemanları ve push sonrası sıralı pop"""
+        heap = DaryHeap([5, 3, 8, 1], arity=4)
+        heap.push(0)
+        assert len(heap) == 5 and heap.peek() == 0
+        assert [heap.pop() for _ in range(len(heap))] == [0, 1, 3, 5, 8]
+        assert not heap
+    
+    def test_errors(self):
+        """Boş heap ve geçersiz arity hata vermeli"""
+        with pytest.raises(IndexError):
+            DaryHeap().pop()
+        with pytest.raises(IndexError):
+            DaryHeap().peek()
+        with pytest.raises(ValueError):
+            DaryHeap(arity=1)
+
+
+class TestHeapUsers:
+    """Heap çekirdeklerini kullanan algoritmalar"""
+    
+    @pytest.mark.parametrize("arity", ARITIES)
+    def test_heap_sort(self, arity):
+        rng = random.Random(arity)
+        data = [rng.randint(0, 100) for _ in range(300)]
+        assert heap_sort(data, arity=arity) == sorted(data)
+        records = [(x, i) for i, x in enumerate(data)]
+        assert heap_sort(records, key=lambda r: r[0], reverse=True, arity=arity) == \
+            sorted(records, key=lambda r: r[0], reverse=True)
+    
+    @pytest.mark.parametrize("arity", ARITIES)
+    def test_graph_priority_queues(self, arity):
+        graph = Graph()
+        for u, v, w in [(0, 1, 4), (0, 2, 2), (1, 2, 1), (1, 3, 5), (2, 3, 8),
+                        (2, 4, 10), (3, 4, 2), (3, 5, 6), (4, 5, 3)]:
+            graph.add_edge(u, v, w)
+        assert dijkstra_shortest_path(graph, 0, arity) == \
+            {0: 0, 1: 3, 2: 2, 3: 8, 4: 10, 5: 13}
+        assert sum(weight for _, _, weight in prim_mst(graph, 0, arity)) == 13
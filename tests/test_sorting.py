@@ -0,0 +1,622 @@
+"""
+Sıralama Algoritmaları Test Dosyası
+
+Bu dosya, sorting_algorithms.py modülündeki fonksiyonları test eder.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import random
+import subprocess
+import pytest
+from algorithms.sorting.sorting_algorithms import (
+    bubble_sort, selection_sort, insertion_sort, merge_sort, tim_sort, quick_sort,
+    heap_sort, counting_sort, radix_sort, heap_sort_range, gallop_left, gallop_right,
+    counting_sort_by_key, counting_strategy
+)
+from algorithms.sorting.external_sort import external_sort
+from algorithms.sorting import parallel_sort as parallel
+from algorithms.sorting.smart_sort import smart_sort, plan_sort, SortThresholds
+from algorithms.sorting.string_sort import string_sort
+from algorithms.sorting import benchmark
+from algorithms.sorting.instrumentation import count_operations, _decode_actions
+from algorithms.sorting.selection import (
+    nth_element, quickselect, partial_sort, top_k, introselect_range
+)
+
+
+ALL_SORTS = [bubble_sort, selection_sort, insertion_sort, merge_sort, tim_sort,
+             quick_sort, heap_sort, counting_sort, radix_sort]
+
+
+def sample_inputs():
+    """Farklı desenlerde test girdileri"""
+    rng = random.Random(42)
+    return [
+        [],
+        [1],
+        [64, 34, 25, 12, 22, 11, 90],
+        [rng.randint(0, 1000) for _ in range(500)],
+        [rng.randint(0, 3) for _ in range(500)],
+        list(range(300)),
+        list(range(300, 0, -1)),
+        [5] * 200,
+    ]
+
+
+class TestSortingAlgorithms:
+    """Tüm sıralama algoritmaları için ortak testler"""
+    
+    @pytest.mark.parametrize("sort_func", ALL_SORTS, ids=lambda f: f.__name__)
+    def test_sorts_correctly(self, sort_func):
+        """Her algoritma sorted() ile aynı sonucu vermeli"""
+        for data in sample_inputs():
+            original = data.copy()
+            assert sort_func(data) == sorted(data)
+            assert data == original  # Girdi değiştirilmemeli
+    
+    @pytest.mark.parametrize("sort_func", ALL_SORTS, ids=lambda f: f.__name__)
+    def test_key_and_reverse(self, sort_func):
+        """key ile sıralama kararlı olmalı, key her eleman için bir kez çağrılmalı"""
+        rng = random.Random(3)
+        data = [(rng.randint(0, 20), i) for i in range(150)]
+        calls = []
+        
+        def key(item):
+            calls.append(item)
+            return item[0]
+        
+        assert sort_func(data, key=key) == sorted(data, key=lambda x: x[0])
+        assert len(calls) == len(data)
+        
+        expected = sorted(data, key=lambda x: x[0], reverse=True)
+        assert sort_func(data, key=lambda x: x[0], reverse=True) == expected
+        
+        numbers = [x for x, _ in data]
+        assert sort_func(numbers, reverse=True) == sorted(numbers, reverse=True)
+    
+    def test_key_chaining(self):
+        """Kararlı sıralamalar ikincil anahtardan birincile zincirlenebilmeli"""
+        students = [("Can", 3.1), ("Ali", 3.8), ("Ece", 3.1), ("Ali", 3.1)]
+        by_name = merge_sort(students, key=lambda s: s[0])
+        by_gpa_then_name = quick_sort(by_name, key=lambda s: s[1], reverse=True)
+        assert by_gpa_then_name == [("Ali", 3.8), ("Ali", 3.1), ("Can", 3.1), ("Ece", 3.1)]
+    
+    def test_import_leaves_sys_path(self):
+        """Paket olarak import edilen modüller sys.path'i değiştirmemeli"""
+        modules = [
+            'algorithms.sorting.sorting_algorithms',
+            'algorithms.graph_algorithms.graph_algorithms',
+            'data_structures.arrays.mapped_array',
+            'algorithms.sorting.benchmark',
+            'algorithms.sorting.parallel_sort',
+            'algorithms.sorting.instrumentation',
+            'algorithms.sorting.smart_sort',
+            'algorithms.sorting.external_sort',
+            'algorithms.sorting.selection',
+            'algorithms.sorting.string_sort',
+        ]
+        code = ("import importlib, sys; before = list(sys.path); "
+                f"[importlib.import_module(name) for name in {modules!r}]; "
+                "sys.exit(sys.path != before)")
+        root = os.path.join(os.path.dirname(__file__), '..')
+        assert subprocess.run([sys.executable, '-c', code], cwd=root).returncode == 0
+
+
+class Record:
+    """Sadece key'e göre karşılaştırılan kayıt (kararlılık testleri için)"""
+    
+    def __init__(self, key, order):
+        self.key = key
+        self.order = order
+    
+    def __lt__(self, other):
+        return self.key < other.key
+    
+    def __le__(self, other):
+        return self.key <= other.key
+    
+    def __gt__(self, other):
+        return self.key > other.key
+
+
+def assert_stable(result, data):
+    """Eşit key'li kayıtlar orijinal sıralarını korumalı"""
+    expected = sorted(data, key=lambda record: record.key)
+    assert [(r.key, r.order) for r in result] == [(r.key, r.order) for r in expected]
+
+
+class TestMergeSort:
+    """Bottom-up merge_sort testleri"""
+    
+    def test_stable(self):
+        """Eşit elemanların sırası korunmalı (galloping dahil)"""
+        rng = random.Random(7)
+        for key_range in (2, 50, 10 ** 6):
+            data = [Record(rng.randint(0, key_range), i) for i in range(1000)]
+            assert_stable(merge_sort(data), data)
+    
+    def test_gallop(self):
+        """Üstel arama bisect ile aynı sonucu vermeli"""
+        data = [0, 1, 1, 1, 2, 4, 4, 9]
+        for value in range(-1, 11):
+            for low in range(len(data) + 1):
+                assert gallop_left(data, value, low, len(data)) == max(
+                    low, sum(1 for x in data if x < value))
+                assert gallop_right(data, value, low, len(data)) == max(
+                    low, sum(1 for x in data if x <= value))
+
+
+class TestTimSort:
+    """Uyarlamalı tim_sort testleri"""
+    
+    def test_stable_with_runs(self):
+        """Artan/azalan run'lar içeren girdilerde kararlı olmalı"""
+        rng = random.Random(11)
+        keys = sorted(rng.randint(0, 100) for _ in range(3000))
+        keys[500:1500] = keys[500:1500][::-1]
+        keys += [rng.randint(0, 100) for _ in range(200)]
+        data = [Record(key, i) for i, key in enumerate(keys)]
+        assert_stable(tim_sort(data), data)
+    
+    def test_adaptive_comparisons(self):
+        """Sıralı ve ters sıralı girdilerde n - 1 karşılaştırma yapmalı"""
+        comparisons = [0]
+        
+        class Counted(Record):
+            def __lt__(self, other):
+                comparisons[0] += 1
+                return self.key < other.key
+        
+        for keys in (range(5000), range(5000, 0, -1)):
+            comparisons[0] = 0
+            data = [Counted(key, i) for i, key in enumerate(keys)]
+            result = tim_sort(data)
+            assert [r.key for r in result] == sorted(keys)
+            assert comparisons[0] == len(data) - 1
+
+
+class TestRadixSort:
+    """Byte tabanlı LSD radix_sort testleri"""
+    
+    def test_negative_and_wide_integers(self):
+        """Negatif ve 64 bitten geniş tamsayılar doğru sıralanmalı"""
+        data = [3, -5, 1, 0, -(10 ** 30), 10 ** 25, -1, 2 ** 64 + 1, 2 ** 64]
+        for digit_bits in (8, 16):
+            assert radix_sort(data, digit_bits=digit_bits) == sorted(data)
+    
+    def test_floats(self):
+        """float anahtarlar IEEE-754 bit desenine göre sıralanmalı"""
+        data = [2.5, -0.5, 1e300, -1e-300, 0.0, float('-inf'), 3, -7, float('inf')]
+        assert radix_sort(data) == sorted(data)
+        
+        records = [(-1.5, "a"), (2.0, "b"), (-1.5, "c"), (0.25, "d")]
+        assert radix_sort(records, key=lambda r: r[0], reverse=True) == \
+            [(2.0, "b"), (0.25, "d"), (-1.5, "a"), (-1.5, "c")]
+    
+    def test_invalid_keys(self):
+        """Sayısal olmayan anahtarlar TypeError vermeli"""
+        with pytest.raises(TypeError):
+            radix_sort(["b", "a"])
+
+
+class TestCountingSort:
+    """Aralığa duyarlı counting_sort testleri"""
+    
+    def test_strategy_choice(self):
+        """Dar aralık yoğun, az farklı key seyrek, diğerleri radix olmalı"""
+        assert counting_strategy(100, 400, 100) == 'dense'
+        assert counting_strategy(100, 10 ** 9, 25) == 'sparse'
+        assert counting_strategy(100, 10 ** 9, 100) == 'radix'
+    
+    def test_sparse_range(self):
+        """Geniş aralıkta dev sayaç dizisi ayrılmadan sıralamalı"""
+        assert counting_sort([10 ** 9, 0]) == [0, 10 ** 9]
+        assert counting_sort([10 ** 18, -(10 ** 18), 5]) == [-(10 ** 18), 5, 10 ** 18]
+        
+        rng = random.Random(3)
+        pool = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(10)]
+        data = [(rng.choice(pool), i) for i in range(400)]
+        for reverse in (False, True):
+            result = counting_sort(data, key=lambda r: r[0], reverse=reverse)
+            assert result == sorted(data, key=lambda r: r[0], reverse=reverse)
+    
+    def test_by_key(self):
+        """Sınırlı key ile kararlı sıralamalı, aralık dışı key hata vermeli"""
+        records = [(20, "a"), (19, "b"), (20, "c"), (0, "d"), (19, "e")]
+        assert counting_sort_by_key(records, key=lambda r: r[0], max_key=150) == \
+            [(0, "d"), (19, "b"), (19, "e"), (20, "a"), (20, "c")]
+        assert counting_sort_by_key(records, key=lambda r: r[0], max_key=150,
+                                    reverse=True)[0] == (20, "a")
+        assert counting_sort_by_key([], key=lambda r: r[0], max_key=10) == []
+        with pytest.raises(ValueError):
+            counting_sort_by_key(records, key=lambda r: r[0], max_key=19)
+
+
+class TestQuickSort:
+    """Introsort tabanlı quick_sort testleri"""
+    
+    def test_adversarial_inputs(self):
+        """Sıralı, ters sıralı ve eşit girdilerde özyineleme limiti aşılmamalı"""
+        n = sys.getrecursionlimit() * 5
+        for data in (list(range(n)), list(range(n, 0, -1)), [7] * n):
+            assert quick_sort(data) == sorted(data)
+    
+    def test_heap_sort_range(self):
+        """Derinlik limiti yedeği sadece verilen aralığı sıralamalı"""
+        data = [9, 8, 7, 3, 1, 2, 0]
+        heap_sort_range(data, 2, 6)
+        assert data == [9, 8, 1, 2, 3, 7, 0]
+
+
+class TestExternalSort:
+    """external_sort testleri"""
+    
+    def test_multi_pass_stable(self, tmp_path):
+        """Küçük bellek ve fan_in ile çok geçişli birleştirme kararlı olmalı"""
+        rng = random.Random(5)
+        lines = [f"{rng.randint(0, 50)},{i}\n" for i in range(2000)]
+        input_path = tmp_path / "input.txt"
+        output_path = tmp_path / "output.txt"
+        input_path.write_text("".join(lines), encoding="utf-8")
+        
+        def key(line):
+            return int(line.split(",")[0])
+        
+        count = external_sort(str(input_path), str(output_path), key=key,
+                              memory_limit=4096, fan_in=2)
+        assert count == len(lines)
+        assert output_path.read_text(encoding="utf-8") == "".join(sorted(lines, key=key))
+        
+        external_sort(str(input_path), str(output_path), key=key, reverse=True,
+                      memory_limit=4096, fan_in=3)
+        expected = sorted(lines, key=key, reverse=True)
+        assert output_path.read_text(encoding="utf-8") == "".join(expected)
+    
+    def test_edge_cases(self, tmp_path):
+        """Boş dosya ve satır sonu olmayan son kayıt"""
+        input_path = tmp_path / "input.txt"
+        output_path = tmp_path / "output.txt"
+        
+        input_path.write_text("", encoding="utf-8")
+        assert external_sort(str(input_path), str(output_path)) == 0
+        assert output_path.read_text(encoding="utf-8") == ""
+        
+        input_path.write_text("b\nc\na", encoding="utf-8")
+        assert external_sort(str(input_path), str(output_path)) == 3
+        assert output_path.read_text(encoding="utf-8") == "a\nb\nc\n"
+        
+        with pytest.raises(ValueError):
+            external_sort(str(input_path), str(output_path), fan_in=1)
+    
+    def test_embedded_carriage_return(self, tmp_path):
+        """Kayıtlar sadece \\n ile biter; \\r ve \\r\\n kayıt içinde aynen kalır"""
+        input_path = tmp_path / "input.txt"
+        output_path = tmp_path / "output.txt"
+        input_path.write_bytes(b"b\r\na\rc\nz")
+        assert external_sort(str(input_path), str(output_path), memory_limit=1,
+                             fan_in=2) == 3
+        assert output_path.read_bytes() == b"a\rc\nb\r\nz\n"
+
+
+def record_key(record):
+    """Süreçlere gönderilebilen (modül seviyesinde) key fonksiyonu"""
+    return record[0]
+
+
+class TestParallelSort:
+    """parallel_sort testleri"""
+    
+    def test_numeric_shared_memory(self):
+        """Sayısal girdiler paylaşımlı bellek yolundan doğru sıralanmalı"""
+        from array import array
+        rng = random.Random(8)
+        ints = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(parallel.MIN_PARALLEL_SIZE)]
+        assert parallel.parallel_sort(ints, workers=3) == sorted(ints)
+        
+        floats = array('d', (rng.random() for _ in range(parallel.MIN_PARALLEL_SIZE)))
+        result = parallel.parallel_sort(floats, workers=2)
+        assert isinstance(result, array)
+        assert result.tolist() == sorted(floats)
+    
+    def test_without_shared_memory(self, monkeypatch):
+        """shared_memory yoksa (Python 3.7) sayısal girdiler tek süreçte sıralanmalı"""
+        from array import array
+        monkeypatch.setattr(parallel, 'shared_memory', None)
+        rng = random.Random(10)
+        ints = [rng.randint(-100, 100) for _ in range(parallel.MIN_PARALLEL_SIZE)]
+        assert parallel.parallel_sort(ints, workers=2) == sorted(ints)
+        result = parallel.parallel_sort(array('q', ints), workers=2)
+        assert isinstance(result, array) and result.tolist() == sorted(ints)
+    
+    def test_pickled_key_reverse_stable(self):
+        """Genel nesneler key/reverse ile kararlı sıralanmalı"""
+        rng = random.Random(9)
+        records = [(rng.randint(0, 30), i) for i in range(parallel.MIN_PARALLEL_SIZE)]
+        assert parallel.parallel_sort(records, workers=3, key=record_key) == \
+            sorted(records, key=record_key)
+        assert parallel.parallel_sort(records, workers=2, key=record_key, reverse=True) == \
+            sorted(records, key=record_key, reverse=True)
+    
+    def test_split_points(self):
+        """Ayırıcıya eşit anahtarlar soldaki kovaya düşmeli"""
+        assert parallel._split_points([1, 2, 2, 3, 5], [2, 4], False) == [0, 3, 4, 5]
+        assert parallel._split_points([5, 3, 2, 2, 1], [4, 2], True) == [0, 1, 4, 5]
+
+
+class TestSmartSort:
+    """Profil tabanlı smart_sort testleri"""
+    
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_sorts_every_input(self, reverse):
+        """Her girdide ve key ile doğru ve kararlı sıralamalı"""
+        inputs = sample_inputs() + [[random.random() for _ in range(300)],
+                                    [str(x) for x in range(300, 0, -7)]]
+        for data in inputs:
+            assert smart_sort(data, reverse=reverse) == sorted(data, reverse=reverse)
+            records = [(x, i) for i, x in enumerate(data)]
+            assert smart_sort(records, key=lambda r: r[0], reverse=reverse) == \
+                sorted(records, key=lambda r: r[0], reverse=reverse)
+    
+    def test_decisions(self):
+        """Profil beklenen algoritmaya yönlendirmeli"""
+        rng = random.Random(5)
+        n = 2000
+        cases = [
+            ([3, 1, 2], 'insertion'),
+            (list(range(n)), 'tim'),
+            (list(range(n, 0, -1)), 'tim'),
+            ([rng.randint(0, 100) for _ in range(n)], 'counting'),
+            ([rng.choice((-10 ** 9, 7, 10 ** 12)) for _ in range(n)], 'counting'),
+            ([rng.random() for _ in range(n)], 'quick'),
+        ]
+        for data, algorithm in cases:
+            assert plan_sort(data).algorithm == algorithm
+        
+        wide = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(n)]
+        assert plan_sort(wide).algorithm == 'quick'
+        assert plan_sort(wide, thresholds=SortThresholds(radix_min_size=n)).algorithm == 'radix'
+    
+    def test_decision_is_logged(self, caplog):
+        """Karar DEBUG seviyesinde loglanmalı"""
+        with caplog.at_level('DEBUG', logger='smart_sort'):
+            smart_sort(list(range(100)))
+        assert 'nearly sorted' in caplog.text
+
+
+class TestSelection:
+    """nth_element, quickselect, partial_sort ve top_k testleri"""
+    
+    def test_nth_element(self):
+        """k. eleman yerine gelmeli, solu küçük-eşit, sağı büyük-eşit olmalı"""
+        rng = random.Random(11)
+        for data in sample_inputs()[1:]:
+            expected = sorted(data)
+            for k in {0, len(data) // 2, len(data) - 1}:
+                arr = list(data)
+                assert nth_element(arr, k) == expected[k]
+                assert all(x <= arr[k] for x in arr[:k])
+                assert all(x >= arr[k] for x in arr[k + 1:])
+                assert quickselect(data, k) == expected[k]
+        
+        records = [(rng.randint(0, 5), i) for i in range(100)]
+        expected = sorted(records, key=lambda r: r[0], reverse=True)
+        assert quickselect(records, 40, key=lambda r: r[0], reverse=True) == expected[40]
+        with pytest.raises(IndexError):
+            nth_element([1, 2], 2)
+    
+    def test_median_of_medians_fallback(self):
+        """Derinlik limiti aşıldığında median-of-medians ile doğru seçmeli"""
+        for data in sample_inputs()[3:]:
+            arr = list(data)
+            introselect_range(arr, 0, len(arr), len(arr) // 3, depth_limit=0)
+            assert arr[len(arr) // 3] == sorted(data)[len(data) // 3]
+    
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_partial_sort(self, reverse):
+        """İlk k eleman sıralı ve kararlı olmalı, diğerleri korunmalı"""
+        rng = random.Random(12)
+        records = [(rng.randint(0, 20), i) for i in range(300)]
+        expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+        for k in (0, 1, 10, 300, 400):
+            result = partial_sort(records, k, key=lambda r: r[0], reverse=reverse)
+            assert result[:k] == expected[:k]
+            assert sorted(result) == sorted(records)
+        assert partial_sort([5, 1, 4, 2, 3], 2)[:2] == [1, 2]
+    
+    def test_top_k(self):
+        """Akıştan en iyi k eleman sıralı ve kararlı dönmeli"""
+        records = [(3, "a"), (5, "b"), (3, "c"), (9, "d"), (5, "e")]
+        stream = iter(records)
+        assert top_k(stream, 3, key=lambda r: r[0]) == [(9, "d"), (5, "b"), (5, "e")]
+        assert top_k(records, 2, key=lambda r: r[0], largest=False) == [(3, "a"), (3, "c")]
+        assert top_k(records, 10, key=lambda r: r[0]) == \
+            sorted(records, key=lambda r: r[0], reverse=True)
+        assert top_k(records, 0) == []
+
+
+class TestStringSort:
+    """MSD radix string_sort testleri"""
+    
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_matches_builtin_order(self, reverse):
+        """Kısa/uzun, ortak önekli ve Unicode anahtarlar kararlı sıralanmalı"""
+        rng = random.Random(21)
+        words = ["".join(rng.choice("abçşAB") for _ in range(rng.randint(0, 6)))
+                 for _ in range(500)]
+        records = [(word, i) for i, word in enumerate(words)]
+        assert string_sort(words, reverse=reverse) == sorted(words, reverse=reverse)
+        assert string_sort(records, key=lambda r: r[0], reverse=reverse) == \
+            sorted(records, key=lambda r: r[0], reverse=reverse)
+    
+    def test_casefold(self):
+        """casefold=True büyük/küçük harfi yok saymalı, eşitler sırasını korumalı"""
+        names = ["zeynep", "Ahmet", "ali", "Ali", "STRASSE", "straße"]
+        assert string_sort(names, casefold=True) == \
+            ["Ahmet", "ali", "Ali", "STRASSE", "straße", "zeynep"]
+    
+    def test_long_common_prefix(self):
+        """Uzun ortak önekler özyineleme limitine takılmamalı"""
+        prefix = "a" * (sys.getrecursionlimit() * 2)
+        data = [prefix + c for c in "dcba"] * 20 + [prefix]
+        assert string_sort(data) == sorted(data)
+    
+    def test_wide_alphabet(self):
+        """Binlerce farklı ilk karakter: kova karakterleri O(σ²) sıralanmamalı"""
+        rng = random.Random(5)
+        keys = [chr(0x4E00 + i) + "".join(chr(rng.randint(0x4E00, 0x9FFF)) for _ in range(2))
+                for i in range(3000)]
+        rng.shuffle(keys)
+        result, counts = count_operations(string_sort, keys)
+        assert result == sorted(keys)
+        # insertion sort ile σ = 3000 karakter ~σ² / 4 hareket yapardı
+        assert counts.moves < 5 * len(keys)
+    
+    def test_invalid_keys(self):
+        with pytest.raises(TypeError):
+            string_sort([1, "a"])
+
+
+class TestBenchmark:
+    """benchmark.py ölçüm ve karşılaştırma testleri"""
+    
+    def test_distributions(self):
+        """Her dağılım n elemanlı ve tekrarlanabilir olmalı"""
+        for name, make in benchmark.DISTRIBUTIONS.items():
+            data = make(100, random.Random(1))
+            assert len(data) == 100
+            assert data == make(100, random.Random(1))
+        assert benchmark.percentile([5, 1, 4, 2, 3], 95) == 5
+        assert benchmark.percentile([5, 1, 4, 2, 3], 50) == 3
+    
+    def test_run_and_compare(self):
+        """Ölçüm satırları ve baseline karşılaştırması"""
+        results = benchmark.run_benchmarks(['quick_sort', 'bubble_sort'], sizes=[50],
+                                           distributions=['random', 'sorted'], repeat=3)
+        assert len(results) == 4
+        row = results[0]
+        assert row['min_ns'] <= row['median_ns'] <= row['p95_ns']
+        assert row['peak_bytes'] > 0
+        
+        slower = [dict(row, median_ns=row['median_ns'] * 2) for row in results]
+        comparison = benchmark.compare_results(results, slower, threshold=0.5)
+        assert len(comparison) == 4
+        assert all(row['regression'] for row in comparison)
+        assert not any(row['regression'] for row in benchmark.compare_results(slower, results))
+        
+        with pytest.raises(ValueError):
+            benchmark.run_benchmarks(['no_such_sort'], sizes=[10])
+    
+    def test_cli_baseline(self, tmp_path):
+        """JSON yazmalı; baseline'a göre yavaşlamada 1 döndürmeli"""
+        output = tmp_path / "results.json"
+        args = ['--sorts', 'tim_sort', '--distributions', 'sorted', '--min-power', '2',
+                '--max-power', '2', '--repeat', '2', '--no-memory']
+        assert benchmark.main(args + ['--output', str(output)]) == 0
+        report = benchmark.load_report(output)
+        assert report['meta']['repeat'] == 2 and len(report['results']) == 1
+        
+        for row in report['results']:
+            row['median_ns'] = 1
+        benchmark.save_report(report, output)
+        assert benchmark.main(args + ['--baseline', str(output)]) == 1
+    
+    def test_cli_nothing_compared(self, tmp_path, capsys):
+        """Sayı metriği --count-ops'suz veya eşleşen ölçüm yoksa 2 ile çıkmalı"""
+        output = tmp_path / "results.json"
+        args = ['--sorts', 'tim_sort', '--distributions', 'sorted', '--min-power', '2',
+                '--max-power', '2', '--repeat', '1', '--no-memory']
+        assert benchmark.main(args + ['--output', str(output)]) == 0
+        
+        with pytest.raises(SystemExit) as error:
+            benchmark.main(args + ['--baseline', str(output), '--metric', 'comparisons'])
+        assert error.value.code == 2
+        assert "--count-ops" in capsys.readouterr().err
+        
+        # Baseline'da işlem sayıları yok: karşılaştırılacak satır kalmaz
+        assert benchmark.main(args + ['--count-ops', '--baseline', str(output),
+                                      '--metric', 'comparisons']) == 2
+        assert "karşılaştırılabilen ölçüm yok" in capsys.readouterr().err
+
+
+class TestInstrumentation:
+    """instrumentation.count_operations testleri"""
+    
+    def test_results_unchanged(self):
+        """Sayaçlı çalıştırma aynı sonucu vermeli, girdi değişmemeli"""
+        records = [("Ali", 3), ("Ayşe", 1), ("Can", 3), ("Ece", 2)]
+        for sort_func in ALL_SORTS:
+            for arr in sample_inputs()[:4]:
+                original = list(arr)
+                result, counts = count_operations(sort_func, arr)
+                assert result == sorted(original)
+                assert arr == original
+            result, _ = count_operations(sort_func, records, key=lambda r: r[1], reverse=True)
+            assert result == sorted(records, key=lambda r: r[1], reverse=True)
+    
+    def test_exact_comparisons(self):
+        """Sıralı girdide insertion sort n - 1 karşılaştırma, 0 kaydırma yapar"""
+        n = 200
+        _, counts = count_operations(insertion_sort, list(range(n)))
+        assert counts.comparisons == n - 1
+        _, counts = count_operations(insertion_sort, list(range(n, 0, -1)))
+        assert counts.comparisons == n * (n - 1) // 2
+        # Eşit key'lerde sıra no karşılaştırması da tek karşılaştırmadır
+        _, counts = count_operations(insertion_sort, [1] * n, key=lambda x: x)
+        assert counts.comparisons == n - 1
+    
+    def test_pinned_counts(self):
+        """Sabit girdide sayılar elle hesaplanan değerlerle aynı olmalı"""
+        data = [5, 2, 9, 1, 7, 3, 8, 6, 4, 0]  # 26 ters çift
+        _, counts = count_operations(insertion_sort, data)
+        # 26 kaydırma + 9 yerleştirme; yeni minimumlarda (3 kez) döngü j < 0 ile biter
+        assert (counts.comparisons, counts.moves) == (32, 35)
+        assert (counts.calls, counts.max_depth, counts.allocations) == (1, 1, 1)
+        
+        _, counts = count_operations(bubble_sort, data)
+        # Her takas iki yazma; son geçişe kadar takas olduğu için erken çıkış yok
+        assert (counts.comparisons, counts.moves) == (45, 52)
+        
+        _, counts = count_operations(merge_sort, data)
+        assert (counts.allocations, counts.max_depth) == (2, 2)  # kopya + buffer
+    
+    def test_decode_extended_arg(self):
+        """EXTENDED_ARG önekli atamalar önekin offset'inden de çözülmeli"""
+        source = "def f():\n" + "".join(f"    v{i} = {i}\n" for i in range(300))
+        namespace = {}
+        exec(source + "    result = []\n    return result\n", namespace)
+        actions = _decode_actions(namespace['f'].__code__)
+        # result 301. yerel değişken: STORE_FAST EXTENDED_ARG ile başlar
+        offsets = [offset for offset, action in actions.items() if action[2] == ('result',)]
+        assert len(offsets) == 2
+        assert actions[min(offsets)] == actions[max(offsets)] == \
+            (max(offsets), 'store', ('result',))
+    
+    def test_counts(self):
+        """Hareket, derinlik ve tahsis sayıları"""
+        rng = random.Random(3)
+        data = [rng.randint(0, 10 ** 6) for _ in range(300)]
+        _, merge_counts = count_operations(merge_sort, data)
+        assert merge_counts.moves > 0
+        assert merge_counts.allocations >= 2  # kopya + yardımcı buffer
+        assert merge_counts.bytes_copied >= merge_counts.moves * 8 // 2
+        
+        _, quick_counts = count_operations(quick_sort, data)
+        assert 1 <= quick_counts.max_depth <= 5
+        assert quick_counts.comparisons < len(data) ** 2 / 4
+        
+        _, radix_counts = count_operations(radix_sort, data)
+        assert radix_counts.comparisons is None and radix_counts.moves > 0
+        assert set(radix_counts.to_dict()) == set(benchmark.COUNT_METRICS)
+    
+    def test_benchmark_rows(self):
+        """--count-ops satırlara sayıları eklemeli ve karşılaştırılabilmeli"""
+        results = benchmark.run_benchmarks(['insertion_sort', 'radix_sort'], sizes=[50],
+                                           distributions=['sorted'], repeat=1,
+                                           memory=False, count_ops=True)
+        assert results[0]['comparisons'] == 49
+        assert results[1]['comparisons'] is None
+        comparison = benchmark.compare_results(results, results, metric='comparisons')
+        assert len(comparison) == 1 and not comparison[0]['regression']